@@ -28,12 +28,36 @@ from mods_base import build_mod, hook, get_pc
 from mods_base.options import ButtonOption, GroupedOption, BoolOption, SpinnerOption
 from mods_base.keybinds import keybind
 from unrealsdk.hooks import Type
-from unrealsdk.unreal import UObject, WrappedStruct, BoundFunction
-from typing import Any
+from unrealsdk.unreal import UObject, WrappedStruct, WrappedArray, BoundFunction
+from typing import Any, Iterator
 import os
 import json
+import time
+import sys
+import atexit
+import threading
+import queue
+import collections
+import contextlib
+import copy
+import gzip
+import re
+import hashlib
+import struct
+from array import array
+from operator import attrgetter
 from datetime import datetime
 
+try:
+    import sqlite3
+except ImportError:  # Not every embedded Python ships it; the item cache is skipped
+    sqlite3 = None
+
+try:
+    import numpy
+except ImportError:  # Optional; without it every sort uses the key function
+    numpy = None
+
 __version__: str = "0.7.2"
 # Parse version info from version string to keep them in sync
 __version_info__: tuple[int, ...] = tuple(int(x) for x in __version__.split('.'))
@@ -45,6 +69,19 @@ OUTPUT_FILE = "bank_structure_dump.txt"
 JSON_FILE = "bank_structure_dump.json"
 SUMMARY_FILE = "mod_data_summary.txt"
 
+# Research output formats -> record file (None = the text dump plus one JSON object)
+DUMP_FORMATS = {
+    "Text + JSON": None,
+    "NDJSON": "bank_structure_dump.ndjson",
+    "NDJSON (gzip)": "bank_structure_dump.ndjson.gz",
+    "Binary": "bank_structure_dump.bin",
+}
+# Content-hash index of the last dump, compared against by differential dumps
+DIFF_INDEX_FILE = "dump_index.json"
+
+# Binary dumps start with this magic; each record is a 4-byte little-endian length + UTF-8 JSON
+BINARY_DUMP_MAGIC = b"BRDUMP1\n"
+
 # Possible class names for bank/inventory objects in Borderlands 3
 # The actual class name may vary by game version, so we try multiple options
 # Expanded based on bl3data research patterns
@@ -80,51 +117,228 @@ MOD_RELATED_CLASSES = [
 # ==================== DEBUG SETTINGS ====================
 
 DEBUG_ENABLED = False  # Will be controlled by options
+PERF_ENABLED = False  # Per-stage timers and counters, also controlled by options
+DUMP_FORMAT = "Text + JSON"  # Research output format, one of DUMP_FORMATS
+DIFF_DUMP_ENABLED = False  # Only write what changed since the last dump
+CURRENT_SCAN_PROFILE = "Full"  # Scope of research runs, one of SCAN_PROFILES
+
+# ==================== KEYWORD CLASSIFIER ====================
+
+# Categories of scan_for_mod_data(), by attribute name keyword
+MOD_SCAN_KEYWORDS = {
+    "inventory_related": ['inventory', 'invslot', 'invitem'],
+    "bank_related": ['bank', 'storage', 'vault', 'stash'],
+    "item_related": ['item', 'weapon', 'gear', 'equipment'],
+    "balance_related": ['balance', 'part', 'generic'],
+    "serial_related": ['serial', 'guid', 'id', 'uuid']
+}
+
+# Attribute name keywords that make the walker dig into a value
+DUMP_FOLLOW_KEYWORDS = ['inventory', 'bank', 'item', 'equipment']
+
+# Attribute filters of the research dump sections
+DUMP_KEYWORDS = {
+    "follow": DUMP_FOLLOW_KEYWORDS,
+    "important": ['bank', 'inventory', 'item', 'equipment', 'storage'],
+    "bank": ['bank', 'storage', 'vault'],
+    "inventory": ['inventory', 'item', 'equipment'],
+    "pawn": ['inventory', 'item', 'equipment', 'bank'],
+    "serial": ['serial', 'guid', 'itemid', 'inventoryid'],
+}
+
+class KeywordClassifier:
+    """
+    Sorts attribute names into keyword categories in a single pass.
+
+    Every keyword of every category is compiled into one case-insensitive
+    regex, scanned with a lookahead so overlapping keywords are all found
+    ("invitem" also contains "item"). At each position the regex reports the
+    longest keyword, so each keyword carries the categories of every keyword
+    it contains. Results are memoized per name - the same few hundred names
+    come back for every class and every run.
+    """
+
+    def __init__(self, categories: dict) -> None:
+        keyword_categories = collections.defaultdict(set)
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                keyword_categories[keyword.lower()].add(category)
+
+        # Categories matched by a keyword: its own plus those of any keyword inside it
+        self.implied = {
+            keyword: frozenset().union(*(cats for other, cats in keyword_categories.items() if other in keyword))
+            for keyword in keyword_categories
+        }
+        alternatives = "|".join(re.escape(k) for k in sorted(keyword_categories, key=len, reverse=True))
+        self.pattern = re.compile(f"(?=({alternatives}))", re.IGNORECASE)
+        self.cache = {}
+
+    def classify(self, name: str) -> frozenset:
+        """Get every category whose keywords occur in a name"""
+        categories = self.cache.get(name)
+        if categories is None:
+            implied = self.implied
+            categories = frozenset().union(*(implied[m.lower()] for m in self.pattern.findall(name)))
+            self.cache[name] = categories
+        return categories
+
+    def matches(self, name: str, category: str) -> bool:
+        """Check whether a name contains any keyword of a category"""
+        return category in self.classify(name)
+
+# Every attribute filter of the mod, compiled once
+ATTR_CLASSIFIER = KeywordClassifier({**MOD_SCAN_KEYWORDS, **{f"dump_{k}": v for k, v in DUMP_KEYWORDS.items()}})
 
 # ==================== UTILITY FUNCTIONS ====================
 
-def debug_log(message: str, level: str = "INFO") -> None:
+DEBUG_LOG_FILE = "debug.log"
+DEBUG_LOG_MAX_BYTES = 5 * 1024 * 1024  # Rotate to debug.log.1 past this size
+DEBUG_LOG_BUFFER_LINES = 10000  # Oldest lines are dropped if the flusher falls behind
+DEBUG_LOG_FLUSH_INTERVAL = 0.5  # Seconds between background flushes
+
+class LogWriter:
+    """
+    Buffered, background writer for debug.log.
+
+    debug_log() only appends to an in-memory ring buffer. A daemon thread
+    drains the buffer every DEBUG_LOG_FLUSH_INTERVAL seconds through one
+    long-lived file handle, rotating the file once it grows past
+    DEBUG_LOG_MAX_BYTES. The thread never touches the SDK; write errors are
+    reported back on the game thread by the next write().
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEBUG_LOG_MAX_BYTES,
+                 buffer_lines: int = DEBUG_LOG_BUFFER_LINES,
+                 flush_interval: float = DEBUG_LOG_FLUSH_INTERVAL) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.flush_interval = flush_interval
+        self.buffer = collections.deque(maxlen=buffer_lines)
+        self.lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.wake = threading.Event()
+        self.thread = None
+        self.file = None
+        self.dropped = 0
+        self.error = None
+        self.stopping = False
+
+    def write(self, line: str) -> None:
+        """Queue one line for the background flusher"""
+        if self.error is not None:
+            error, self.error = self.error, None
+            logging.error(f"[{MOD_NAME}] Failed to write to debug log: {error}")
+        with self.lock:
+            if len(self.buffer) == self.buffer.maxlen:
+                self.dropped += 1
+            self.buffer.append(line)
+        if self.thread is None:
+            self.start()
+
+    def start(self) -> None:
+        """Start the background flusher thread"""
+        self.stopping = False
+        self.thread = threading.Thread(target=self.run, name=f"{MOD_NAME}-log", daemon=True)
+        self.thread.start()
+
+    def run(self) -> None:
+        """Flusher thread body"""
+        while not self.stopping:
+            self.wake.wait(self.flush_interval)
+            self.wake.clear()
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered lines to disk"""
+        with self.lock:
+            if not self.buffer:
+                return
+            lines = list(self.buffer)
+            self.buffer.clear()
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            lines.insert(0, f"[{MOD_NAME}] [WARNING] {dropped} debug log lines dropped (buffer full)")
+        with self.write_lock:
+            try:
+                if self.file is None:
+                    os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                    self.file = open(self.path, 'a', encoding='utf-8')
+                self.file.write('\n'.join(lines) + '\n')
+                self.file.flush()
+                if self.file.tell() >= self.max_bytes:
+                    self.rotate()
+            except Exception as e:
+                self.error = e
+
+    def rotate(self) -> None:
+        """Move the current log to <name>.1 and start a fresh file"""
+        self.file.close()
+        self.file = None
+        os.replace(self.path, self.path + ".1")
+
+    def close(self) -> None:
+        """Stop the flusher thread, write everything left and close the file"""
+        if self.thread is not None:
+            self.stopping = True
+            self.wake.set()
+            self.thread.join(timeout=2.0)
+            self.thread = None
+        self.flush()
+        with self.write_lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+DEBUG_LOG_WRITER = None  # Created on first use, see get_log_writer()
+
+def get_log_writer() -> LogWriter:
+    """Get the shared debug.log writer"""
+    global DEBUG_LOG_WRITER
+    if DEBUG_LOG_WRITER is None:
+        DEBUG_LOG_WRITER = LogWriter(os.path.join(get_mod_directory(), DEBUG_LOG_FILE))
+        atexit.register(DEBUG_LOG_WRITER.close)
+    return DEBUG_LOG_WRITER
+
+def debug_log(message: str, level: str = "INFO", *args: Any) -> None:
     """
     Debug logging function using SDK logging for console output.
     Uses logging.info() for INFO, logging.warning() for WARNING,
     logging.error() for ERROR, and logging.dev_warning() for DEBUG.
-    Also logs to file when debug mode is enabled.
+    Also logs to file (through the background LogWriter) when debug mode is enabled.
+    
+    Hot paths should pass values as args instead of using an f-string:
+    the message is only %-formatted when the level is actually enabled.
     
     Args:
-        message: The message to log
+        message: The message to log, optionally with %-style placeholders
         level: Log level (INFO, DEBUG, WARNING, ERROR)
+        *args: Values for the placeholders in message
     """
-    global DEBUG_ENABLED
-    
     # Early return for non-critical messages when debug is off (performance optimization)
-    if not DEBUG_ENABLED and level not in ["ERROR", "WARNING"]:
+    if not DEBUG_ENABLED and level not in ("ERROR", "WARNING"):
         return
     
+    if args:
+        try:
+            message = message % args
+        except (TypeError, ValueError):
+            message = f"{message} {args}"
+    
     timestamp = datetime.now().strftime('%H:%M:%S.%f')[:-3]
     formatted_msg = f"[{timestamp}] [{MOD_NAME}] [{level}] {message}"
     
     # Use SDK logging for console output (visible in game)
-    if level in ["ERROR", "WARNING"] or DEBUG_ENABLED:
-        if level == "ERROR":
-            logging.error(formatted_msg)
-        elif level == "WARNING":
-            logging.warning(formatted_msg)
-        elif level == "DEBUG":
-            logging.dev_warning(formatted_msg)
-        else:  # INFO
-            logging.info(formatted_msg)
+    if level == "ERROR":
+        logging.error(formatted_msg)
+    elif level == "WARNING":
+        logging.warning(formatted_msg)
+    elif level == "DEBUG":
+        logging.dev_warning(formatted_msg)
+    else:  # INFO
+        logging.info(formatted_msg)
     
-    # Log to file if debug enabled or if it's an error/warning
-    if DEBUG_ENABLED or level in ["ERROR", "WARNING"]:
-        try:
-            mod_dir = get_mod_directory()
-            # Ensure directory exists
-            os.makedirs(mod_dir, exist_ok=True)
-            log_file = os.path.join(mod_dir, "debug.log")
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(formatted_msg + '\n')
-        except Exception as e:
-            logging.error(f"[{MOD_NAME}] Failed to write to debug log: {e}")
+    # Queue for debug.log - the background writer does the file I/O
+    get_log_writer().write(formatted_msg)
 
 def get_mod_directory() -> str:
     """Get the mod directory path"""
@@ -135,6 +349,7 @@ def safe_str(obj: Any) -> str:
     try:
         return str(obj)
     except Exception as e:
+        perf_count("safe_str errors")
         return f"<Error converting to string: {e}>"
 
 def safe_repr(obj: Any) -> str:
@@ -149,21 +364,100 @@ def safe_type(obj: Any) -> str:
     try: 
         return str(type(obj))
     except Exception as e:
+        perf_count("safe_type errors")
         return f"<Error getting type: {e}>"
 
-def scan_for_mod_data(obj: Any, name: str) -> dict:
+# Value previews in the research dump
+PREVIEW_CHARS = 100     # Characters per attribute preview
+PREVIEW_ELEMENTS = 3    # Array elements shown per preview
+
+def preview_leaf(value: Any) -> str:
+    """Render a value inside a struct/array preview, without descending into it"""
+    if value is None or isinstance(value, (bool, int, float)):
+        return str(value)
+    if isinstance(value, str):
+        return repr(value)
+    if isinstance(value, WrappedArray):
+        try:
+            return f"[{len(value)} items]"
+        except Exception:
+            return "[...]"
+    if isinstance(value, WrappedStruct):
+        return "{...}"
+    if isinstance(value, UObject):
+        return safe_str(value)
+    return f"<{type(value).__name__}>"
+
+def preview_struct(struct: Any, limit: int) -> str:
+    """Render a struct's fields one level deep, stopping once limit characters are used"""
+    try:
+        fields = [name for name in dir(struct) if not name.startswith('_')]
+    except Exception as e:
+        return f"<Error previewing struct: {e}>"
+    parts = []
+    used = 2
+    for field in fields:
+        if used >= limit:
+            parts.append("...")
+            break
+        try:
+            text = f"{field}: {preview_leaf(getattr(struct, field))}"
+        except Exception as e:
+            text = f"{field}: <Error: {e}>"
+        parts.append(text)
+        used += len(text) + 2
+    return "{" + ", ".join(parts) + "}"
+
+def preview_array(array: Any, limit: int) -> str:
+    """Render an array's length and first PREVIEW_ELEMENTS elements, stopping once limit characters are used"""
+    try:
+        count = len(array)
+    except Exception as e:
+        return f"<Error previewing array: {e}>"
+    header = f"[{count} items"
+    if not count:
+        return header + "]"
+    parts = []
+    used = len(header) + 2
+    for i in range(min(count, PREVIEW_ELEMENTS)):
+        if used >= limit:
+            break
+        try:
+            element = array[i]
+            text = preview_struct(element, limit - used) if isinstance(element, WrappedStruct) else preview_leaf(element)
+        except Exception as e:
+            text = f"<Error: {e}>"
+        parts.append(text)
+        used += len(text) + 2
+    more = ", ..." if len(parts) < count else ""
+    return f"{header}: {', '.join(parts)}{more}]"
+
+def preview_value(value: Any, limit: int = PREVIEW_CHARS) -> str:
     """
-    Scan an object for mod-relevant data.
-    Inspired by bl3data's comprehensive data extraction approach.
-    
+    Get a bounded, readable preview of a value for the research dump.
+
+    Unlike safe_str(value)[:limit], arrays and structs are never converted
+    whole: arrays show their length and first few elements, structs their
+    fields one level deep, and rendering stops once the budget is used.
+
     Args:
-        obj: The object to scan
-        name: Name/identifier for the object
-        
+        value: The value to preview
+        limit: Maximum length of the preview
+
     Returns:
-        Dictionary with categorized findings
+        The preview, at most limit characters long
     """
-    findings = {
+    if isinstance(value, WrappedArray):
+        text = preview_array(value, limit)
+    elif isinstance(value, WrappedStruct):
+        text = preview_struct(value, limit)
+    else:
+        text = safe_str(value)
+    return text[:limit]
+
+def new_mod_findings(obj: Any, name: str) -> dict:
+    """Create an empty findings dictionary for scan_for_mod_data()"""
+    return {
         "name": name,
         "type": safe_type(obj),
         "inventory_related": [],
@@ -174,16 +468,19 @@ def scan_for_mod_data(obj: Any, name: str) -> dict:
         "methods": [],
         "properties": []
     }
+
+def iter_scan_for_mod_data(obj: Any, findings: dict) -> Iterator[None]:
+    """
+    Scan an object for mod-relevant data, one attribute per step.
+    Lets a time-sliced research job pause between attributes.
     
-    # Define category keywords mapping (optimized single-pass categorization)
-    category_keywords = {
-        "inventory_related": ['inventory', 'invslot', 'invitem'],
-        "bank_related": ['bank', 'storage', 'vault', 'stash'],
-        "item_related": ['item', 'weapon', 'gear', 'equipment'],
-        "balance_related": ['balance', 'part', 'generic'],
-        "serial_related": ['serial', 'guid', 'id', 'uuid']
-    }
-    
+    Args:
+        obj: The object to scan
+        findings: Dictionary from new_mod_findings(), filled in as the scan runs
+        
+    Yields:
+        None after each attribute
+    """
     try:
         attrs = dir(obj)
         
@@ -194,13 +491,14 @@ def scan_for_mod_data(obj: Any, name: str) -> dict:
                 
             try:
                 value = getattr(obj, attr, None)
+                perf_count("getattr")
                 is_callable = callable(value)
                 value_type = safe_type(value)
-                attr_lower = attr.lower()
+                categories = ATTR_CLASSIFIER.classify(attr)
                 
-                # Single-pass categorization using the mapping
-                for category, keywords in category_keywords.items():
-                    if any(kw in attr_lower for kw in keywords):
+                # Single-pass categorization using the compiled classifier
+                for category in MOD_SCAN_KEYWORDS:
+                    if category in categories:
                         findings[category].append({
                             "name": attr,
                             "type": value_type,
@@ -214,620 +512,3531 @@ def scan_for_mod_data(obj: Any, name: str) -> dict:
                     findings["properties"].append(attr)
                     
             except Exception as e:
-                debug_log(f"Error scanning attribute {attr}: {e}", "DEBUG")
+                debug_log("Error scanning attribute %s: %s", "DEBUG", attr, e)
+            yield
                 
     except Exception as e:
-        debug_log(f"Error scanning object {name}: {e}", "ERROR")
+        debug_log(f"Error scanning object {findings['name']}: {e}", "ERROR")
+
+def scan_for_mod_data(obj: Any, name: str) -> dict:
+    """
+    Scan an object for mod-relevant data.
+    Inspired by bl3data's comprehensive data extraction approach.
     
+    Args:
+        obj: The object to scan
+        name: Name/identifier for the object
+        
+    Returns:
+        Dictionary with categorized findings
+    """
+    findings = new_mod_findings(obj, name)
+    for _ in iter_scan_for_mod_data(obj, findings):
+        pass
     return findings
 
-# ==================== DUMP FUNCTIONS ====================
+# ==================== INSTRUMENTATION ====================
 
-def dump_object_recursive(obj: Any, name: str, depth: int = 0, max_depth: int = 3) -> list:
-    """Recursively dump object structure"""
-    debug_log(f"dump_object_recursive called: name={name}, depth={depth}, max_depth={max_depth}", "DEBUG")
-    
-    lines = []
-    indent = "  " * depth
-    
-    if depth > max_depth:
-        lines.append(f"{indent}[Max depth reached]")
-        debug_log(f"Max depth reached for {name}", "DEBUG")
+PERF_REPORT_FILE = "perf_report.txt"  # Written next to debug.log
+
+# No-op context manager handed out when instrumentation is off
+NULL_STAGE = contextlib.nullcontext()
+
+class PerfRun:
+    """
+    Timers and counters for one sort or research run.
+
+    Stages accumulate wall time (and how many times they ran), counters are
+    plain integers. Only the run in PERF_RUN collects anything; when
+    instrumentation is off there is no run, and perf_stage()/perf_count()
+    return straight away.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.timers = {}    # stage -> [calls, total seconds, max seconds]
+        self.counters = {}  # counter -> value
+        self.started_at = time.perf_counter()
+        self.started = datetime.now()
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a block of code as one call of a stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Add one measured call to a stage"""
+        timer = self.timers.get(name)
+        if timer is None:
+            self.timers[name] = [1, seconds, seconds]
+        else:
+            timer[0] += 1
+            timer[1] += seconds
+            if seconds > timer[2]:
+                timer[2] = seconds
+
+    def report(self) -> list:
+        """Format the run as report lines"""
+        total = time.perf_counter() - self.started_at
+        lines = [f"[{self.started.strftime('%Y-%m-%d %H:%M:%S')}] {self.name}: {total * 1000:.2f} ms total"]
+        for name, (calls, seconds, longest) in self.timers.items():
+            lines.append(f"  {name:<20} {seconds * 1000:>10.2f} ms  calls={calls}  max={longest * 1000:.2f} ms")
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"  {name:<20} {value:>10}")
         return lines
-    
-    # Basic info
-    lines.append(f"{indent}{'='*60}")
-    lines.append(f"{indent}Name: {name}")
-    lines.append(f"{indent}Type: {safe_type(obj)}")
-    lines.append(f"{indent}Value: {safe_str(obj)}")
-    lines.append(f"{indent}{'='*60}")
-    
-    # Try to get attributes
-    try: 
-        attrs = dir(obj)
-        lines.append(f"{indent}Attributes ({len(attrs)}):")
-        
-        for attr in attrs:
-            # Skip private/magic attributes for now
-            if attr.startswith('_'):
-                continue
-                
-            try:
-                value = getattr(obj, attr, '<No Value>')
-                value_type = safe_type(value)
-                value_str = safe_str(value)[:100]  # Truncate long strings
-                
-                lines.append(f"{indent}  - {attr}:  {value_type} = {value_str}")
-                
-                # If it's related to inventory/bank, dig deeper
-                if any(keyword in attr.lower() for keyword in ['inventory', 'bank', 'item', 'equipment']):
-                    lines.append(f"{indent}    ↳ [IMPORTANT] Digging deeper...")
-                    if depth < max_depth and not callable(value):
-                        sub_lines = dump_object_recursive(value, attr, depth + 1, max_depth)
-                        lines.extend(sub_lines)
-                        
-            except Exception as e: 
-                lines.append(f"{indent}  - {attr}: <Error: {e}>")
+
+    def save(self) -> None:
+        """Append the run to the report file and echo it to the debug log"""
+        lines = self.report()
+        try:
+            with open(os.path.join(get_mod_directory(), PERF_REPORT_FILE), 'a', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n\n")
+        except Exception as e:
+            debug_log(f"Error writing {PERF_REPORT_FILE}: {e}", "WARNING")
+        for line in lines:
+            debug_log(line, "INFO")
+
+PERF_RUN = None  # The PerfRun currently collecting, if any
+
+def start_perf_run(name: str) -> "PerfRun | None":
+    """Start collecting a run if instrumentation is enabled, making it the current run"""
+    global PERF_RUN
+    if not PERF_ENABLED:
+        return None
+    PERF_RUN = PerfRun(name)
+    return PERF_RUN
+
+def finish_perf_run(run: "PerfRun | None") -> None:
+    """Stop collecting a run and write its report"""
+    global PERF_RUN
+    if run is None:
+        return
+    if PERF_RUN is run:
+        PERF_RUN = None
+    run.save()
+
+@contextlib.contextmanager
+def use_perf_run(run: "PerfRun | None") -> Iterator[None]:
+    """Make a run current for a block of code, e.g. one tick of a long job"""
+    global PERF_RUN
+    previous = PERF_RUN
+    PERF_RUN = run
+    try:
+        yield
+    finally:
+        PERF_RUN = previous
+
+def perf_stage(name: str) -> Any:
+    """Context manager timing a stage of the current run (a no-op if there is none)"""
+    run = PERF_RUN
+    if run is None:
+        return NULL_STAGE
+    return run.stage(name)
+
+def perf_count(name: str, amount: int = 1) -> None:
+    """Add to a counter of the current run (a no-op if there is none)"""
+    run = PERF_RUN
+    if run is not None:
+        run.counters[name] = run.counters.get(name, 0) + amount
+
+# ==================== REFLECTION SCHEMA CACHE ====================
+
+SCHEMA_CACHE_FILE = "schema_cache.json"
+SCHEMA_CACHE_VERSION = 2  # 2: item fields holding definition objects now resolve
+
+def get_game_build() -> str:
+    """
+    Get an identifier for the running game build, used to key the schema cache.
+    Falls back to "unknown" if the engine can't be asked.
+    """
+    try:
+        kismet = unrealsdk.find_object("KismetSystemLibrary", "/Script/Engine.Default__KismetSystemLibrary")
+        return str(kismet.GetEngineVersion())
     except Exception as e:
-        lines.append(f"{indent}Error getting attributes: {e}")
-    
-    return lines
+        debug_log("Could not read engine version: %s", "DEBUG", e)
+        return "unknown"
 
-def dump_player_controller() -> dict:
-    """Dump PlayerController structure focusing on Bank/Inventory"""
-    debug_log("Starting dump_player_controller", "INFO")
-    
-    result = {
-        "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-        "success": False,
-        "error":  None,
-        "pc_found": False,
-        "pc_attributes": [],
-        "bank_related": {},
-        "inventory_related": {},
-        "all_text": []
-    }
-    
-    lines = []
-    lines.append("="*80)
-    lines.append(f"BANK RESEARCH - Structure Dump")
-    lines.append(f"Timestamp: {result['timestamp']}")
-    lines.append("="*80)
-    lines.append("")
+def get_class_name(class_key: Any) -> str:
+    """Get a stable, session-independent name for a class key"""
+    for attr_name in ("Name", "__name__"):
+        try:
+            name = getattr(class_key, attr_name)
+            if name:
+                return str(name)
+        except Exception:
+            continue
+    return safe_str(class_key)
+
+class SchemaCache:
+    """
+    Versioned on-disk cache of discovered class layouts.
+
+    Stored as {"version": N, "builds": {build: {class_name: entry}}}, where an
+    entry may hold:
+        items_attr: the attribute holding a container's items list
+        fields:     item field -> attribute name (or None if the class has none)
+
+    Entries are trusted at startup and only re-probed (one at a time) when a
+    cached path stops resolving. The file is rewritten only when something changed.
+    """
+
+    def __init__(self, file_name: str) -> None:
+        self.file_name = file_name
+        self.path = None
+        self.build = None
+        self.builds = {}
+        self.dirty = False
+        self.loaded = False
+
+    def load(self) -> None:
+        """Read the cache file, discarding it if the format version changed"""
+        self.loaded = True
+        self.path = os.path.join(get_mod_directory(), self.file_name)
+        self.build = get_game_build()
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == SCHEMA_CACHE_VERSION:
+                self.builds = data.get("builds", {})
+            else:
+                debug_log("Schema cache version %s is outdated, ignoring it", "INFO", data.get("version"))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            debug_log(f"Error loading schema cache: {e}", "WARNING")
+        debug_log("Schema cache loaded for build %s: %s classes", "DEBUG", self.build, len(self.classes()))
+
+    def save(self) -> None:
+        """Write the cache file if anything changed since the last save"""
+        if not self.dirty or self.path is None:
+            return
+        try:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": SCHEMA_CACHE_VERSION, "builds": self.builds}, f, indent=2)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+            debug_log("Schema cache saved: %s", "DEBUG", self.path)
+        except Exception as e:
+            debug_log(f"Error saving schema cache: {e}", "WARNING")
+
+    def classes(self) -> dict:
+        """Get the class entries for the running build"""
+        if not self.loaded:
+            self.load()
+        return self.builds.setdefault(self.build, {})
+
+    def get(self, class_name: str, key: str, default: Any = None) -> Any:
+        """Get one cached fact about a class"""
+        return self.classes().get(class_name, {}).get(key, default)
+
+    def set(self, class_name: str, key: str, value: Any) -> None:
+        """Record one fact about a class"""
+        entry = self.classes().setdefault(class_name, {})
+        if entry.get(key, self) != value:
+            entry[key] = value
+            self.dirty = True
+
+    def forget(self, class_name: str, key: str) -> None:
+        """Drop one fact that stopped resolving, so it gets re-probed"""
+        entry = self.classes().get(class_name)
+        if entry is not None and key in entry:
+            del entry[key]
+            self.dirty = True
+            debug_log("Schema cache entry %s.%s is stale, re-probing", "DEBUG", class_name, key)
+
+SCHEMA_CACHE = SchemaCache(SCHEMA_CACHE_FILE)
+
+def get_attr_path(obj: Any, path: str, default: Any = None) -> Any:
+    """
+    Follow a dotted attribute path, e.g. "InventoryList.Items".
+
+    Returns:
+        The value at the end of the path, or default if any step is missing
+    """
+    for attr_name in path.split('.'):
+        obj = getattr(obj, attr_name, None)
+        if obj is None:
+            return default
+    return obj
+
+def set_attr_path(obj: Any, path: str, value: Any) -> None:
+    """Assign the attribute at the end of a dotted path"""
+    parent_path, _, attr_name = path.rpartition('.')
+    if parent_path:
+        obj = get_attr_path(obj, parent_path)
+    setattr(obj, attr_name, value)
+
+def resolve_items_attr(container: Any, class_name: str, attr_names: list) -> tuple:
+    """
+    Find the attribute holding a container's items list, using the schema cache.
+
+    Args:
+        container: The bank/storage object
+        class_name: Its class name (the cache key)
+        attr_names: Candidate attribute names or dotted paths, in priority order
+
+    Returns:
+        (attr_name, items_list), or (None, None) if no candidate holds a list
+    """
+    cached = SCHEMA_CACHE.get(class_name, "items_attr")
+    if cached is not None:
+        items_list = get_attr_path(container, cached)
+        if items_list is not None:
+            return cached, items_list
+        SCHEMA_CACHE.forget(class_name, "items_attr")
     
+    for attr_name in attr_names:
+        try:
+            items_list = get_attr_path(container, attr_name)
+            if items_list is not None:
+                SCHEMA_CACHE.set(class_name, "items_attr", attr_name)
+                return attr_name, items_list
+        except Exception as e:
+            debug_log("Error accessing %s: %s", "DEBUG", attr_name, e)
+            continue
+    return None, None
+
+# ==================== OBJECT INDEX ====================
+
+# Bank container classes, in priority order
+BANK_CONTAINER_NAMES = ["OakBank", "BankInventory", "OakStorageComponent"]
+
+# Pawn attributes that point straight at the local player's bank
+PAWN_BANK_ATTRS = ["BankInventoryList", "OakCharacterBankInventory"]
+
+class StorageSpec:
+    """
+    Where to find one kind of item storage for the local player.
+
+    Args:
+        name: Display name, also the key in STORAGE_SPECS
+        pawn_attrs: Pawn attributes that point straight at the storage
+        class_names: Storage classes to search, in priority order
+        owned_only: Only accept class instances owned by the local player or
+                    their pawn (otherwise the first instance is the fallback)
+    """
+
+    __slots__ = ("name", "pawn_attrs", "class_names", "owned_only")
+
+    def __init__(self, name: str, pawn_attrs: list, class_names: list, owned_only: bool = True) -> None:
+        self.name = name
+        self.pawn_attrs = pawn_attrs
+        self.class_names = class_names
+        self.owned_only = owned_only
+
+# Storages the sort can work on, in the order they are resolved and reordered
+STORAGE_SPECS = {
+    "Bank": StorageSpec("Bank", PAWN_BANK_ATTRS, BANK_CONTAINER_NAMES, owned_only=False),
+    "Backpack": StorageSpec("Backpack", ["OakCharacterInventory"], ["OakInventoryComponent"]),
+    "Lost Loot": StorageSpec("Lost Loot", [], ["OakLostLootMachine"]),
+}
+
+def is_default_object(obj: Any) -> bool:
+    """Check whether an object is a class default object (Default__...)"""
     try:
-        # Get PlayerController
-        debug_log("Attempting to get PlayerController", "DEBUG")
-        pc = get_pc()
-        
-        if not pc: 
-            lines.append("❌ ERROR: PlayerController not found!")
-            lines.append("This usually means you're not in-game yet.")
-            result["error"] = "PlayerController not found"
-            result["all_text"] = lines
-            debug_log("PlayerController not found", "WARNING")
-            return result
-        
-        debug_log(f"PlayerController found: {safe_type(pc)}", "INFO")
-        result["pc_found"] = True
-        lines.append("✅ PlayerController found!")
-        lines.append(f"Type: {safe_type(pc)}")
-        lines.append(f"Value: {safe_str(pc)}")
-        lines.append("")
-        
-        # Get all attributes
-        debug_log("Getting PlayerController attributes", "DEBUG")
-        lines.append("="*80)
-        lines.append("ALL PLAYERCONTROLLER ATTRIBUTES")
-        lines.append("="*80)
+        return str(obj.Name).startswith("Default__")
+    except Exception:
+        return False
+
+def is_owned_by(obj: Any, owners: list, max_depth: int = 8) -> bool:
+    """Check whether any of the owners appears in an object's Outer chain"""
+    try:
+        outer = obj.Outer
+        for _ in range(max_depth):
+            if outer is None:
+                return False
+            if any(outer == owner for owner in owners):
+                return True
+            outer = outer.Outer
+    except Exception:
+        pass
+    return False
+
+class ObjectIndex:
+    """
+    Shared index of find_all() results, rebuilt for every action.
+
+    Each distinct class is queried once per action - a sort or a research
+    dump invalidates the index when it starts - so every lookup within it
+    shares one query, while a later action never sees objects that were
+    destroyed since, or misses one that spawned since (e.g. the Lost Loot
+    machine). Missing classes are remembered the same way. The map change
+    hook invalidates it too, as a backstop.
+    """
+
+    def __init__(self) -> None:
+        self.objects = {}   # class name -> list of objects
+        self.missing = {}   # class name -> error message
+        self.queries = 0
+        self.hits = 0
+
+    def find(self, class_name: str) -> list:
+        """
+        Get all objects of a class, querying the engine only the first time.
+
+        Raises:
+            ValueError: If the class doesn't exist (same as unrealsdk.find_all)
+        """
+        if class_name in self.objects:
+            self.hits += 1
+            return self.objects[class_name]
+        if class_name in self.missing:
+            self.hits += 1
+            raise ValueError(self.missing[class_name])
         
-        pc_attrs = dir(pc)
-        result["pc_attributes"] = pc_attrs
-        debug_log(f"Found {len(pc_attrs)} attributes", "DEBUG")
+        self.queries += 1
+        try:
+            perf_count("find_all")
+            objects = list(unrealsdk.find_all(class_name))
+        except ValueError as ve:
+            self.missing[class_name] = str(ve)
+            raise
+        self.objects[class_name] = objects
+        debug_log("ObjectIndex: %s -> %s objects", "DEBUG", class_name, len(objects))
+        return objects
+
+    def invalidate(self) -> None:
+        """Forget every cached result"""
+        if self.objects or self.missing:
+            debug_log("ObjectIndex invalidated (%s queries, %s hits)", "DEBUG", self.queries, self.hits)
+        self.objects.clear()
+        self.missing.clear()
+
+    def local_bank(self, pc: Any) -> tuple:
+        """
+        Find the local player's bank.
+
+        Tries the pawn's own bank attributes first, then the bank container
+        classes - skipping class default objects and preferring objects owned
+        by the local player or their pawn.
+
+        Args:
+            pc: The local PlayerController
+
+        Returns:
+            (bank_object, class_name), or (None, None) if there is no bank
+        """
+        return self.local_storage(pc, STORAGE_SPECS["Bank"])
+
+    def local_storage(self, pc: Any, spec: StorageSpec, pawn: Any = None) -> tuple:
+        """
+        Find one of the local player's storages (see local_bank).
+
+        Args:
+            pc: The local PlayerController
+            spec: Where to look for the storage
+            pawn: The pc's pawn, if the caller already read it
+
+        Returns:
+            (storage_object, class_name), or (None, None) if there is none
+        """
+        if pawn is None:
+            pawn = getattr(pc, "Pawn", None)
+        if pawn is not None:
+            for attr_name in spec.pawn_attrs:
+                storage = getattr(pawn, attr_name, None)
+                if storage is not None and not callable(storage):
+                    return storage, get_class_name(storage.Class)
         
-        for attr in pc_attrs:
+        owners = [o for o in (pc, pawn) if o is not None]
+        for class_name in spec.class_names:
             try:
-                value = getattr(pc, attr, None)
-                attr_type = safe_type(value)
-                is_callable = callable(value)
-                
-                # Mark important ones
-                importance = ""
-                if any(kw in attr.lower() for kw in ['bank', 'inventory', 'item', 'equipment', 'storage']):
-                    importance = " ⭐ IMPORTANT"
-                
-                lines.append(f"  {attr}: {attr_type} {'(callable)' if is_callable else ''}{importance}")
-                
+                candidates = [obj for obj in self.find(class_name) if not is_default_object(obj)]
+            except ValueError as ve:
+                debug_log("%s class %s not found: %s", "DEBUG", spec.name, class_name, ve)
+                continue
             except Exception as e:
-                lines.append(f"  {attr}: <Error: {e}>")
-        
-        lines.append("")
-        
-        # Focus on Bank-related attributes
-        debug_log("Searching for Bank-related attributes", "DEBUG")
-        lines.append("="*80)
-        lines.append("🎯 BANK-RELATED ATTRIBUTES (Deep Dive)")
-        lines.append("="*80)
-        lines.append("")
-        
-        bank_keywords = ['bank', 'storage', 'vault']
-        bank_found_count = 0
-        for attr in pc_attrs:
-            if any(kw in attr.lower() for kw in bank_keywords):
-                bank_found_count += 1
-                lines.append(f"Found Bank-related: {attr}")
-                debug_log(f"Processing bank attribute: {attr}", "DEBUG")
-                try:
-                    value = getattr(pc, attr, None)
-                    if value is not None and not callable(value):
-                        dump_lines = dump_object_recursive(value, attr, depth=0, max_depth=4)
-                        lines.extend(dump_lines)
-                        result["bank_related"][attr] = safe_str(value)
-                    else:
-                        lines.append(f"  Type: {safe_type(value)}")
-                        lines.append(f"  Callable: {callable(value)}")
-                except Exception as e:
-                    lines.append(f"  Error accessing {attr}: {e}")
-                    debug_log(f"Error accessing {attr}: {e}", "ERROR")
-                lines.append("")
-        
-        debug_log(f"Found {bank_found_count} bank-related attributes", "INFO")
-        
-        # Focus on Inventory-related attributes
-        debug_log("Searching for Inventory-related attributes", "DEBUG")
-        lines.append("="*80)
-        lines.append("📦 INVENTORY-RELATED ATTRIBUTES (Deep Dive)")
-        lines.append("="*80)
-        lines.append("")
-        
-        inventory_keywords = ['inventory', 'item', 'equipment']
-        inventory_found_count = 0
-        for attr in pc_attrs: 
-            if any(kw in attr.lower() for kw in inventory_keywords):
-                inventory_found_count += 1
-                lines.append(f"Found Inventory-related: {attr}")
-                debug_log(f"Processing inventory attribute: {attr}", "DEBUG")
-                try:
-                    value = getattr(pc, attr, None)
-                    if value is not None and not callable(value):
-                        dump_lines = dump_object_recursive(value, attr, depth=0, max_depth=4)
-                        lines.extend(dump_lines)
-                        result["inventory_related"][attr] = safe_str(value)
-                    else:
-                        lines.append(f"  Type: {safe_type(value)}")
-                        lines.append(f"  Callable: {callable(value)}")
-                except Exception as e: 
-                    lines.append(f"  Error accessing {attr}: {e}")
-                    debug_log(f"Error accessing {attr}: {e}", "ERROR")
-                lines.append("")
-        
-        debug_log(f"Found {inventory_found_count} inventory-related attributes", "INFO")
+                debug_log("Error searching for %s %s: %s", "DEBUG", spec.name, class_name, e)
+                continue
+            if not candidates:
+                continue
+            for obj in candidates:
+                if is_owned_by(obj, owners):
+                    return obj, class_name
+            if spec.owned_only:
+                debug_log("No %s owned by the local player, skipping %s", "DEBUG", class_name, spec.name)
+                continue
+            debug_log("No %s owned by the local player, using the first instance", "DEBUG", class_name)
+            return candidates[0], class_name
+        return None, None
+
+    def local_storages(self, pc: Any, specs: list) -> list:
+        """
+        Find several of the local player's storages in one pass.
+
+        The pawn is read once, class lookups are shared through the index, and
+        a storage found under two specs is only returned for the first one.
+
+        Args:
+            pc: The local PlayerController
+            specs: StorageSpecs, in priority order
+
+        Returns:
+            (spec, storage_object, class_name) for each storage found
+        """
+        pawn = getattr(pc, "Pawn", None)
+        found = []
+        for spec in specs:
+            storage, class_name = self.local_storage(pc, spec, pawn)
+            if storage is None:
+                debug_log("No %s found", "DEBUG", spec.name)
+                continue
+            if any(storage == other for _, other, _ in found):
+                debug_log("%s is the same object as an earlier storage, skipping", "DEBUG", spec.name)
+                continue
+            found.append((spec, storage, class_name))
+        return found
+
+OBJECT_INDEX = ObjectIndex()
+
+@hook("/Script/Engine.PlayerController:ClientRestart", Type.POST)
+def on_map_change(obj: UObject, args: WrappedStruct, ret: Any, func: BoundFunction) -> None:
+    """Drop cached objects whenever the player is (re)spawned - after every map load"""
+    # A running research job holds objects of the previous map
+    cancel_research()
+    OBJECT_INDEX.invalidate()
+    ITEM_INDEX.clear()
+    reset_bank_index()
+    DIFF_VALUE_MEMO.clear()
+    for table in DEFINITION_TABLES.values():
+        table.forget_objects()
+    ITEM_CACHE.warm()
+
+# ==================== DUMP FUNCTIONS ====================
+
+# Default budgets for one research run (overridable per ObjectGraphWalker)
+DUMP_MAX_DEPTH = 4
+DUMP_MAX_CHILDREN = 16   # Sub-objects followed per object
+DUMP_MAX_OBJECTS = 500   # Distinct objects emitted per run
+DUMP_HEADER_PREVIEW_CHARS = 200  # Preview length of walked structs/arrays and section values
+
+
+# Text dump markers for the entries of a differential dump
+CHANGE_MARKERS = {"added": "+", "changed": "~", "removed": "x"}
+
+class DumpEntry:
+    """
+    One structured record of the object dump.
+
+    kind is "object" (a header for a dumped object), "attr" (one attribute
+    of an object), "link" (a back-link to an object dumped earlier) or
+    "member" (one line of the PlayerController attribute listing). All values
+    are plain strings and ints taken on the game thread, so entries can be
+    formatted as text lines or NDJSON records on the writer thread.
+
+    In a differential dump (see DumpDiff), change is "added", "changed" or
+    "removed" and path is the stable key of the object the entry belongs to.
+    """
+
+    __slots__ = ("kind", "depth", "object", "cls", "name", "type", "value", "note", "change", "path")
+
+    def __init__(self, kind: str, depth: int, object_id: int, cls: str, name: str,
+                 type_name: str = "", value: str = "", note: str = "", change: str = "", path: str = "") -> None:
+        self.kind = kind
+        self.depth = depth
+        self.object = object_id
+        self.cls = cls
+        self.name = name
+        self.type = type_name
+        self.value = value
+        self.note = note
+        self.change = change
+        self.path = path
+
+    def text(self) -> list:
+        """Format the entry as lines of the text dump"""
+        indent = "  " * self.depth
+        if self.change == "removed":
+            if self.kind == "object":
+                return [f"{indent}x [Removed] {self.path} ({self.cls})"]
+            return [f"{indent}  x [Removed] {self.path} . {self.name}"]
+        marker = CHANGE_MARKERS.get(self.change, "-")
+        if self.kind == "attr":
+            return [f"{indent}  {marker} {self.name}:  {self.type} = {self.value}"]
+        if self.kind == "link":
+            return [f"{indent}↩ {self.name}: see #{self.object} ({self.value})"]
+        if self.kind == "member":
+            prefix = f"{marker} " if self.change else ""
+            return [f"  {prefix}{self.name}: {self.type} {self.note}"]
+        lines = [f"{indent}{'='*60}", f"{indent}Name: {self.name}"]
+        if self.object is not None:
+            lines.append(f"{indent}Object: #{self.object}")
+        lines += [f"{indent}Type: {self.type}", f"{indent}Value: {self.value}", f"{indent}{'='*60}"]
+        return lines
+
+    def to_dict(self) -> dict:
+        """Get the entry as one NDJSON record"""
+        record = {"kind": self.kind, "object": self.object, "class": self.cls, "name": self.name, "type": self.type}
+        if self.kind == "link":
+            record["target_name"] = self.value
+        else:
+            record["value"] = self.value
+        if self.kind != "object":
+            record["depth"] = self.depth
+        if self.note:
+            record["note"] = self.note
+        if self.change:
+            record["change"] = self.change
+        if self.path:
+            record["path"] = self.path
+        return record
+
+def content_digest(text: str) -> str:
+    """Get a short, session-independent hash of a string"""
+    return hashlib.blake2b(text.encode('utf-8', 'replace'), digest_size=8).hexdigest()
+
+# Bump when the hashing changes, so old indexes are ignored
+DIFF_INDEX_VERSION = 3
+
+# Values whose content can be hashed directly, without safe_str()
+DIFF_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+def fingerprint_leaf(value: Any) -> str:
+    """Fingerprint a value inside an array or struct, without descending into it"""
+    if isinstance(value, DIFF_PLAIN_TYPES):
+        return repr(value)
+    if isinstance(value, UObject):
+        return safe_str(value)
+    if isinstance(value, WrappedArray):
+        try:
+            return f"[{len(value)}]"
+        except Exception:
+            return "[?]"
+    return f"<{type(value).__name__}>"
+
+def value_fingerprint(value: Any) -> str:
+    """
+    Get the text a DumpDiff hashes for an array or struct value.
+
+    Arrays are fingerprinted by their length and every element, structs by
+    every field, each as a leaf: plain values by content, objects by path,
+    nested arrays by length and nested structs by type. Nothing is
+    stringified whole, so the cost follows the element or field count. The
+    price is that an edit inside an array's struct entries (or deeper) that
+    keeps the length isn't reported; reading every entry's fields costs more
+    than the full dump it would save.
+    """
+    if isinstance(value, WrappedArray):
+        try:
+            return f"[{len(value)}]" + ",".join(fingerprint_leaf(element) for element in value)
+        except Exception as e:
+            return f"<Error fingerprinting array: {e}>"
+    try:
+        fields = [name for name in dir(value) if not name.startswith('_')]
+    except Exception as e:
+        return f"<Error fingerprinting struct: {e}>"
+    parts = []
+    for field in fields:
+        try:
+            parts.append(f"{field}={fingerprint_leaf(getattr(value, field))}")
+        except Exception as e:
+            parts.append(f"{field}=<Error: {e}>")
+    return "{" + ",".join(parts) + "}"
+
+# (object key, attribute) -> (value identity, digest) for UObject-valued
+# attributes; survives between research runs until the next map change
+DIFF_VALUE_MEMO = {}
+
+class DumpDiff:
+    """
+    Content-hash index of the previous research dump, for differential dumps.
+
+    The index maps a stable object key - the object's path for UObjects, the
+    parent key plus attribute name for structs - to a hash of every attribute.
+    Each scan profile keeps its own index, so switching profiles doesn't
+    report everything outside the new scope as removed.
+    A differential run only emits entries whose hash was added or changed,
+    then reports everything in the old index that was not seen again as
+    removed. Hashes are cheap where the value allows it: plain values are
+    hashed directly, callables by type only, arrays and structs through
+    value_fingerprint(), and a UObject-valued attribute that still points at
+    the same object as in the last run this map reuses the old hash without
+    being stringified.
+    """
+
+    def __init__(self, path: str, profile_name: str = "Full") -> None:
+        self.path = path
+        self.profile_name = profile_name
+        self.other_profiles = {}
+        self.previous = self.load()
+        self.current = {}
+        self.counts = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0, "reused": 0}
+
+    def load(self) -> dict:
+        """Read the previous index, or start empty if it is missing, unreadable or outdated"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            debug_log(f"Could not read dump index {self.path}: {e}", "WARNING")
+            return {}
+        if data.get("version") != DIFF_INDEX_VERSION:
+            debug_log("Dump index version mismatch, starting a full dump", "INFO")
+            return {}
+        self.other_profiles = data.get("profiles", {})
+        return self.other_profiles.pop(self.profile_name, {})
+
+    def check(self, object_key: str, cls: str, attr: str, digest: str) -> str:
+        """
+        Record an attribute hash and compare it with the previous index.
+
+        Returns:
+            "added" or "changed", or "" if the attribute is unchanged
+        """
+        entry = self.current.get(object_key)
+        if entry is None:
+            entry = self.current[object_key] = {"class": cls, "attrs": {}}
+        entry["attrs"][attr] = digest
+
+        previous = self.previous.get(object_key)
+        old_digest = previous["attrs"].get(attr) if previous is not None else None
+        if old_digest == digest:
+            self.counts["unchanged"] += 1
+            return ""
+        change = "added" if old_digest is None else "changed"
+        self.counts[change] += 1
+        return change
+
+    def check_value(self, object_key: str, cls: str, attr: str, value: Any) -> tuple:
+        """
+        Compare one attribute value with the previous index, stringifying it only when needed.
+
+        Returns:
+            (change, value type, value preview) - change is "" and the rest None when unchanged
+        """
+        if isinstance(value, DIFF_PLAIN_TYPES):
+            digest = content_digest(f"{type(value).__name__}:{value!r}")
+        elif callable(value):
+            digest = content_digest(safe_type(value))
+        elif isinstance(value, (WrappedArray, WrappedStruct)):
+            digest = content_digest(f"{safe_type(value)}:{value_fingerprint(value)}")
+        else:
+            memo_key = (object_key, attr)
+            identity = get_object_key(value) if isinstance(value, UObject) else None
+            memo = DIFF_VALUE_MEMO.get(memo_key)
+            if identity is not None and memo is not None and memo[0] == identity:
+                digest = memo[1]
+                self.counts["reused"] += 1
+            else:
+                value_text = safe_str(value)
+                digest = content_digest(f"{safe_type(value)}:{value_text}")
+                if identity is not None:
+                    DIFF_VALUE_MEMO[memo_key] = (identity, digest)
+
+        change = self.check(object_key, cls, attr, digest)
+        if not change:
+            return "", None, None
+        return change, safe_type(value), preview_value(value)
+
+    def removed_entries(self) -> Iterator[DumpEntry]:
+        """Yield an entry for every object and attribute of the previous index not seen this run"""
+        for object_key, previous in self.previous.items():
+            entry = self.current.get(object_key)
+            if entry is None:
+                self.counts["removed"] += 1
+                yield DumpEntry("object", 0, None, previous["class"], object_key, change="removed", path=object_key)
+                continue
+            for attr in previous["attrs"]:
+                if attr not in entry["attrs"]:
+                    self.counts["removed"] += 1
+                    yield DumpEntry("attr", 0, None, previous["class"], attr, change="removed", path=object_key)
+
+    def index(self) -> dict:
+        """Get this run's index, to be saved for the next one"""
+        return {"version": DIFF_INDEX_VERSION, "profiles": {**self.other_profiles, self.profile_name: self.current}}
+
+    def stats(self) -> dict:
+        """Get the change counts of this run"""
+        return dict(self.counts)
+
+def get_object_key(obj: Any) -> Any:
+    """Get a hashable identity for an object (the object itself when hashable)"""
+    try:
+        hash(obj)
+        return obj
+    except TypeError:
+        return id(obj)
+
+class ObjectGraphWalker:
+    """
+    Cycle-safe, memoized walker that dumps an object graph.
+
+    Every UObject is given an id (#1, #2, ...) the first time it is emitted.
+    Later references to the same object, from anywhere in the run, are written
+    as a one-line back-link instead of being dumped again. Only UObjects,
+    structs and arrays are followed - primitives and enums are leaves.
+    With a DumpDiff, attributes are compared against the previous dump and
+    only the added and changed ones are emitted.
+    """
+
+    def __init__(self, max_depth: int = DUMP_MAX_DEPTH, max_children: int = DUMP_MAX_CHILDREN,
+                 max_objects: int = DUMP_MAX_OBJECTS, diff: DumpDiff = None) -> None:
+        self.max_depth = max_depth
+        self.max_children = max_children
+        self.max_objects = max_objects
+        # When set, only attributes that changed since the last dump are emitted
+        self.diff = diff
+        # object key -> (id, name it was first emitted as)
+        self.seen = {}
+        self.back_links = 0
+
+    def register(self, obj: Any, name: str) -> int:
+        """Give an object an id without dumping it, so later references become back-links"""
+        key = get_object_key(obj)
+        if key not in self.seen:
+            self.seen[key] = (len(self.seen) + 1, name)
+        return self.seen[key][0]
+
+    def is_followable(self, value: Any) -> bool:
+        """Check whether a value is part of the object graph (not a leaf)"""
+        return isinstance(value, (UObject, WrappedStruct, WrappedArray))
+
+    def walk(self, obj: Any, name: str, max_depth: int = None) -> Iterator[str]:
+        """
+        Dump an object and the inventory-related objects it references.
+
+        Args:
+            obj: The root object
+            name: Name/identifier for the root
+            max_depth: Optional depth limit for this root (capped by the run's max_depth)
+
+        Yields:
+            DumpEntry records and plain text lines, as they are produced
+        """
+        if max_depth is None or max_depth > self.max_depth:
+            max_depth = self.max_depth
+        debug_log("ObjectGraphWalker.walk: name=%s, max_depth=%s, seen=%s", "DEBUG", name, max_depth, len(self.seen))
+        yield from self.walk_into(obj, name, 0, max_depth, name)
+
+    def walk_into(self, obj: Any, name: str, depth: int, max_depth: int, parent_key: str) -> Iterator[str]:
+        """
+        Emit one object at the given depth, then recurse into its followable attributes.
+        parent_key is the stable key of the referencing object, used to key structs in a diff.
+        """
+        indent = "  " * depth
+
+        if depth > max_depth:
+            yield f"{indent}[Max depth reached]"
+            return
+
+        # Only UObjects have a stable identity worth memoizing
+        object_id = None
+        if isinstance(obj, UObject):
+            key = get_object_key(obj)
+            if key in self.seen:
+                seen_id, seen_name = self.seen[key]
+                self.back_links += 1
+                yield DumpEntry("link", depth, seen_id, "", name, value=seen_name)
+                return
+            if len(self.seen) >= self.max_objects:
+                yield f"{indent}[Object budget reached ({self.max_objects}) - {name} skipped]"
+                return
+            object_id = self.register(obj, name)
+
+        # Basic info
+        class_name = get_class_name(get_item_class_key(obj))
+        if object_id is not None:
+            obj_str = object_key = safe_str(obj)
+        else:
+            obj_str = preview_value(obj, DUMP_HEADER_PREVIEW_CHARS)
+            object_key = f"{parent_key}.{name}"
+        yield DumpEntry("object", depth, object_id, class_name, name, safe_type(obj), obj_str)
+        diff = self.diff
+
+        try:
+            attrs = dir(obj)
+            yield f"{indent}Attributes ({len(attrs)}):"
+            children_followed = 0
+
+            for attr in attrs:
+                # Skip private/magic attributes for now
+                if attr.startswith('_'):
+                    continue
+
+                try:
+                    value = getattr(obj, attr, '<No Value>')
+                    perf_count("getattr")
+                    if diff is None:
+                        value_type = safe_type(value)
+                        value_str = preview_value(value)
+                        yield DumpEntry("attr", depth, object_id, class_name, attr, value_type, value_str)
+                    else:
+                        change, value_type, value_str = diff.check_value(object_key, class_name, attr, value)
+                        if change:
+                            yield DumpEntry("attr", depth, object_id, class_name, attr, value_type, value_str,
+                                            change=change, path=object_key)
+
+                    # If it's related to inventory/bank, dig deeper
+                    if not ATTR_CLASSIFIER.matches(attr, "dump_follow"):
+                        continue
+                    if depth >= max_depth or callable(value) or not self.is_followable(value):
+                        continue
+                    if children_followed >= self.max_children:
+                        yield f"{indent}    ↳ [Fan-out budget reached ({self.max_children})]"
+                        continue
+                    children_followed += 1
+                    yield f"{indent}    ↳ [IMPORTANT] Digging deeper..."
+                    yield from self.walk_into(value, attr, depth + 1, max_depth, object_key)
+
+                except Exception as e:
+                    yield f"{indent}  - {attr}: <Error: {e}>"
+        except Exception as e:
+            yield f"{indent}Error getting attributes: {e}"
+
+    def stats(self) -> dict:
+        """Get a summary of the walk so far"""
+        stats = {"objects": len(self.seen), "back_links": self.back_links}
+        if self.diff is not None:
+            stats["diff"] = self.diff.stats()
+        return stats
+
+# Sections of the research dump, in the order they run
+DUMP_SECTIONS = ("pc_attributes", "bank", "inventory", "mod_classes", "pawn", "bank_objects", "serial")
+
+SCAN_PROFILES_FILE = "scan_profiles.json"
+
+class ScanProfile:
+    """
+    Scope of one research run: which dump sections run, which classes they
+    search, and the walker's budgets.
+
+    Args:
+        name: Name shown in the options menu and the dump header
+        sections: Names from DUMP_SECTIONS to run (default: all of them)
+        mod_classes: Classes scanned by the mod-related class section
+        bank_classes: Classes searched by the find_all() bank object section
+        objects_per_class: Objects dumped per bank class
+        max_depth: Deepest level the walker descends to
+        max_objects: Distinct objects dumped per run
+    """
+
+    def __init__(self, name: str, sections: list = None, mod_classes: list = None, bank_classes: list = None,
+                 objects_per_class: int = 3, max_depth: int = DUMP_MAX_DEPTH,
+                 max_objects: int = DUMP_MAX_OBJECTS) -> None:
+        sections = list(DUMP_SECTIONS) if sections is None else list(sections)
+        unknown = [section for section in sections if section not in DUMP_SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown dump section(s) {', '.join(map(str, unknown))} "
+                             f"(expected any of: {', '.join(DUMP_SECTIONS)})")
+        for label, limit in (("objects_per_class", objects_per_class), ("max_depth", max_depth),
+                             ("max_objects", max_objects)):
+            if not isinstance(limit, int) or isinstance(limit, bool) or limit < 0:
+                raise ValueError(f"{label} must be a non-negative integer, got {limit!r}")
+        self.name = name
+        self.sections = frozenset(sections)
+        self.mod_classes = list(MOD_RELATED_CLASSES if mod_classes is None else mod_classes)
+        self.bank_classes = list(BANK_CLASS_NAMES if bank_classes is None else bank_classes)
+        self.objects_per_class = objects_per_class
+        self.max_depth = max_depth
+        self.max_objects = max_objects
+
+    @classmethod
+    def from_dict(cls, name: str, data: dict) -> "ScanProfile":
+        """
+        Build a profile from its scan_profiles.json entry; missing keys keep the full-scan defaults.
+
+        Raises:
+            ValueError: If the entry is not an object or has unknown keys or bad values
+        """
+        if not isinstance(data, dict):
+            raise ValueError("expected an object")
+        known = ("sections", "mod_classes", "bank_classes", "objects_per_class", "max_depth", "max_objects")
+        unknown = [key for key in data if key not in known]
+        if unknown:
+            raise ValueError(f"Unknown key(s) {', '.join(unknown)} (expected any of: {', '.join(known)})")
+        return cls(name, **data)
+
+    def has(self, section: str) -> bool:
+        """Check whether a dump section runs in this profile"""
+        return section in self.sections
+
+    def make_walker(self, diff: "DumpDiff" = None) -> "ObjectGraphWalker":
+        """Create the walker for a run with this profile's budgets"""
+        return ObjectGraphWalker(max_depth=self.max_depth, max_objects=self.max_objects, diff=diff)
+
+# Built-in scan profiles; more can be added through scan_profiles.json
+SCAN_PROFILES = {
+    "Full": ScanProfile("Full"),
+    "Bank Only": ScanProfile("Bank Only", sections=["bank", "bank_objects"]),
+    "Inventory Only": ScanProfile("Inventory Only", sections=["inventory", "pawn"]),
+    "Serial Only": ScanProfile("Serial Only", sections=["mod_classes", "serial"]),
+}
+
+def load_custom_scan_profiles() -> None:
+    """
+    Add user-defined scan profiles from scan_profiles.json in the mod folder.
+
+    The file maps a profile name to its settings (see ScanProfile), e.g.
+        {"Quick Bank": {"sections": ["bank_objects"], "bank_classes": ["OakBank"],
+                        "objects_per_class": 1, "max_depth": 2}}
+    Invalid entries are skipped with a warning.
+    """
+    path = os.path.join(get_mod_directory(), SCAN_PROFILES_FILE)
+    if not os.path.exists(path):
+        return
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            custom_profiles = json.load(f)
+    except Exception as e:
+        debug_log(f"Error loading {SCAN_PROFILES_FILE}: {e}", "WARNING")
+        return
+    if not isinstance(custom_profiles, dict):
+        debug_log(f"Skipping {SCAN_PROFILES_FILE}: expected an object of name -> settings, "
+                  f"got {type(custom_profiles).__name__}", "WARNING")
+        return
+    
+    for name, data in custom_profiles.items():
+        try:
+            SCAN_PROFILES[name] = ScanProfile.from_dict(name, data)
+        except (TypeError, ValueError) as e:
+            debug_log(f"Skipping scan profile '{name}': {e}", "WARNING")
+            continue
+        debug_log(f"Loaded custom scan profile '{name}': {data}", "INFO")
+
+def new_dump_result() -> dict:
+    """Create the result dictionary filled in by iter_dump_events()"""
+    return {
+        "timestamp": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "success": False,
+        "error":  None,
+        "pc_found": False,
+        "pc_attributes": [],
+        "bank_related": {},
+        "inventory_related": {},
+    }
+
+def iter_dump_events(result: dict, walker: ObjectGraphWalker, profile: ScanProfile = None) -> Iterator[Any]:
+    """
+    Walk the PlayerController structure focusing on Bank/Inventory, one event at a time.
+
+    Events are either a text line (str) for the text dump, a DumpEntry (a
+    structured object/attribute record), a (key, value) tuple holding a
+    finished top-level JSON record, or None - a pause point after a unit of
+    work with nothing to write. Nothing is accumulated here - the consumer
+    decides where each event goes.
+
+    Args:
+        result: Dictionary from new_dump_result(), filled in as sections complete
+        walker: ObjectGraphWalker shared by every section, so each object is dumped once
+        profile: ScanProfile choosing the sections and classes to scan (default: full scan)
+
+    Yields:
+        Text lines, DumpEntry records, (key, value) JSON records and None pause points
+    """
+    if profile is None:
+        profile = SCAN_PROFILES["Full"]
+    # Every dump looks up the objects that exist now, not those of an earlier action
+    OBJECT_INDEX.invalidate()
+    yield ("timestamp", result["timestamp"])
+    yield ("scan_profile", profile.name)
+    yield "="*80
+    yield f"BANK RESEARCH - Structure Dump"
+    yield f"Timestamp: {result['timestamp']}"
+    if profile.name != "Full":
+        yield f"Scan profile: {profile.name} ({', '.join(s for s in DUMP_SECTIONS if profile.has(s))})"
+    yield "="*80
+    yield ""
+    
+    try:
+        # Get PlayerController
+        debug_log("Attempting to get PlayerController", "DEBUG")
+        pc = get_pc()
         
-        # Scan for mod-related classes (bl3data approach)
-        debug_log("Scanning for mod-related classes", "INFO")
-        lines.append("="*80)
-        lines.append("🔍 MOD-RELATED CLASS SCANNING (bl3data approach)")
-        lines.append("="*80)
-        lines.append("")
-        lines.append("Scanning for classes that may contain useful mod data...")
-        lines.append("")
+        if not pc: 
+            yield "❌ ERROR: PlayerController not found!"
+            yield "This usually means you're not in-game yet."
+            result["error"] = "PlayerController not found"
+            debug_log("PlayerController not found", "WARNING")
+            return
         
-        mod_data_findings = {}
-        for class_name in MOD_RELATED_CLASSES:
-            try:
-                lines.append(f"Scanning: {class_name}")
-                debug_log(f"Scanning class: {class_name}", "DEBUG")
-                objects = unrealsdk.find_all(class_name)
-                
-                if objects:
-                    lines.append(f"  ✅ Found {len(objects)} {class_name} objects")
-                    debug_log(f"Found {len(objects)} {class_name} objects", "INFO")
-                    
-                    # Scan first object for mod-related data
-                    if len(objects) > 0:
-                        obj = objects[0]
-                        findings = scan_for_mod_data(obj, class_name)
-                        mod_data_findings[class_name] = findings
-                        
-                        # Report findings
-                        if findings["inventory_related"]:
-                            lines.append(f"    📦 Inventory attrs: {len(findings['inventory_related'])}")
-                            for item in findings["inventory_related"][:3]:  # Show first 3
-                                lines.append(f"      - {item['name']} ({item['type']})")
-                        
-                        if findings["bank_related"]:
-                            lines.append(f"    🏦 Bank attrs: {len(findings['bank_related'])}")
-                            for item in findings["bank_related"][:3]:
-                                lines.append(f"      - {item['name']} ({item['type']})")
-                        
-                        if findings["item_related"]:
-                            lines.append(f"    🎯 Item attrs: {len(findings['item_related'])}")
-                            for item in findings["item_related"][:3]:
-                                lines.append(f"      - {item['name']} ({item['type']})")
-                        
-                        if findings["balance_related"]:
-                            lines.append(f"    ⚖️ Balance attrs: {len(findings['balance_related'])}")
-                            for item in findings["balance_related"][:3]:
-                                lines.append(f"      - {item['name']} ({item['type']})")
-                        
-                        if findings["serial_related"]:
-                            lines.append(f"    🔢 Serial attrs: {len(findings['serial_related'])}")
-                            for item in findings["serial_related"][:3]:
-                                lines.append(f"      - {item['name']} ({item['type']})")
-                        
-                        lines.append(f"    📋 Total methods: {len(findings['methods'])}")
-                        lines.append(f"    📋 Total properties: {len(findings['properties'])}")
-                else:
-                    lines.append(f"  ❌ No objects found")
-                    debug_log(f"No {class_name} objects found", "DEBUG")
-            except Exception as e:
-                lines.append(f"  ⚠️ Error scanning: {e}")
-                debug_log(f"Error scanning {class_name}: {e}", "DEBUG")
-            lines.append("")
+        debug_log(f"PlayerController found: {safe_type(pc)}", "INFO")
+        result["pc_found"] = True
+        yield ("pc_found", True)
+        yield "✅ PlayerController found!"
+        yield f"Type: {safe_type(pc)}"
+        yield f"Value: {safe_str(pc)}"
+        pc_id = walker.register(pc, 'PlayerController')
+        pc_class = get_class_name(get_item_class_key(pc))
+        pc_key = safe_str(pc)
+        yield f"Object: #{pc_id}"
+        yield ""
         
-        # Store mod scan results
-        result["mod_scan_findings"] = mod_data_findings
+        # Get all attributes
+        debug_log("Getting PlayerController attributes", "DEBUG")
+        pc_attrs = dir(pc)
+        result["pc_attributes"] = pc_attrs
+        yield ("pc_attributes", pc_attrs)
+        debug_log("Found %s attributes", "DEBUG", len(pc_attrs))
         
-        # Check Pawn's inventory
-        debug_log("Checking Pawn inventory", "DEBUG")
-        lines.append("="*80)
-        lines.append("🧍 PAWN INVENTORY CHECK")
-        lines.append("="*80)
-        lines.append("")
+        # List all attributes
+        if profile.has("pc_attributes"):
+            yield "="*80
+            yield "ALL PLAYERCONTROLLER ATTRIBUTES"
+            yield "="*80
+            
+            for attr in pc_attrs:
+                try:
+                    value = getattr(pc, attr, None)
+                    attr_type = safe_type(value)
+                    is_callable = callable(value)
+                    
+                    # Mark important ones
+                    importance = ""
+                    if ATTR_CLASSIFIER.matches(attr, "dump_important"):
+                        importance = " ⭐ IMPORTANT"
+                    
+                    note = f"{'(callable)' if is_callable else ''}{importance}"
+                    if walker.diff is None:
+                        yield DumpEntry("member", 0, pc_id, pc_class, attr, attr_type, note=note)
+                        continue
+                    change = walker.diff.check(pc_key, pc_class, attr, content_digest(f"{attr_type}:{note}"))
+                    if change:
+                        yield DumpEntry("member", 0, pc_id, pc_class, attr, attr_type, note=note, change=change, path=pc_key)
+                    
+                except Exception as e:
+                    yield f"  {attr}: <Error: {e}>"
+            
+            yield ""
         
-        if hasattr(pc, 'Pawn') and pc.Pawn:
-            pawn = pc.Pawn
-            lines.append(f"✅ Pawn found: {safe_str(pawn)}")
-            lines.append(f"Pawn type: {safe_type(pawn)}")
-            lines.append("")
-            debug_log(f"Pawn found: {safe_type(pawn)}", "DEBUG")
+        # Focus on Bank-related attributes
+        if profile.has("bank"):
+            debug_log("Searching for Bank-related attributes", "DEBUG")
+            yield "="*80
+            yield "🎯 BANK-RELATED ATTRIBUTES (Deep Dive)"
+            yield "="*80
+            yield ""
             
-            pawn_attrs = dir(pawn)
-            pawn_found_count = 0
-            for attr in pawn_attrs:
-                if any(kw in attr.lower() for kw in ['inventory', 'item', 'equipment', 'bank']):
-                    pawn_found_count += 1
-                    lines.append(f"Pawn.{attr}:")
-                    debug_log(f"Processing pawn attribute: {attr}", "DEBUG")
+            bank_found_count = 0
+            for attr in pc_attrs:
+                if ATTR_CLASSIFIER.matches(attr, "dump_bank"):
+                    bank_found_count += 1
+                    yield f"Found Bank-related: {attr}"
+                    debug_log("Processing bank attribute: %s", "DEBUG", attr)
                     try:
-                        value = getattr(pawn, attr, None)
-                        dump_lines = dump_object_recursive(value, f"Pawn.{attr}", depth=0, max_depth=3)
-                        lines.extend(dump_lines)
+                        value = getattr(pc, attr, None)
+                        if value is not None and not callable(value):
+                            yield from walker.walk(value, attr, max_depth=4)
+                            result["bank_related"][attr] = preview_value(value, DUMP_HEADER_PREVIEW_CHARS)
+                        else:
+                            yield f"  Type: {safe_type(value)}"
+                            yield f"  Callable: {callable(value)}"
                     except Exception as e:
-                        lines.append(f"  Error: {e}")
-                        debug_log(f"Error accessing Pawn.{attr}: {e}", "ERROR")
-                    lines.append("")
-            debug_log(f"Found {pawn_found_count} pawn attributes", "DEBUG")
-        else:
-            lines.append("❌ No Pawn found")
-            debug_log("No Pawn found", "WARNING")
+                        yield f"  Error accessing {attr}: {e}"
+                        debug_log(f"Error accessing {attr}: {e}", "ERROR")
+                    yield ""
+            
+            yield ("bank_related", result["bank_related"])
+            debug_log(f"Found {bank_found_count} bank-related attributes", "INFO")
         
-        # Try to find Bank objects using unrealsdk. find_all
-        debug_log("Searching for Bank objects with find_all()", "DEBUG")
-        lines.append("="*80)
-        lines.append("🔍 SEARCHING FOR BANK OBJECTS WITH find_all()")
-        lines.append("="*80)
-        lines.append("")
+        # Focus on Inventory-related attributes
+        if profile.has("inventory"):
+            debug_log("Searching for Inventory-related attributes", "DEBUG")
+            yield "="*80
+            yield "📦 INVENTORY-RELATED ATTRIBUTES (Deep Dive)"
+            yield "="*80
+            yield ""
+            
+            inventory_found_count = 0
+            for attr in pc_attrs: 
+                if ATTR_CLASSIFIER.matches(attr, "dump_inventory"):
+                    inventory_found_count += 1
+                    yield f"Found Inventory-related: {attr}"
+                    debug_log("Processing inventory attribute: %s", "DEBUG", attr)
+                    try:
+                        value = getattr(pc, attr, None)
+                        if value is not None and not callable(value):
+                            yield from walker.walk(value, attr, max_depth=4)
+                            result["inventory_related"][attr] = preview_value(value, DUMP_HEADER_PREVIEW_CHARS)
+                        else:
+                            yield f"  Type: {safe_type(value)}"
+                            yield f"  Callable: {callable(value)}"
+                    except Exception as e: 
+                        yield f"  Error accessing {attr}: {e}"
+                        debug_log(f"Error accessing {attr}: {e}", "ERROR")
+                    yield ""
+            
+            yield ("inventory_related", result["inventory_related"])
+            debug_log(f"Found {inventory_found_count} inventory-related attributes", "INFO")
         
-        for class_name in BANK_CLASS_NAMES: 
-            try:
-                lines.append(f"Searching for: {class_name}")
-                debug_log(f"Searching for class: {class_name}", "DEBUG")
-                objects = unrealsdk.find_all(class_name)
-                
-                if objects:
-                    lines.append(f"  ✅ Found {len(objects)} objects!")
-                    debug_log(f"Found {len(objects)} {class_name} objects", "INFO")
-                    for i, obj in enumerate(objects[:3]):  # Only show first 3
-                        lines.append(f"  Object {i+1}:")
-                        lines.append(f"    Type: {safe_type(obj)}")
-                        lines.append(f"    Str: {safe_str(obj)[:200]}")
+        # Scan for mod-related classes (bl3data approach)
+        if profile.has("mod_classes"):
+            debug_log("Scanning for mod-related classes", "INFO")
+            yield "="*80
+            yield "🔍 MOD-RELATED CLASS SCANNING (bl3data approach)"
+            yield "="*80
+            yield ""
+            yield "Scanning for classes that may contain useful mod data..."
+            yield ""
+            
+            mod_data_findings = {}
+            for class_name in profile.mod_classes:
+                try:
+                    yield f"Scanning: {class_name}"
+                    debug_log("Scanning class: %s", "DEBUG", class_name)
+                    objects = OBJECT_INDEX.find(class_name)
+                    
+                    if objects:
+                        yield f"  ✅ Found {len(objects)} {class_name} objects"
+                        debug_log(f"Found {len(objects)} {class_name} objects", "INFO")
                         
-                        # Dump its structure
-                        dump_lines = dump_object_recursive(obj, f"{class_name}[{i}]", depth=0, max_depth=2)
-                        lines.extend(dump_lines)
-                else:
-                    lines.append(f"  ❌ No objects found")
-                    debug_log(f"No {class_name} objects found", "DEBUG")
-            except Exception as e:
-                lines.append(f"  ⚠️ Error searching: {e}")
-                debug_log(f"Error searching {class_name}: {e}", "ERROR")
-            lines.append("")
-        
-        # Additional scan: Look for inventory serial data (bl3data approach)
-        debug_log("Scanning for inventory serial data", "INFO")
-        lines.append("="*80)
-        lines.append("🔢 INVENTORY SERIAL NUMBER DATA SCAN")
-        lines.append("="*80)
-        lines.append("")
-        lines.append("Looking for item serial number and identification data...")
-        lines.append("(Useful for understanding item structure and manipulation)")
-        lines.append("")
+                        # Scan first object for mod-related data
+                        if len(objects) > 0:
+                            obj = objects[0]
+                            findings = new_mod_findings(obj, class_name)
+                            yield from iter_scan_for_mod_data(obj, findings)
+                            mod_data_findings[class_name] = findings
+                            
+                            # Report findings
+                            if findings["inventory_related"]:
+                                yield f"    📦 Inventory attrs: {len(findings['inventory_related'])}"
+                                for item in findings["inventory_related"][:3]:  # Show first 3
+                                    yield f"      - {item['name']} ({item['type']})"
+                            
+                            if findings["bank_related"]:
+                                yield f"    🏦 Bank attrs: {len(findings['bank_related'])}"
+                                for item in findings["bank_related"][:3]:
+                                    yield f"      - {item['name']} ({item['type']})"
+                            
+                            if findings["item_related"]:
+                                yield f"    🎯 Item attrs: {len(findings['item_related'])}"
+                                for item in findings["item_related"][:3]:
+                                    yield f"      - {item['name']} ({item['type']})"
+                            
+                            if findings["balance_related"]:
+                                yield f"    ⚖️ Balance attrs: {len(findings['balance_related'])}"
+                                for item in findings["balance_related"][:3]:
+                                    yield f"      - {item['name']} ({item['type']})"
+                            
+                            if findings["serial_related"]:
+                                yield f"    🔢 Serial attrs: {len(findings['serial_related'])}"
+                                for item in findings["serial_related"][:3]:
+                                    yield f"      - {item['name']} ({item['type']})"
+                            
+                            yield f"    📋 Total methods: {len(findings['methods'])}"
+                            yield f"    📋 Total properties: {len(findings['properties'])}"
+                    else:
+                        yield f"  ❌ No objects found"
+                        debug_log("No %s objects found", "DEBUG", class_name)
+                except Exception as e:
+                    yield f"  ⚠️ Error scanning: {e}"
+                    debug_log("Error scanning %s: %s", "DEBUG", class_name, e)
+                yield ""
+            
+            # Store mod scan results
+            result["mod_scan_findings"] = mod_data_findings
+            yield ("mod_scan_findings", mod_data_findings)
         
-        serial_keywords = ['serial', 'guid', 'itemid', 'inventoryid']
-        serial_findings = {}
+        # Check Pawn's inventory
+        if profile.has("pawn"):
+            debug_log("Checking Pawn inventory", "DEBUG")
+            yield "="*80
+            yield "🧍 PAWN INVENTORY CHECK"
+            yield "="*80
+            yield ""
+            
+            if hasattr(pc, 'Pawn') and pc.Pawn:
+                pawn = pc.Pawn
+                yield f"✅ Pawn found: {safe_str(pawn)}"
+                yield f"Pawn type: {safe_type(pawn)}"
+                yield f"Object: #{walker.register(pawn, 'Pawn')}"
+                yield ""
+                debug_log("Pawn found: %s", "DEBUG", safe_type(pawn))
+                
+                pawn_attrs = dir(pawn)
+                pawn_found_count = 0
+                for attr in pawn_attrs:
+                    if ATTR_CLASSIFIER.matches(attr, "dump_pawn"):
+                        pawn_found_count += 1
+                        yield f"Pawn.{attr}:"
+                        debug_log("Processing pawn attribute: %s", "DEBUG", attr)
+                        try:
+                            value = getattr(pawn, attr, None)
+                            yield from walker.walk(value, f"Pawn.{attr}", max_depth=3)
+                        except Exception as e:
+                            yield f"  Error: {e}"
+                            debug_log(f"Error accessing Pawn.{attr}: {e}", "ERROR")
+                        yield ""
+                debug_log("Found %s pawn attributes", "DEBUG", pawn_found_count)
+            else:
+                yield "❌ No Pawn found"
+                debug_log("No Pawn found", "WARNING")
         
-        # Scan PlayerController for serial-related attributes
-        for attr in pc_attrs:
-            attr_lower = attr.lower()
-            if any(kw in attr_lower for kw in serial_keywords):
+        # Try to find Bank objects using unrealsdk. find_all
+        if profile.has("bank_objects"):
+            debug_log("Searching for Bank objects with find_all()", "DEBUG")
+            yield "="*80
+            yield "🔍 SEARCHING FOR BANK OBJECTS WITH find_all()"
+            yield "="*80
+            yield ""
+            
+            for class_name in profile.bank_classes:
                 try:
-                    value = getattr(pc, attr, None)
-                    serial_findings[attr] = {
-                        "type": safe_type(value),
-                        "callable": callable(value),
-                        "value_preview": safe_str(value)[:100]
-                    }
-                    lines.append(f"PC.{attr}:")
-                    lines.append(f"  Type: {safe_type(value)}")
-                    lines.append(f"  Callable: {callable(value)}")
-                    if not callable(value):
-                        lines.append(f"  Preview: {safe_str(value)[:100]}")
+                    yield f"Searching for: {class_name}"
+                    debug_log("Searching for class: %s", "DEBUG", class_name)
+                    objects = OBJECT_INDEX.find(class_name)
+                    
+                    if objects:
+                        yield f"  ✅ Found {len(objects)} objects!"
+                        debug_log(f"Found {len(objects)} {class_name} objects", "INFO")
+                        for i, obj in enumerate(objects[:profile.objects_per_class]):
+                            yield f"  Object {i+1}:"
+                            yield f"    Type: {safe_type(obj)}"
+                            yield f"    Str: {preview_value(obj, DUMP_HEADER_PREVIEW_CHARS)}"
+                            
+                            # Dump its structure
+                            yield from walker.walk(obj, f"{class_name}[{i}]", max_depth=2)
+                    else:
+                        yield f"  ❌ No objects found"
+                        debug_log("No %s objects found", "DEBUG", class_name)
                 except Exception as e:
-                    lines.append(f"  Error: {e}")
-                lines.append("")
+                    yield f"  ⚠️ Error searching: {e}"
+                    debug_log(f"Error searching {class_name}: {e}", "ERROR")
+                yield ""
         
-        result["serial_data_findings"] = serial_findings
+        # Additional scan: Look for inventory serial data (bl3data approach)
+        if profile.has("serial"):
+            debug_log("Scanning for inventory serial data", "INFO")
+            yield "="*80
+            yield "🔢 INVENTORY SERIAL NUMBER DATA SCAN"
+            yield "="*80
+            yield ""
+            yield "Looking for item serial number and identification data..."
+            yield "(Useful for understanding item structure and manipulation)"
+            yield ""
+            
+            serial_findings = {}
+            
+            # Scan PlayerController for serial-related attributes
+            for attr in pc_attrs:
+                if ATTR_CLASSIFIER.matches(attr, "dump_serial"):
+                    try:
+                        value = getattr(pc, attr, None)
+                        preview = preview_value(value)
+                        serial_findings[attr] = {
+                            "type": safe_type(value),
+                            "callable": callable(value),
+                            "value_preview": preview
+                        }
+                        yield f"PC.{attr}:"
+                        yield f"  Type: {safe_type(value)}"
+                        yield f"  Callable: {callable(value)}"
+                        if not callable(value):
+                            yield f"  Preview: {preview}"
+                    except Exception as e:
+                        yield f"  Error: {e}"
+                    yield ""
+            
+            result["serial_data_findings"] = serial_findings
+            yield ("serial_data_findings", serial_findings)
+            
+            if not serial_findings:
+                yield "❌ No serial-related attributes found in PlayerController"
+                yield "This is normal - serial data might be in item objects themselves"
+            
+            yield ""
         
-        if not serial_findings:
-            lines.append("❌ No serial-related attributes found in PlayerController")
-            lines.append("This is normal - serial data might be in item objects themselves")
+        if walker.diff is not None:
+            yield "="*80
+            yield "REMOVED SINCE LAST DUMP"
+            yield "="*80
+            yield from walker.diff.removed_entries()
+            yield ""
         
-        lines.append("")
+        walker_stats = walker.stats()
+        result["walker_stats"] = walker_stats
+        yield ("walker_stats", walker_stats)
+        yield f"Objects dumped: {walker_stats['objects']}, back-links: {walker_stats['back_links']}"
+        if walker.diff is not None:
+            diff_stats = walker_stats["diff"]
+            yield (f"Changes: {diff_stats['added']} added, {diff_stats['changed']} changed, "
+                   f"{diff_stats['removed']} removed, {diff_stats['unchanged']} unchanged")
         
         result["success"] = True
         debug_log("dump_player_controller completed successfully", "INFO")
         
     except Exception as e:
         import traceback
-        lines.append("")
-        lines.append("="*80)
-        lines.append("❌ CRITICAL ERROR")
-        lines.append("="*80)
-        lines.append(f"Error: {e}")
-        lines.append("")
-        lines.append("Traceback:")
-        lines.append(traceback.format_exc())
+        yield ""
+        yield "="*80
+        yield "❌ CRITICAL ERROR"
+        yield "="*80
+        yield f"Error: {e}"
+        yield ""
+        yield "Traceback:"
+        yield traceback.format_exc()
         result["error"] = str(e)
         debug_log(f"Critical error in dump_player_controller: {e}", "ERROR")
         debug_log(f"Traceback: {traceback.format_exc()}", "ERROR")
+
+def dump_player_controller(sink: "DumpSink", walker: ObjectGraphWalker = None, profile: ScanProfile = None) -> dict:
+    """
+    Dump PlayerController structure focusing on Bank/Inventory, streaming it to a sink
+
+    Args:
+        sink: Open DumpSink that receives text lines and JSON records as they are produced
+        walker: Optional ObjectGraphWalker carrying this run's depth/fan-out budget
+        profile: Optional ScanProfile limiting the scope (default: full scan)
+
+    Returns:
+        Dictionary with the (small) structured dump results
+    """
+    debug_log("Starting dump_player_controller", "INFO")
     
-    result["all_text"] = lines
+    if profile is None:
+        profile = SCAN_PROFILES["Full"]
+    if walker is None:
+        walker = profile.make_walker()
+    
+    result = new_dump_result()
+    for event in iter_dump_events(result, walker, profile):
+        sink.emit(event)
     return result
 
-def save_dump_to_file(result: dict) -> None:
-    """Save dump results to files"""
-    debug_log("Saving dump to files", "INFO")
+# Lines buffered in memory before a chunk is written to the text dump
+DUMP_CHUNK_LINES = 256
+
+def snapshot_value(value: Any) -> Any:
+    """
+    Copy a dump value into plain Python data (dicts, lists, strings, numbers).
+    Runs on the game thread, so the writer thread never touches a live object.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): snapshot_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [snapshot_value(v) for v in value]
+    return safe_str(value)
+
+class TextJsonOutput:
+    """
+    The classic research output: a readable text dump plus one JSON object
+    holding the top-level records. Only used on the writer thread.
+    """
+
+    def __init__(self, mod_dir: str) -> None:
+        self.txt_path = os.path.join(mod_dir, OUTPUT_FILE)
+        self.json_path = os.path.join(mod_dir, JSON_FILE)
+        self.paths = [self.txt_path, self.json_path]
+        self.txt_file = None
+        self.json_file = None
+        self.json_count = 0
+
+    def open(self) -> None:
+        """Open (truncate) the text and JSON dump files"""
+        self.txt_file = open(self.txt_path, 'w', encoding='utf-8')
+        self.json_file = open(self.json_path, 'w', encoding='utf-8')
+        self.json_file.write("{")
+
+    def write_items(self, items: list) -> None:
+        """Write a chunk of text lines and DumpEntry records to the text dump"""
+        lines = []
+        for item in items:
+            if isinstance(item, DumpEntry):
+                lines.extend(item.text())
+            else:
+                lines.append(item)
+        self.txt_file.write('\n'.join(lines) + '\n')
+        self.txt_file.flush()
+
+    def write_record(self, key: str, value: Any) -> None:
+        """Write one top-level member of the JSON object"""
+        # Indent nested lines so the file matches json.dump(..., indent=2)
+        value_json = json.dumps(value, indent=2).replace('\n', '\n  ')
+        separator = "," if self.json_count else ""
+        self.json_file.write(f'{separator}\n  {json.dumps(key)}: {value_json}')
+        self.json_file.flush()
+        self.json_count += 1
+
+    def close(self) -> list:
+        """Close both files, returning (label, path) for each one saved"""
+        saved = []
+        if self.txt_file is not None:
+            self.txt_file.close()
+            saved.append(("Text dump", self.txt_path))
+        if self.json_file is not None:
+            self.json_file.write("\n}\n")
+            self.json_file.close()
+            saved.append(("JSON dump", self.json_path))
+        return saved
+
+class RecordOutput:
+    """
+    Research output with one JSON record per object/attribute, so a dump can
+    be streamed and filtered without loading it (see tools/dump_reader.py).
+
+    Records are DumpEntry.to_dict() for the walked objects, plus
+    {"kind": "record", "key": ..., "value": ...} for each top-level result.
+    Plain text lines (section titles) only belong in the text dump and are
+    dropped. Written as NDJSON, gzip-compressed NDJSON (".gz"), or for ".bin"
+    as BINARY_DUMP_MAGIC followed by length-prefixed records.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.paths = [path]
+        self.binary = path.endswith(".bin")
+        self.file = None
+
+    def open(self) -> None:
+        """Open (truncate) the record file"""
+        if self.binary:
+            self.file = open(self.path, 'wb')
+            self.file.write(BINARY_DUMP_MAGIC)
+        elif self.path.endswith(".gz"):
+            self.file = gzip.open(self.path, 'wt', encoding='utf-8')
+        else:
+            self.file = open(self.path, 'w', encoding='utf-8')
+
+    def write(self, record: dict) -> None:
+        """Write one record"""
+        data = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+        if self.binary:
+            encoded = data.encode('utf-8')
+            self.file.write(struct.pack('<I', len(encoded)) + encoded)
+        else:
+            self.file.write(data + '\n')
+
+    def write_items(self, items: list) -> None:
+        """Write the DumpEntry records of a chunk"""
+        for item in items:
+            if isinstance(item, DumpEntry):
+                self.write(item.to_dict())
+
+    def write_record(self, key: str, value: Any) -> None:
+        """Write one top-level result as a record"""
+        self.write({"kind": "record", "key": key, "value": value})
+
+    def close(self) -> list:
+        """Close the file, returning (label, path) if it was saved"""
+        if self.file is None:
+            return []
+        self.file.close()
+        return [("Record dump", self.path)]
+
+def make_dump_output(mod_dir: str, dump_format: str) -> Any:
+    """Get the writer-side output for a DUMP_FORMATS name, falling back to text + JSON"""
+    record_file = DUMP_FORMATS.get(dump_format)
+    if record_file is None:
+        return TextJsonOutput(mod_dir)
+    return RecordOutput(os.path.join(mod_dir, record_file))
+
+class DumpSink:
+    """
+    Streams a research dump to disk while the walk runs.
+
+    The game thread only hands over plain data: text lines and DumpEntry
+    records in chunks of DUMP_CHUNK_LINES, and each top-level JSON record as
+    a snapshot (see snapshot_value) as soon as it is finished. A writer
+    thread does the formatting, the summary and all file I/O through the
+    output for the chosen format (see DUMP_FORMATS), so memory stays flat
+    and the frame never waits on the disk. If the walk dies part-way
+    through, every queued chunk still reaches the disk and the output is
+    still closed, marked with "complete": false.
+
+    The writer thread never touches the SDK: results are reported on the
+    game thread by report(), once done is set.
+    """
+
+    def __init__(self, mod_dir: str, chunk_lines: int = DUMP_CHUNK_LINES, dump_format: str = None) -> None:
+        self.output = make_dump_output(mod_dir, dump_format or DUMP_FORMAT)
+        self.summary_path = os.path.join(mod_dir, SUMMARY_FILE)
+        self.chunk_lines = chunk_lines
+        self.buffer = []
+        self.json_keys = set()
+        self.lines_written = 0
+        self.finished = False
+        self.closed = False
+        self.queue = queue.Queue()
+        self.thread = None
+        self.done = threading.Event()
+        self.saved = []     # Files the writer finished, reported by report()
+        self.errors = []    # Writer errors, reported by report()
+
+    def __enter__(self) -> "DumpSink":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc is not None and not self.finished:
+            self.write_record("error", str(exc))
+        self.close()
+        self.wait()
+        self.report()
+
+    def open(self) -> None:
+        """Start the writer thread, which opens (truncates) the dump files"""
+        self.thread = threading.Thread(target=self.run, name=f"{MOD_NAME}-dump", daemon=True)
+        self.thread.start()
+        debug_log("Streaming dump to %s", "DEBUG", ", ".join(self.output.paths))
+
+    def emit(self, event: Any) -> None:
+        """Route one event from iter_dump_events() - a text line, DumpEntry or (key, value) record"""
+        if event is None:
+            return
+        if isinstance(event, tuple):
+            self.write_record(*event)
+        else:
+            self.write_line(event)
+
+    def write_line(self, line: Any) -> None:
+        """Buffer a text line or DumpEntry, handing a chunk to the writer when the buffer is full"""
+        self.buffer.append(line)
+        if len(self.buffer) >= self.chunk_lines:
+            self.flush_text()
+
+    def flush_text(self) -> None:
+        """Hand buffered lines and entries to the writer"""
+        if not self.buffer:
+            return
+        self.queue.put(("text", self.buffer))
+        self.lines_written += len(self.buffer)
+        self.buffer = []
+
+    def write_record(self, key: str, value: Any) -> None:
+        """Hand a snapshot of one top-level JSON member to the writer"""
+        if key in self.json_keys or self.closed:
+            return
+        self.json_keys.add(key)
+        # Keep event order, for formats that write everything to one stream
+        self.flush_text()
+        self.queue.put(("record", key, snapshot_value(value)))
+
+    def write_file(self, label: str, path: str, data: Any) -> None:
+        """Have the writer save plain data as a separate JSON file, e.g. the diff index"""
+        self.queue.put(("file", label, path, data))
+
+    def finish(self, result: dict) -> None:
+        """Write any result keys that were not streamed as records, and mark the dump complete"""
+        for key, value in result.items():
+            self.write_record(key, value)
+        self.write_record("complete", True)
+        self.finished = True
+
+    def close(self, summary: dict = None) -> None:
+        """
+        Flush remaining entries and tell the writer to close the output.
+        Returns straight away; done is set once everything is on disk.
+
+        Args:
+            summary: Optional dump result to also write the mod data summary from
+        """
+        if self.closed:
+            return
+        self.flush_text()
+        if not self.finished:
+            self.write_record("complete", False)
+        self.closed = True
+        self.queue.put(("close", snapshot_value(summary) if summary is not None else None))
+        if self.thread is None:
+            self.run()
+
+    def wait(self, timeout: float = None) -> bool:
+        """Block until the writer is done, returning whether it finished in time"""
+        return self.done.wait(timeout)
+
+    def report(self) -> None:
+        """Print what the writer saved (or failed to save) - call on the game thread"""
+        for label, path in self.saved:
+            logging.info(f"[{MOD_NAME}] ✅ {label} saved to: {path}")
+            debug_log(f"{label} saved to: {path}", "INFO")
+        for error in self.errors:
+            logging.error(f"[{MOD_NAME}] ❌ Error writing dump files: {error}")
+            debug_log(f"Error writing dump files: {error}", "ERROR")
+        debug_log(f"Dump written: {self.lines_written} entries, {len(self.json_keys)} JSON records", "INFO")
+
+    def run(self) -> None:
+        """Writer thread body: format and write queued chunks until closed"""
+        output = self.output
+        try:
+            output.open()
+        except Exception as e:
+            self.errors.append(e)
+            output = None
+
+        while True:
+            op = self.queue.get()
+            try:
+                if op[0] == "text":
+                    if output is not None:
+                        output.write_items(op[1])
+                elif op[0] == "record":
+                    if output is not None:
+                        output.write_record(op[1], op[2])
+                elif op[0] == "file":
+                    with open(op[2], 'w', encoding='utf-8') as f:
+                        json.dump(op[3], f, separators=(',', ':'))
+                    self.saved.append((op[1], op[2]))
+                else:  # close
+                    if output is not None:
+                        self.saved.extend(output.close())
+                    if op[1] is not None:
+                        with open(self.summary_path, 'w', encoding='utf-8') as f:
+                            f.write(format_summary(op[1]))
+                        self.saved.append(("Mod data summary", self.summary_path))
+                    break
+            except Exception as e:
+                self.errors.append(e)
+                if op[0] == "close":
+                    break
+        self.done.set()
+
+def format_summary(result: dict) -> str:
+    """Format the mod data summary for a finished dump (pure - safe on the writer thread)"""
+    lines = [
+        "="*80,
+        "MOD DATA SCAN SUMMARY",
+        "Comprehensive scan inspired by bl3data extraction techniques",
+        "="*80,
+        "",
+    ]
     
-    mod_dir = get_mod_directory()
+    # Write mod scan findings
+    if "mod_scan_findings" in result:
+        lines.append("MOD-RELATED CLASSES FOUND:")
+        lines.append("-"*80)
+        for class_name, findings in result["mod_scan_findings"].items():
+            lines.append(f"\n{class_name}:")
+            lines.append(f"  Type: {findings['type']}")
+            if findings["inventory_related"]:
+                lines.append(f"  Inventory attributes: {len(findings['inventory_related'])}")
+            if findings["bank_related"]:
+                lines.append(f"  Bank attributes: {len(findings['bank_related'])}")
+            if findings["item_related"]:
+                lines.append(f"  Item attributes: {len(findings['item_related'])}")
+            if findings["balance_related"]:
+                lines.append(f"  Balance attributes: {len(findings['balance_related'])}")
+            if findings["serial_related"]:
+                lines.append(f"  Serial attributes: {len(findings['serial_related'])}")
+            lines.append(f"  Total methods: {len(findings['methods'])}")
+            lines.append(f"  Total properties: {len(findings['properties'])}")
+        lines.append("")
     
-    # Save text file
-    txt_path = os.path.join(mod_dir, OUTPUT_FILE)
-    try:
-        with open(txt_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(result["all_text"]))
-        logging.info(f"[{MOD_NAME}] ✅ Text dump saved to: {txt_path}")
-        debug_log(f"Text dump saved to: {txt_path}", "INFO")
-    except Exception as e:
-        logging.error(f"[{MOD_NAME}] ❌ Error saving text file: {e}")
-        debug_log(f"Error saving text file: {e}", "ERROR")
+    # Write serial data findings
+    if "serial_data_findings" in result and result["serial_data_findings"]:
+        lines.append("\nSERIAL NUMBER DATA FOUND:")
+        lines.append("-"*80)
+        for attr, data in result["serial_data_findings"].items():
+            lines.append(f"\n{attr}:")
+            lines.append(f"  Type: {data['type']}")
+            lines.append(f"  Callable: {data['callable']}")
+            if not data['callable']:
+                lines.append(f"  Preview: {data['value_preview']}")
+        lines.append("")
     
-    # Save JSON file with enhanced mod data
-    json_path = os.path.join(mod_dir, JSON_FILE)
-    try:
-        # Remove all_text from JSON (too large) but keep new scan data
-        json_result = {
-            k: v for k, v in result.items() 
-            if k != 'all_text'
-        }
+    lines.append("\n" + "="*80)
+    lines.append("For full details, see bank_structure_dump.txt and bank_structure_dump.json")
+    lines.append("="*80)
+    return "\n".join(lines) + "\n"
+
+# ==================== RESEARCH JOB ====================
+
+# Introspection work done per engine tick, in milliseconds
+RESEARCH_TICK_BUDGET_MS = 2.0
+# How often progress is printed to the console, in seconds
+RESEARCH_PROGRESS_INTERVAL = 2.0
+
+ACTIVE_RESEARCH_JOB = None  # The running ResearchJob, if any
+
+class ResearchJob:
+    """
+    Resumable research dump that does a bounded amount of work per engine tick.
+
+    Wraps iter_dump_events(): every step() pulls events and streams them to a
+    DumpSink until the tick's time budget is spent, then returns so the frame
+    can continue. The job keeps its generator, walker and sink between ticks,
+    so it picks up exactly where it left off. Once the walk is done the sink's
+    writer thread finishes the files in the background, and later steps only
+    check whether it is done before reporting. It can be cancelled at any
+    time; a cancelled dump is closed and marked incomplete, unless only the
+    writer was left, which is then waited for.
+    """
+
+    def __init__(self, budget_ms: float = None, profile: ScanProfile = None) -> None:
+        if budget_ms is None:
+            budget_ms = RESEARCH_TICK_BUDGET_MS
+        if profile is None:
+            profile = SCAN_PROFILES.get(CURRENT_SCAN_PROFILE, SCAN_PROFILES["Full"])
+        self.budget = budget_ms / 1000.0
+        self.profile = profile
+        self.result = new_dump_result()
+        mod_dir = get_mod_directory()
+        self.diff = DumpDiff(os.path.join(mod_dir, DIFF_INDEX_FILE), profile.name) if DIFF_DUMP_ENABLED else None
+        self.walker = profile.make_walker(diff=self.diff)
+        self.sink = DumpSink(mod_dir)
+        self.events = iter_dump_events(self.result, self.walker, profile)
+        self.steps = 0
+        self.ticks = 0
+        self.started_at = 0.0
+        self.last_progress = 0.0
+        self.done = False
+        self.writing = False
+        self.perf = PerfRun("research") if PERF_ENABLED else None
+
+    def start(self) -> None:
+        """Open the output files and record the start time"""
+        self.sink.open()
+        self.started_at = self.last_progress = time.perf_counter()
+        debug_log(f"Research job started (profile {self.profile.name}, budget {self.budget * 1000:.1f} ms/tick)", "INFO")
+
+    def step(self) -> bool:
+        """
+        Advance the dump until this tick's time budget is spent.
+
+        Returns:
+            True if there is more work left, False once the job has finished
+        """
+        if self.writing:
+            if not self.sink.done.is_set():
+                return True
+            self.complete()
+            return False
+        if self.done:
+            return False
         
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(json_result, f, indent=2, default=str)
-        logging.info(f"[{MOD_NAME}] ✅ JSON dump saved to: {json_path}")
-        debug_log(f"JSON dump saved to: {json_path}", "INFO")
-    except Exception as e:
-        logging.error(f"[{MOD_NAME}] ❌ Error saving JSON file: {e}")
-        debug_log(f"Error saving JSON file: {e}", "ERROR")
-    
-    # Save mod scan summary (new - inspired by bl3data's focused data extraction)
-    summary_path = os.path.join(mod_dir, "mod_data_summary.txt")
-    try:
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            f.write("="*80 + "\n")
-            f.write("MOD DATA SCAN SUMMARY\n")
-            f.write("Comprehensive scan inspired by bl3data extraction techniques\n")
-            f.write("="*80 + "\n\n")
-            
-            # Write mod scan findings
-            if "mod_scan_findings" in result:
-                f.write("MOD-RELATED CLASSES FOUND:\n")
-                f.write("-"*80 + "\n")
-                for class_name, findings in result["mod_scan_findings"].items():
-                    f.write(f"\n{class_name}:\n")
-                    f.write(f"  Type: {findings['type']}\n")
-                    if findings["inventory_related"]:
-                        f.write(f"  Inventory attributes: {len(findings['inventory_related'])}\n")
-                    if findings["bank_related"]:
-                        f.write(f"  Bank attributes: {len(findings['bank_related'])}\n")
-                    if findings["item_related"]:
-                        f.write(f"  Item attributes: {len(findings['item_related'])}\n")
-                    if findings["balance_related"]:
-                        f.write(f"  Balance attributes: {len(findings['balance_related'])}\n")
-                    if findings["serial_related"]:
-                        f.write(f"  Serial attributes: {len(findings['serial_related'])}\n")
-                    f.write(f"  Total methods: {len(findings['methods'])}\n")
-                    f.write(f"  Total properties: {len(findings['properties'])}\n")
-                f.write("\n")
-            
-            # Write serial data findings
-            if "serial_data_findings" in result and result["serial_data_findings"]:
-                f.write("\nSERIAL NUMBER DATA FOUND:\n")
-                f.write("-"*80 + "\n")
-                for attr, data in result["serial_data_findings"].items():
-                    f.write(f"\n{attr}:\n")
-                    f.write(f"  Type: {data['type']}\n")
-                    f.write(f"  Callable: {data['callable']}\n")
-                    if not data['callable']:
-                        f.write(f"  Preview: {data['value_preview']}\n")
-                f.write("\n")
-            
-            f.write("\n" + "="*80 + "\n")
-            f.write("For full details, see bank_structure_dump.txt and bank_structure_dump.json\n")
-            f.write("="*80 + "\n")
+        self.ticks += 1
+        with use_perf_run(self.perf):
+            deadline = time.perf_counter() + self.budget
+            try:
+                with perf_stage("dump walk"):
+                    while True:
+                        self.sink.emit(next(self.events))
+                        self.steps += 1
+                        if time.perf_counter() >= deadline:
+                            break
+            except StopIteration:
+                self.finish()
+                return True
+            except Exception as e:
+                self.fail(e)
+                return False
         
-        logging.info(f"[{MOD_NAME}] ✅ Mod data summary saved to: {summary_path}")
-        debug_log(f"Mod data summary saved to: {summary_path}", "INFO")
-    except Exception as e:
-        logging.error(f"[{MOD_NAME}] ❌ Error saving mod summary: {e}")
-        debug_log(f"Error saving mod summary: {e}", "ERROR")
+        now = time.perf_counter()
+        if now - self.last_progress >= RESEARCH_PROGRESS_INTERVAL:
+            self.last_progress = now
+            self.report_progress()
+        return True
+
+    def progress(self) -> dict:
+        """Get the current progress of the job"""
+        return {
+            "steps": self.steps,
+            "ticks": self.ticks,
+            "lines": self.sink.lines_written + len(self.sink.buffer),
+            "elapsed": time.perf_counter() - self.started_at,
+            **self.walker.stats(),
+        }
+
+    def report_progress(self) -> None:
+        """Print the current progress to the console"""
+        p = self.progress()
+        logging.info(f"[{MOD_NAME}] ⏳ Research: {p['steps']} steps, {p['objects']} objects, "
+                     f"{p['lines']} lines, {p['elapsed']:.1f}s (NumPad8 to cancel)")
+
+    def finish(self) -> None:
+        """Hand the rest of the dump and the summary to the writer thread after the walk completed"""
+        self.done = True
+        self.writing = True
+        self.events.close()
+        try:
+            with perf_stage("file save"):
+                self.sink.finish(self.result)
+                # A failed walk saw nothing, so keep the old index to diff against
+                if self.diff is not None and self.result["success"]:
+                    self.sink.write_file("Diff index", self.diff.path, self.diff.index())
+                self.sink.close(summary=self.result)
+                SCHEMA_CACHE.save()
+        except Exception as e:
+            self.result["success"] = False
+            self.result["error"] = str(e)
+            self.complete()
+
+    def complete(self) -> None:
+        """Report the finished dump once the writer thread is done"""
+        self.writing = False
+        self.sink.report()
+        if self.sink.errors:
+            self.result["success"] = False
+            self.result["error"] = str(self.sink.errors[0])
+        p = self.progress()
+        debug_log(f"Research job finished: {p['steps']} steps over {p['ticks']} ticks in {p['elapsed']:.2f}s", "INFO")
+        if self.perf is not None:
+            self.perf.counters.update(steps=p["steps"], ticks=p["ticks"], objects=p["objects"], lines=p["lines"])
+        finish_perf_run(self.perf)
+        report_research_result(self.result)
+
+    def fail(self, error: Exception) -> None:
+        """Close the dump as incomplete after an unexpected error"""
+        self.done = True
+        self.events.close()
+        self.result["success"] = False
+        self.result["error"] = str(error)
+        self.sink.write_record("error", str(error))
+        self.sink.close()
+        finish_perf_run(self.perf)
+        report_research_result(self.result)
+
+    def cancel(self) -> None:
+        """
+        Stop the job, keeping whatever was written so far.
+        Once the walk is over the files are only being flushed, so this waits
+        for the writer and reports the finished dump instead; otherwise a new
+        job could start writing the same files while the old writer still is.
+        """
+        if self.writing:
+            self.sink.wait()
+            self.complete()
+            return
+        if self.done:
+            return
+        self.done = True
+        self.events.close()
+        self.sink.write_record("error", "Cancelled")
+        self.sink.close()
+        finish_perf_run(self.perf)
+        logging.info(f"[{MOD_NAME}] ⏹ Research cancelled after {self.steps} steps (partial files kept)")
+        debug_log("Research job cancelled", "INFO")
+
+def report_research_result(result: dict) -> None:
+    """Print the outcome of a research dump to the console"""
+    if result["success"]:
+        logging.info(f"[{MOD_NAME}] ✅ Research complete!")
+        logging.info(f"[{MOD_NAME}] 📄 Check files in: {get_mod_directory()}")
+        output_files = make_dump_output("", DUMP_FORMAT).paths + [SUMMARY_FILE]
+        logging.info(f"[{MOD_NAME}] Files: {', '.join(output_files)}")
+        debug_log("Research completed successfully", "INFO")
+    else:
+        logging.error(f"[{MOD_NAME}] ❌ Research failed: {result.get('error', 'Unknown error')}")
+        debug_log(f"Research failed: {result.get('error', 'Unknown error')}", "ERROR")
+
+def cancel_research() -> bool:
+    """Cancel the running research job, returning whether there was one"""
+    global ACTIVE_RESEARCH_JOB
+    if ACTIVE_RESEARCH_JOB is None:
+        return False
+    ACTIVE_RESEARCH_JOB.cancel()
+    ACTIVE_RESEARCH_JOB = None
+    return True
+
+@hook("/Script/Engine.HUD:ReceiveDrawHUD", Type.POST)
+def research_tick(obj: UObject, args: WrappedStruct, ret: Any, func: BoundFunction) -> None:
+    """Advance the running research job once per frame"""
+    global ACTIVE_RESEARCH_JOB
+    if ACTIVE_RESEARCH_JOB is None:
+        return
+    if not ACTIVE_RESEARCH_JOB.step():
+        ACTIVE_RESEARCH_JOB = None
+
+# ==================== KEYBIND & BUTTON ====================
+
+# ==================== BANK SORT FUNCTIONS ====================
+
+# Built-in sort methods: each is a list of (field, direction) keys, compared in order.
+# "Boividevngu" is Vietnamese for "legendary/rare item" sorting - it prioritizes
+# high-rarity items first, then the highest level.
+# More methods can be added in sort_methods.json (see load_custom_sort_methods).
+SORT_METHODS = {
+    "Boividevngu": "rarity desc, level desc",
+    "By Rarity": "rarity desc",
+    "By Type": "type asc",
+    "By Name": "name asc",
+    "By Level": "level desc"
+}
+
+SORT_METHODS_FILE = "sort_methods.json"
+
+CURRENT_SORT_METHOD = "Boividevngu"  # Default sort method
+SORT_DRY_RUN = False  # Plan the reorder and report it, without moving anything
+
+# Candidate attribute names for each item field, in priority order, with the
+# type each value is converted to and the default used when nothing is found.
+ITEM_FIELD_CANDIDATES = {
+    "name": (["ItemName", "DisplayName", "InventoryName", "Name"], str, "Unknown"),
+    "rarity": (["Rarity", "ItemRarity", "RarityLevel"], int, 0),
+    "type": (["ItemType", "InventoryType", "Type", "CategoryDefinition"], str, "Unknown"),
+    "level": (["Level", "ItemLevel", "RequiredLevel"], int, 0),
+    "manufacturer": (["Manufacturer", "ManufacturerDefinition", "Brand"], str, "Unknown"),
+    "balance": (["BalanceState"], None, None),
+    "serial": (["SerialNumber", "InventorySerialNumber", "ItemSerialNumber", "Serial"], None, None),
+    # Inventory list entries (FInventoryListEntry) carry no serial, only a Handle
+    # that is unique within their list until the next map load
+    "handle": (["Handle"], None, None),
+}
+
+# Game definition classes that item fields point at (from the research dump), and
+# the attributes holding their display names. Items whose fields hold plain ints
+# or strings never use them.
+DEFINITION_CLASSES = {
+    "rarity": ["OakInventoryRarityData"],
+    "type": ["InventoryCategoryData", "WeaponTypeData"],
+    "manufacturer": ["OakManufacturerData"],
+}
+DEFINITION_NAME_ATTRS = ["DisplayName", "ManufacturerName", "TypeName"]
+
+# The grade number in a definition's object name, e.g. RarityData_05_Legendary -> 5
+DEFINITION_GRADE_PATTERN = re.compile(r"_(\d+)(?:_|$)")
+
+def get_definition_grade(name: str) -> int:
+    """Get the grade number from a definition's object name, or 0 if it has none"""
+    match = DEFINITION_GRADE_PATTERN.search(name)
+    return int(match.group(1)) if match else 0
+
+class DefinitionTable:
+    """
+    Converts item fields that point at game definition objects (rarities,
+    item types, manufacturers) into sort keys, without building the
+    definition's object path string.
+
+    Ranked fields (rarity) take the grade number from the definition's
+    object name, which is the game's own order (RarityData_01_Common ..
+    RarityData_05_Legendary) and the same in every session. Other fields
+    take the definition's short display name, for a StringTable. Both only
+    depend on the definition's name, so what the item cache stores for them
+    means the same thing in later sessions.
+
+    Each definition an item points at is memoized by object identity, so
+    every later item costs one dict lookup. The memo is dropped on map
+    change (see forget_objects).
+
+    Args:
+        field: Item field this table serves
+        class_names: Definition classes this field points at (see DEFINITION_CLASSES)
+        ranked: Map definitions to their grade (for int fields like rarity);
+                otherwise to their display name
+    """
+
+    def __init__(self, field: str, class_names: list, ranked: bool = False) -> None:
+        self.field = field
+        self.class_names = class_names
+        self.ranked = ranked
+        self.objects = {}     # definition object -> grade or display name
+
+    def resolve(self, definition: UObject) -> Any:
+        """Work out the grade or display name of a definition seen for the first time"""
+        name = str(definition.Name)
+        if DEBUG_ENABLED and get_class_name(definition.Class) not in self.class_names:
+            debug_log("%s definition %s is a %s, not one of %s", "DEBUG",
+                      self.field, name, get_class_name(definition.Class), self.class_names)
+        if self.ranked:
+            return get_definition_grade(name)
+        for attr_name in DEFINITION_NAME_ATTRS:
+            display_name = getattr(definition, attr_name, None)
+            if isinstance(display_name, str) and display_name:
+                return display_name
+        return name
+
+    def lookup(self, definition: UObject) -> Any:
+        """Get the grade or display name of a definition, memoized by identity"""
+        value = self.objects.get(definition)
+        if value is None:
+            value = self.objects[definition] = self.resolve(definition)
+        return value
+
+    def forget_objects(self) -> None:
+        """Drop the identity memo - the objects may be unloaded with the map"""
+        self.objects.clear()
+
+DEFINITION_TABLES = {
+    field: DefinitionTable(field, class_names, ranked=(ITEM_FIELD_CANDIDATES[field][1] is int))
+    for field, class_names in DEFINITION_CLASSES.items()
+}
+
+def get_item_class_key(item_obj: Any) -> Any:
+    """
+    Get the key identifying an item's layout.
+    UObjects are keyed by their UClass, WrappedStructs by their struct type.
+
+    Args:
+        item_obj: The item object
+
+    Returns:
+        The UClass/UScriptStruct of the item, or its Python type as a fallback
+    """
+    for attr_name in ("Class", "_type"):
+        try:
+            key = getattr(item_obj, attr_name)
+            if key is not None:
+                return key
+        except Exception:
+            continue
+    return type(item_obj)
+
+class ItemFieldResolver:
+    """
+    Class-aware cache of where each item field lives.
+
+    The first item of a class is probed against every candidate name in
+    ITEM_FIELD_CANDIDATES (or, if the schema cache already knows the class,
+    just checked against the cached names). The winning attribute name and
+    converter are remembered for that class, so every later item of the same
+    class costs exactly one direct read per field. All learned layouts are
+    dropped when the set of item classes seen in a pass changes.
+
+    Fields holding a game definition object are converted through their
+    DefinitionTable instead of the field's converter.
+    """
+
+    def __init__(self, candidates: dict, definitions: dict = None) -> None:
+        self.candidates = candidates
+        self.definitions = definitions or {}
+        # class key -> {field: (attr_name, convert_type) or None}
+        self.layouts = {}
+        self.class_set = frozenset()
+
+    def sync_classes(self, class_keys: Any) -> None:
+        """Drop all learned layouts if the item class set differs from the last pass"""
+        class_set = frozenset(class_keys)
+        if class_set != self.class_set:
+            if self.layouts:
+                debug_log("Item class set changed (%s -> %s), dropping %s cached layouts", "DEBUG", len(self.class_set), len(class_set), len(self.layouts))
+            self.layouts.clear()
+            self.class_set = class_set
+
+    def clear(self) -> None:
+        """Forget all learned layouts"""
+        self.layouts.clear()
+        self.class_set = frozenset()
+
+    def probe_field(self, item_obj: Any, field: str) -> Any:
+        """
+        Find which candidate attribute holds one field on an item.
+
+        Args:
+            item_obj: A representative item of the class
+            field: Field name from the candidates table
+
+        Returns:
+            (attr_name, convert_type), or None if the class has no such field
+        """
+        attr_names, convert_type, _ = self.candidates[field]
+        resolved = None
+        for attr_name in attr_names:
+            perf_count("getattr")
+            if not hasattr(item_obj, attr_name):
+                continue
+            perf_count("getattr")
+            value = getattr(item_obj, attr_name, None)
+            if value is None:
+                # Keep the first existing name in case other items fill it in
+                if resolved is None:
+                    resolved = (attr_name, convert_type)
+                continue
+            if isinstance(value, UObject) and field in self.definitions:
+                return (attr_name, convert_type)
+            if convert_type and not isinstance(value, convert_type):
+                try:
+                    convert_type(value)
+                except (ValueError, TypeError):
+                    continue
+            return (attr_name, convert_type)
+        return resolved
+
+    def probe(self, item_obj: Any, class_name: str) -> dict:
+        """
+        Learn the layout of an item's class.
+        Fields found in the schema cache are only verified; the rest are probed
+        against every candidate name and written back to the cache.
+
+        Args:
+            item_obj: A representative item of the class
+            class_name: Name of the item's class (the schema cache key)
+
+        Returns:
+            Dictionary mapping field name to (attr_name, convert_type), or None if absent
+        """
+        cached_fields = SCHEMA_CACHE.get(class_name, "fields", {})
+        fields = dict(cached_fields)
+        layout = {}
+        for field, (_, convert_type, _) in self.candidates.items():
+            if field in cached_fields:
+                attr_name = cached_fields[field]
+                if attr_name is None:
+                    layout[field] = None
+                    continue
+                if hasattr(item_obj, attr_name):
+                    layout[field] = (attr_name, convert_type)
+                    continue
+                debug_log("Cached field %s.%s -> %s no longer resolves", "DEBUG", class_name, field, attr_name)
+            resolved = self.probe_field(item_obj, field)
+            layout[field] = resolved
+            fields[field] = resolved[0] if resolved else None
+        if fields != cached_fields:
+            SCHEMA_CACHE.set(class_name, "fields", fields)
+        debug_log("Learned item layout for %s: %s", "DEBUG", class_name, layout)
+        return layout
+
+    def layout_for(self, item_obj: Any, class_key: Any = None) -> dict:
+        """Get the cached layout for an item's class, probing on first sight"""
+        if class_key is None:
+            class_key = get_item_class_key(item_obj)
+        layout = self.layouts.get(class_key)
+        if layout is None:
+            layout = self.probe(item_obj, get_class_name(class_key))
+            self.layouts[class_key] = layout
+        return layout
+
+    def read_field(self, item_obj: Any, layout: dict, field: str, strict: bool = False) -> Any:
+        """
+        Read one item field using a learned layout.
+
+        Args:
+            item_obj: The item object
+            layout: The layout of the item's class, from layout_for()
+            field: Field name from the candidates table
+            strict: Raise if the attribute can't be read, instead of returning the default
+
+        Returns:
+            The converted value, or the field's default if it is missing or unreadable
+        """
+        default_value = self.candidates[field][2]
+        resolved = layout.get(field)
+        if resolved is None:
+            return default_value
+        attr_name, convert_type = resolved
+        perf_count("getattr")
+        try:
+            value = getattr(item_obj, attr_name, None)
+        except Exception as e:
+            if strict:
+                raise
+            debug_log("Error reading %s: %s", "DEBUG", attr_name, e)
+            return default_value
+        if value is None:
+            return default_value
+        if isinstance(value, UObject):
+            table = self.definitions.get(field)
+            if table is not None:
+                try:
+                    return table.lookup(value)
+                except Exception as e:
+                    debug_log("Error ranking %s definition: %s", "DEBUG", field, e)
+                    return default_value
+        if convert_type and not isinstance(value, convert_type):
+            try:
+                return convert_type(value)
+            except (ValueError, TypeError):
+                return default_value
+        return value
+
+    def read(self, item_obj: Any, class_key: Any = None) -> dict:
+        """
+        Read every item field using the learned layout for its class.
+
+        Args:
+            item_obj: The item object
+            class_key: Optional precomputed result of get_item_class_key()
+
+        Returns:
+            Dictionary with one value per field (defaults where missing)
+        """
+        layout = self.layout_for(item_obj, class_key)
+        return {field: self.read_field(item_obj, layout, field) for field in self.candidates}
+
+ITEM_FIELD_RESOLVER = ItemFieldResolver(ITEM_FIELD_CANDIDATES, DEFINITION_TABLES)
+
+class StringTable:
+    """
+    Interned strings for one item field.
+
+    Records store a small integer id instead of the string. The table keeps
+    the alphabetical rank of every id in a list that is updated in place, so
+    compiled sort keys can hold on to it and index it directly.
+    """
+
+    def __init__(self) -> None:
+        self.names = []
+        self.ids = {}
+        self.ranks = []
+
+    def intern(self, value: str) -> int:
+        """Get the id for a string, assigning one on first sight"""
+        value_id = self.ids.get(value)
+        if value_id is None:
+            value_id = len(self.names)
+            self.names.append(sys.intern(value))
+            self.ids[value] = value_id
+        return value_id
+
+    def refresh_ranks(self) -> list:
+        """Recompute alphabetical ranks if strings were added since the last call"""
+        if len(self.ranks) != len(self.names):
+            ranks = [0] * len(self.names)
+            for rank, value_id in enumerate(sorted(range(len(self.names)), key=self.names.__getitem__)):
+                ranks[value_id] = rank
+            self.ranks[:] = ranks
+        return self.ranks
+
+    def order_ranks(self, order: list) -> list:
+        """
+        Rank every id by a custom order.
+        Listed values come first, in list order; the rest follow alphabetically.
+        """
+        alphabetical = self.refresh_ranks()
+        positions = {value: i for i, value in enumerate(order)}
+        return [positions.get(name, len(order) + alphabetical[i]) for i, name in enumerate(self.names)]
+
+ITEM_NAMES = StringTable()
+ITEM_TYPES = StringTable()
+ITEM_MANUFACTURERS = StringTable()
+
+# Marks an ItemRecord field that hasn't been read from the game yet
+UNREAD = object()
+
+class ItemRecord:
+    """
+    Compact, immutable record of one bank item.
+
+    Uses __slots__ instead of a per-item dict, and carries integer sort keys
+    (rarity_rank, level, and the name/type/manufacturer ids) so sorting
+    compares plain ints and tuples. Strings are interned and stored once in
+    ITEM_NAMES / ITEM_TYPES / ITEM_MANUFACTURERS.
+
+    Records made by from_object() are lazy: each field is read from the game
+    the first time it is asked for, then kept. A sort only reads its key
+    fields, so "By Level" touches one property per item.
+
+    serial is a fingerprint of the item's inventory serial (see
+    get_serial_key), which identifies the item across sorts and sessions.
+    """
+
+    __slots__ = ("object", "layout", "_name_id", "_rarity_rank", "_type_id", "_level", "_manufacturer_id", "_balance",
+                 "_serial")
+
+    # Fields written by to_dict() - live UObject references are never serialized
+    SERIALIZED_FIELDS = ("name", "rarity", "type", "level", "manufacturer", "serial")
+
+    # Item field -> (slot holding it, StringTable for interned strings or None)
+    FIELD_SLOTS = {
+        "name": ("_name_id", ITEM_NAMES),
+        "rarity": ("_rarity_rank", None),
+        "type": ("_type_id", ITEM_TYPES),
+        "level": ("_level", None),
+        "manufacturer": ("_manufacturer_id", ITEM_MANUFACTURERS),
+        "balance": ("_balance", None),
+    }
+
+    def __init__(self, name: str = "Unknown", rarity: int = 0, type_name: str = "Unknown", level: int = 0,
+                 manufacturer: str = "Unknown", balance: Any = None, obj: Any = None) -> None:
+        object.__setattr__(self, "object", obj)
+        object.__setattr__(self, "layout", None)
+        object.__setattr__(self, "_name_id", ITEM_NAMES.intern(name))
+        object.__setattr__(self, "_rarity_rank", rarity)
+        object.__setattr__(self, "_type_id", ITEM_TYPES.intern(type_name))
+        object.__setattr__(self, "_level", level)
+        object.__setattr__(self, "_manufacturer_id", ITEM_MANUFACTURERS.intern(manufacturer))
+        object.__setattr__(self, "_balance", balance)
+        object.__setattr__(self, "_serial", None)
+
+    @classmethod
+    def from_object(cls, obj: Any, layout: dict) -> "ItemRecord":
+        """Make a lazy record that reads its fields from obj on first use"""
+        record = cls.__new__(cls)
+        object.__setattr__(record, "object", obj)
+        object.__setattr__(record, "layout", layout)
+        for slot, _ in cls.FIELD_SLOTS.values():
+            object.__setattr__(record, slot, UNREAD)
+        object.__setattr__(record, "_serial", UNREAD)
+        return record
+
+    @classmethod
+    def from_cached(cls, row: tuple, serial: str, obj: Any, layout: dict) -> "ItemRecord":
+        """
+        Make a record from an ItemMetadataCache row. Fields the row holds are
+        not read from obj again; the others (None in the row) stay lazy.
+        """
+        record = cls.from_object(obj, layout)
+        for field, value in zip(ItemMetadataCache.COLUMNS, row):
+            if value is None:
+                continue
+            slot, table = cls.FIELD_SLOTS[field]
+            object.__setattr__(record, slot, table.intern(value) if table is not None else value)
+        object.__setattr__(record, "_serial", serial)
+        return record
+
+    def loaded_row(self) -> tuple:
+        """Get the ItemMetadataCache columns read so far, with None for the fields still unread"""
+        row = []
+        for field in ItemMetadataCache.COLUMNS:
+            slot, table = self.FIELD_SLOTS[field]
+            value = getattr(self, slot)
+            if value is UNREAD:
+                row.append(None)
+            else:
+                row.append(table.names[value] if table is not None else value)
+        return tuple(row)
+
+    def rebind(self, obj: Any, layout: dict) -> "ItemRecord":
+        """
+        Copy the record for another live object holding the same item.
+        Fields already read are kept, except the balance state, which is a
+        reference into the old object and is read again from the new one.
+        """
+        record = ItemRecord.__new__(ItemRecord)
+        for slot in self.__slots__:
+            object.__setattr__(record, slot, getattr(self, slot))
+        object.__setattr__(record, "object", obj)
+        object.__setattr__(record, "layout", layout)
+        object.__setattr__(record, "_balance", UNREAD)
+        return record
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ItemRecord is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("ItemRecord is immutable")
+
+    def __repr__(self) -> str:
+        return f"ItemRecord({self.name!r}, rarity={self.rarity_rank}, type={self.type!r}, level={self.level})"
+
+    def load(self, field: str) -> Any:
+        """Read one field from the game and keep it"""
+        slot, table = self.FIELD_SLOTS[field]
+        value = ITEM_FIELD_RESOLVER.read_field(self.object, self.layout, field)
+        if table is not None:
+            # Empty names/types/manufacturers keep their "Unknown" default
+            value = table.intern(value or "Unknown")
+        object.__setattr__(self, slot, value)
+        return value
+
+    @property
+    def name_id(self) -> int:
+        """Interned id of the item's name"""
+        value = self._name_id
+        return self.load("name") if value is UNREAD else value
+
+    @property
+    def rarity_rank(self) -> int:
+        """The item's rarity, as an int"""
+        value = self._rarity_rank
+        return self.load("rarity") if value is UNREAD else value
+
+    @property
+    def type_id(self) -> int:
+        """Interned id of the item's type"""
+        value = self._type_id
+        return self.load("type") if value is UNREAD else value
+
+    @property
+    def level(self) -> int:
+        """The item's level"""
+        value = self._level
+        return self.load("level") if value is UNREAD else value
+
+    @property
+    def manufacturer_id(self) -> int:
+        """Interned id of the item's manufacturer"""
+        value = self._manufacturer_id
+        return self.load("manufacturer") if value is UNREAD else value
+
+    @property
+    def balance(self) -> Any:
+        """The item's balance state"""
+        value = self._balance
+        return self.load("balance") if value is UNREAD else value
+
+    @property
+    def serial(self) -> Any:
+        """Fingerprint of the item's inventory serial, or None if it has none"""
+        value = self._serial
+        return self.load_serial() if value is UNREAD else value
+
+    def load_serial(self, strict: bool = False) -> Any:
+        """Read the serial fingerprint from the game and keep it (strict: raise if the read fails)"""
+        value = get_serial_key(ITEM_FIELD_RESOLVER.read_field(self.object, self.layout, "serial", strict))
+        object.__setattr__(self, "_serial", value)
+        return value
+
+    @property
+    def name(self) -> str:
+        """The item's name"""
+        return ITEM_NAMES.names[self.name_id]
+
+    @property
+    def rarity(self) -> int:
+        """The item's rarity"""
+        return self.rarity_rank
+
+    @property
+    def type(self) -> str:
+        """The item's type string"""
+        return ITEM_TYPES.names[self.type_id]
+
+    @property
+    def manufacturer(self) -> str:
+        """The item's manufacturer string"""
+        return ITEM_MANUFACTURERS.names[self.manufacturer_id]
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-friendly dict (without the live object references)"""
+        return {field: getattr(self, field) for field in self.SERIALIZED_FIELDS}
+
+    @classmethod
+    def from_dict(cls, data: dict, obj: Any = None) -> "ItemRecord":
+        """Rebuild a record from to_dict() output, optionally re-attaching its live object"""
+        record = cls(
+            name=data.get("name", "Unknown"),
+            rarity=data.get("rarity", 0),
+            type_name=data.get("type", "Unknown"),
+            level=data.get("level", 0),
+            manufacturer=data.get("manufacturer", "Unknown"),
+            obj=obj,
+        )
+        object.__setattr__(record, "_serial", data.get("serial"))
+        return record
+
+def get_serial_key(serial: Any) -> Any:
+    """
+    Turn a raw inventory serial into a stable, hashable fingerprint.
+
+    Args:
+        serial: The serial as read from the item - a string, bytes, int or struct
+
+    Returns:
+        A string that is the same across sessions - the serial itself when it
+        is already text, otherwise a short hex digest - or None if there is no serial
+    """
+    if serial is None:
+        return None
+    if isinstance(serial, str):
+        return serial or None
+    if isinstance(serial, (bytes, bytearray)):
+        return serial.hex() or None
+    text = safe_str(serial)
+    return content_digest(text) if text else None
+
+def get_handle_key(handle: Any) -> Any:
+    """Turn an entry's Handle (an int, or a struct wrapping one) into a hashable key, or None"""
+    handle = getattr(handle, "Handle", handle)
+    return handle if isinstance(handle, (int, str)) else None
+
+ITEM_CACHE_FILE = "item_cache.sqlite3"
+ITEM_CACHE_VERSION = 3        # Bump when the stored columns change (3: rarity grades from definition names)
+ITEM_CACHE_MAX_ITEMS = 20000  # Items kept; the least recently used are evicted past this
+
+class ItemMetadataCache:
+    """
+    Disk-backed cache of extracted item fields, kept across sessions.
+
+    A banked item never changes, so the name, rarity, type, level and
+    manufacturer behind a serial are stored in SQLite as they become known,
+    and later sorts - in this session or the next - only read an item's
+    serial to get them back. Only fields a sort has already read are stored
+    (the others are NULL), so storing never reads the game; a later sort that
+    reads more of them fills them in. The database is only touched by a worker thread:
+    warm() loads the most recently used entries into memory in the
+    background, store() queues new entries and last-use updates. Past
+    max_items, the least recently used entries are evicted on disk and in
+    memory. Worker errors are reported on the game thread by the next
+    store(). Without sqlite3 the cache stays empty and sorts read every item.
+    """
+
+    COLUMNS = ("name", "rarity", "type", "level", "manufacturer")
+
+    def __init__(self, file_name: str, max_items: int = ITEM_CACHE_MAX_ITEMS) -> None:
+        self.file_name = file_name
+        self.path = None
+        self.max_items = max_items
+        # serial -> row of COLUMNS, least recently used first; only the
+        # worker writes it before ready is set, only the game thread after
+        self.entries = collections.OrderedDict()
+        self.ready = threading.Event()
+        self.queue = queue.Queue()
+        self.thread = None
+        self.used = set()   # Serials hit since the last store()
+        self.errors = []
+        self.hits = 0
+
+    def warm(self) -> None:
+        """Start loading the cache in the background (once per session)"""
+        if sqlite3 is None or self.thread is not None:
+            return
+        self.path = os.path.join(get_mod_directory(), self.file_name)
+        self.queue.put(("warm",))
+        self.thread = threading.Thread(target=self.run, name=f"{MOD_NAME}-item-cache", daemon=True)
+        self.thread.start()
+
+    def get(self, serial: str) -> Any:
+        """Get the stored fields for a serial, or None if unknown or still warming"""
+        if not self.ready.is_set():
+            return None
+        row = self.entries.get(serial)
+        if row is not None:
+            self.entries.move_to_end(serial)
+            self.used.add(serial)
+            self.hits += 1
+        return row
+
+    def store(self, records: list) -> int:
+        """
+        Queue the fields of each item that the cache doesn't know yet, and the
+        last use of the items it does. Only fields already read are stored, so
+        do this after the sort to keep what the sort read.
+
+        Args:
+            records: ItemRecords from get_item_info()
+
+        Returns:
+            Number of new or updated items queued
+        """
+        for error in self.errors:
+            debug_log(f"Item cache error: {error}", "WARNING")
+        self.errors.clear()
+        if sqlite3 is None:
+            return 0
+        self.warm()
+        ready = self.ready.is_set()
+        rows = []
+        for record in records:
+            serial = record.serial
+            if serial is None:
+                continue
+            row = record.loaded_row()
+            known = self.entries.get(serial) if ready else None
+            if known is not None:
+                row = tuple(old if new is None else new for new, old in zip(row, known))
+                if row == known:
+                    continue
+            elif not any(value is not None for value in row):
+                continue
+            rows.append((serial, *row))
+            if ready:
+                self.entries[serial] = row
+        if ready:
+            while len(self.entries) > self.max_items:
+                self.entries.popitem(last=False)
+        if rows or self.used:
+            self.queue.put(("store", rows, list(self.used), time.time()))
+            self.used = set()
+        return len(rows)
+
+    def close(self) -> None:
+        """Write everything queued and stop the worker"""
+        if self.thread is None:
+            return
+        self.queue.put(("close",))
+        self.thread.join(timeout=5.0)
+        self.thread = None
+
+    def connect(self) -> Any:
+        """Open the database, recreating the table if it was written by another version"""
+        conn = sqlite3.connect(self.path)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != ITEM_CACHE_VERSION:
+            conn.execute("DROP TABLE IF EXISTS items")
+            conn.execute("CREATE TABLE items (serial TEXT PRIMARY KEY, name TEXT, rarity INTEGER, type TEXT, "
+                         "level INTEGER, manufacturer TEXT, last_used REAL)")
+            conn.execute("CREATE INDEX items_last_used ON items (last_used)")
+            conn.execute(f"PRAGMA user_version = {ITEM_CACHE_VERSION}")
+            conn.commit()
+        return conn
+
+    def run(self) -> None:
+        """Worker thread body: owns the database connection until closed"""
+        conn = None
+        while True:
+            op = self.queue.get()
+            if op[0] == "close":
+                break
+            try:
+                if conn is None:
+                    conn = self.connect()
+                if op[0] == "warm":
+                    rows = conn.execute("SELECT serial, name, rarity, type, level, manufacturer FROM items "
+                                        "ORDER BY last_used DESC LIMIT ?", (self.max_items,)).fetchall()
+                    self.entries = collections.OrderedDict((row[0], tuple(row[1:])) for row in reversed(rows))
+                else:  # store
+                    _, rows, used, now = op
+                    # Columns the new row doesn't know keep what is stored
+                    conn.executemany("INSERT INTO items VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (serial) DO UPDATE SET "
+                                     "name = COALESCE(excluded.name, name), rarity = COALESCE(excluded.rarity, rarity), "
+                                     "type = COALESCE(excluded.type, type), level = COALESCE(excluded.level, level), "
+                                     "manufacturer = COALESCE(excluded.manufacturer, manufacturer), "
+                                     "last_used = excluded.last_used",
+                                     [(*row, now) for row in rows])
+                    conn.executemany("UPDATE items SET last_used = ? WHERE serial = ?", [(now, serial) for serial in used])
+                    conn.execute("DELETE FROM items WHERE serial IN "
+                                 "(SELECT serial FROM items ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (self.max_items,))
+                    conn.commit()
+            except Exception as e:
+                self.errors.append(e)
+            finally:
+                # Even a failed warm-up lets sorts go on (reading every item)
+                if op[0] == "warm":
+                    self.ready.set()
+        if conn is not None:
+            conn.close()
+
+ITEM_CACHE = ItemMetadataCache(ITEM_CACHE_FILE)
+
+class ItemIndex:
+    """
+    Every item seen this map, keyed by its serial fingerprint.
+
+    Gives O(1) lookup of an item by serial, and lets get_item_info() reuse
+    the fields already extracted for an item instead of reading them from
+    the game again - a banked item's serial fixes its name, rarity, type,
+    level and manufacturer. The latest record for a serial replaces the old
+    one, so fields read by later sorts accumulate. Serials not seen yet this
+    session are looked up in the persistent cache, if one is given.
+
+    Items without a serial (the game's inventory list entries) are keyed by
+    (storage name, entry Handle) instead. Handles are only unique within one
+    list and only until the next map load, so these keys never reach the
+    persistent cache, and the index is cleared on every map change.
+    """
+
+    def __init__(self, cache: ItemMetadataCache = None) -> None:
+        self.cache = cache
+        self.records = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, key: Any) -> Any:
+        """Get the record for a serial fingerprint, or None"""
+        return self.records.get(key)
+
+    def lookup_serial(self, serial: Any) -> Any:
+        """Get the record for a raw serial value, or None"""
+        return self.records.get(get_serial_key(serial))
+
+    def resolve(self, record: ItemRecord, storage: str = None) -> ItemRecord:
+        """
+        Swap a fresh record for one reusing the fields known for its serial
+        (or its Handle in storage), and remember the result. Items with
+        neither are returned as is.
+
+        Raises:
+            Exception: If the serial or Handle can't be read from the game
+        """
+        key = record.load_serial(strict=True)
+        persistent = key is not None
+        if key is None:
+            handle = get_handle_key(ITEM_FIELD_RESOLVER.read_field(record.object, record.layout, "handle", True)) if storage else None
+            if handle is None:
+                return record
+            key = (storage, handle)
+        known = self.records.get(key)
+        if known is not None:
+            self.hits += 1
+            perf_count("item index hits")
+            record = known.rebind(record.object, record.layout)
+        else:
+            row = self.cache.get(key) if persistent and self.cache is not None else None
+            if row is not None:
+                perf_count("item cache hits")
+                record = ItemRecord.from_cached(row, key, record.object, record.layout)
+            else:
+                self.misses += 1
+        self.records[key] = record
+        return record
+
+    def clear(self) -> None:
+        """Forget every item"""
+        self.records.clear()
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def find_duplicates(records: list) -> dict:
+        """
+        Group records that share a serial - duplicated items.
+
+        Returns:
+            Dictionary mapping serial fingerprint to its records, only for serials seen more than once
+        """
+        by_serial = collections.defaultdict(list)
+        for record in records:
+            key = record.serial
+            if key is not None:
+                by_serial[key].append(record)
+        return {key: group for key, group in by_serial.items() if len(group) > 1}
+
+ITEM_INDEX = ItemIndex(ITEM_CACHE)
+
+def get_item_info(item_obj: Any, class_key: Any = None, storage: str = None) -> ItemRecord:
+    """
+    Extract item information from OakInventoryBalanceStateComponent object.
+    
+    Args:
+        item_obj: The inventory balance state component object
+        class_key: Optional precomputed result of get_item_class_key()
+        storage: Name of the storage the item is listed in (see STORAGE_SPECS),
+                 which lets items without a serial be indexed by their Handle
+
+    Returns:
+        Lazy ItemRecord - each field is read (one direct read, using the layout
+        learned for this item's class) only when something asks for it. Items
+        already in ITEM_INDEX reuse the fields read before.
 
-# ==================== KEYBIND & BUTTON ====================
+    Raises:
+        Exception: If the item can't be read - its layout can't be learned, or
+                   its serial or Handle read fails (e.g. a stale entry)
+    """
+    layout = ITEM_FIELD_RESOLVER.layout_for(item_obj, class_key)
+    info = ItemRecord.from_object(item_obj, layout)
+    if layout.get("serial") is not None or (storage and layout.get("handle") is not None):
+        info = ITEM_INDEX.resolve(info, storage)
+    return info
 
-# ==================== BANK SORT FUNCTIONS ====================
+# ==================== SORT ENGINE ====================
 
-SORT_METHODS = {
-    "Boividevngu": "boividevngu",
-    "By Rarity": "rarity",
-    "By Type": "type",
-    "By Name": "name",
-    "By Level": "level"
+# Sortable fields: name -> (ItemRecord attribute, StringTable for interned strings or None for ints)
+SORT_FIELDS = {
+    "rarity": ("rarity_rank", None),
+    "level": ("level", None),
+    "type": ("type_id", ITEM_TYPES),
+    "name": ("name_id", ITEM_NAMES),
+    "manufacturer": ("manufacturer_id", ITEM_MANUFACTURERS),
 }
 
-CURRENT_SORT_METHOD = "Boividevngu"  # Default sort method
-
-def get_first_valid_attr(obj: Any, attr_names: list, default_value: Any = None, convert_type: type = None) -> Any:
+class SortKeySpec:
     """
-    Get the first valid attribute from a list of possible attribute names.
-    
+    One key of a sort method: a field, a direction, and an optional rank table.
+
     Args:
-        obj: The object to get attributes from
-        attr_names: List of attribute names to try
-        default_value: Default value if no attribute is found
-        convert_type: Optional type to convert the value to
-        
-    Returns:
-        The first valid attribute value or default_value
+        field: One of SORT_FIELDS
+        descending: Sort this key from high to low
+        order: Optional list of string values ranked first, in this order
+               (only for string fields, e.g. a manufacturer or type order)
     """
-    for attr_name in attr_names:
-        if hasattr(obj, attr_name):
-            value = getattr(obj, attr_name, None)
-            if value is not None:
-                if convert_type:
-                    try:
-                        return convert_type(value) if not isinstance(value, convert_type) else value
-                    except (ValueError, TypeError):
-                        continue
-                return value
-    return default_value
 
-def get_item_info(item_obj: Any) -> dict:
+    def __init__(self, field: str, descending: bool = False, order: list = None) -> None:
+        if field not in SORT_FIELDS:
+            raise ValueError(f"Unknown sort field '{field}' (expected one of: {', '.join(SORT_FIELDS)})")
+        if order and SORT_FIELDS[field][1] is None:
+            raise ValueError(f"Sort field '{field}' is numeric and can't take an order list")
+        self.field = field
+        self.descending = descending
+        self.order = list(order) if order else None
+
+    def __repr__(self) -> str:
+        order = f" order={self.order}" if self.order else ""
+        return f"{self.field} {'desc' if self.descending else 'asc'}{order}"
+
+def parse_sort_spec(spec: Any) -> list:
     """
-    Extract item information from OakInventoryBalanceStateComponent object.
+    Parse a sort method definition into SortKeySpecs.
+
+    Accepts either a string like "type asc, rarity desc, level desc, name asc",
+    or a list whose entries are such strings or dicts of the form
+    {"field": "type", "direction": "asc", "order": ["Pistol", "Shotgun"]}.
+
+    Raises:
+        ValueError: If the definition is malformed
+    """
+    if isinstance(spec, str):
+        spec = [part for part in spec.split(",") if part.strip()]
+    if not isinstance(spec, list) or not spec:
+        raise ValueError(f"Sort method must be a non-empty string or list, got {spec!r}")
     
+    keys = []
+    for entry in spec:
+        if isinstance(entry, str):
+            words = entry.split()
+            field, direction, order = words[0], (words[1] if len(words) > 1 else "asc"), None
+        elif isinstance(entry, dict):
+            field = entry.get("field", "")
+            direction = entry.get("direction", "asc")
+            order = entry.get("order")
+        else:
+            raise ValueError(f"Invalid sort key {entry!r}")
+        if not isinstance(field, str) or not isinstance(direction, str):
+            raise ValueError(f"Sort field and direction must be strings, got {entry!r}")
+        if order is not None and not (isinstance(order, list) and all(isinstance(value, str) for value in order)):
+            raise ValueError(f"Sort order for {field} must be a list of strings, got {order!r}")
+        direction = direction.lower()
+        if direction not in ("asc", "desc"):
+            raise ValueError(f"Invalid sort direction '{direction}' for {field}")
+        keys.append(SortKeySpec(field.lower(), direction == "desc", order))
+    return keys
+
+# With NumPy, multi-key sorts of at least this many items are sorted from key
+# columns instead of a per-item key function (crossover measured with
+# bench/bench_sort_keys.py). Single-key sorts always use the key function: one
+# attribute read per item is already as cheap as filling a column. Without
+# NumPy every sort uses the key function - packing the columns into ints in
+# pure Python was no faster below ~50,000 items.
+COLUMNAR_SORT_MIN_ITEMS = 500
+
+def columnar_argsort(columns: list, descending: list) -> list:
+    """
+    Stable sort order of rows given as int key columns, through numpy.lexsort.
+    Ties keep their original order, exactly like sorted(). Needs NumPy.
+
     Args:
-        item_obj: The inventory balance state component object
-        
+        columns: One array('q') per key, most significant first
+        descending: Direction of each key
+
     Returns:
-        Dictionary with item information
-    """
-    info = {
-        "name": "Unknown",
-        "rarity": 0,
-        "type": "Unknown",
-        "level": 0,
-        "manufacturer": "Unknown",
-        "balance": None,
-        "object": item_obj
-    }
-    
-    try:
-        # Extract item information using helper function to reduce code duplication
-        name_val = get_first_valid_attr(item_obj, ["ItemName", "DisplayName", "InventoryName", "Name"], None, str)
-        if name_val:
-            info["name"] = name_val
-        
-        rarity_val = get_first_valid_attr(item_obj, ["Rarity", "ItemRarity", "RarityLevel"], 0, int)
-        info["rarity"] = rarity_val
-        
-        type_val = get_first_valid_attr(item_obj, ["ItemType", "InventoryType", "Type", "CategoryDefinition"], None, str)
-        if type_val:
-            info["type"] = type_val
-        
-        level_val = get_first_valid_attr(item_obj, ["Level", "ItemLevel", "RequiredLevel"], 0, int)
-        info["level"] = level_val
-        
-        mfr_val = get_first_valid_attr(item_obj, ["Manufacturer", "ManufacturerDefinition", "Brand"], None, str)
-        if mfr_val:
-            info["manufacturer"] = mfr_val
-        
-        # Get the balance component itself
-        if hasattr(item_obj, "BalanceState"):
-            info["balance"] = getattr(item_obj, "BalanceState", None)
+        Row indices in sorted order
+    """
+    keys = []
+    for column, desc in zip(columns, descending):
+        values = numpy.frombuffer(column, dtype=numpy.int64)
+        keys.append(-values if desc else values)
+    # lexsort treats its last key as the most significant
+    return numpy.lexsort(keys[::-1]).tolist()
+
+class CompiledSort:
+    """
+    A sort method compiled into a single key function.
+
+    When every key is numeric and shares one direction, the key is a plain
+    attrgetter and the direction becomes sorted()'s reverse flag. Otherwise
+    each key becomes an int (string fields through their rank tables, which
+    are refreshed in place before each sort) and descending keys are negated,
+    so one sorted() pass handles any mix of directions.
+
+    Long lists skip the key function: each key is read into an int column
+    and the order comes from columnar_argsort, which gives the same result.
+    """
+
+    def __init__(self, keys: list) -> None:
+        self.keys = keys
+        self.tables = []        # (StringTable, order, rank list) refreshed before each sort
+        self.reverse = False
+        self.key_func = self.compile()
+        self.column_getters = self.compile_columns()
+        self.tuple_key = len(keys) > 1 and not isinstance(self.key_func, attrgetter)
+
+    def compile(self) -> Any:
+        """Build the key function for this method"""
+        attrs = [SORT_FIELDS[k.field][0] for k in self.keys]
+        numeric = all(SORT_FIELDS[k.field][1] is None for k in self.keys)
+        one_direction = len({k.descending for k in self.keys}) == 1
+        if numeric and one_direction:
+            self.reverse = self.keys[0].descending
+            return attrgetter(*attrs)
         
-        debug_log(f"Extracted item info: {info['name']} (Rarity: {info['rarity']}, Type: {info['type']}, Level: {info['level']})", "DEBUG")
+        parts = []
+        for key, attr in zip(self.keys, attrs):
+            table = SORT_FIELDS[key.field][1]
+            getter = attrgetter(attr)
+            if table is not None:
+                ranks = []
+                self.tables.append((table, key.order, ranks))
+                getter = (lambda g, r: lambda item: r[g(item)])(getter, ranks)
+            if key.descending:
+                getter = (lambda g: lambda item: -g(item))(getter)
+            parts.append(getter)
         
+        if len(parts) == 1:
+            return parts[0]
+        return lambda item: tuple([part(item) for part in parts])
+
+    def compile_columns(self) -> list:
+        """Build one (attrgetter, rank list or None) per key, sharing compile()'s rank lists"""
+        tables = iter(self.tables)
+        getters = []
+        for key in self.keys:
+            attr, table = SORT_FIELDS[key.field]
+            getters.append((attrgetter(attr), next(tables)[2] if table is not None else None))
+        return getters
+
+    def refresh(self) -> None:
+        """Bring the rank tables up to date with every string interned so far"""
+        for table, order, ranks in self.tables:
+            ranks[:] = table.order_ranks(order) if order else table.refresh_ranks()
+
+    def load(self, records: list) -> None:
+        """
+        Read the string keys of every record before the rank tables are refreshed.
+        Lazy records intern a string the first time it is read, and a string
+        interned after refresh() would have no rank yet.
+        """
+        for getter, ranks in self.column_getters:
+            if ranks is not None:
+                collections.deque(map(getter, records), maxlen=0)
+
+    def columns(self, records: list) -> list:
+        """
+        Read every key of every record into one array('q') per key, with rank tables applied.
+
+        Raises:
+            TypeError/OverflowError: If a key value isn't a 64-bit int
+        """
+        raw = [array('q', map(getter, records)) for getter, _ in self.column_getters]
+        self.refresh()
+        return [array('q', map(ranks.__getitem__, column)) if ranks is not None else column
+                for column, (_, ranks) in zip(raw, self.column_getters)]
+
+    def sort_columnar(self, records: list) -> list:
+        """Sort records through their key columns (see columnar_argsort)"""
+        order = columnar_argsort(self.columns(records), [key.descending for key in self.keys])
+        return [records[idx] for idx in order]
+
+    def columnar_min_items(self) -> Any:
+        """Smallest list this method sorts from key columns, or None to always use the key function"""
+        if len(self.keys) == 1 or numpy is None:
+            return None
+        return COLUMNAR_SORT_MIN_ITEMS
+
+    def sort(self, records: list) -> list:
+        """Sort records in one sorted() pass, or from key columns for long multi-key lists"""
+        min_items = self.columnar_min_items()
+        if min_items is not None and len(records) >= min_items:
+            try:
+                return self.sort_columnar(records)
+            except (TypeError, OverflowError) as e:
+                debug_log(f"Columnar sort not possible ({e}), using the key function", "DEBUG")
+        self.load(records)
+        self.refresh()
+        return sorted(records, key=self.key_func, reverse=self.reverse)
+
+COMPILED_SORTS = {}  # method name -> CompiledSort
+
+def get_compiled_sort(method: str) -> CompiledSort:
+    """Get the compiled sort for a method name, compiling it on first use"""
+    compiled = COMPILED_SORTS.get(method)
+    if compiled is None:
+        compiled = CompiledSort(parse_sort_spec(SORT_METHODS[method]))
+        COMPILED_SORTS[method] = compiled
+        debug_log("Compiled sort method %s: %s", "DEBUG", method, compiled.keys)
+    return compiled
+
+def load_custom_sort_methods() -> None:
+    """
+    Add user-defined sort methods from sort_methods.json in the mod folder.
+
+    The file maps a method name to its definition (see parse_sort_spec), e.g.
+        {"Weapons First": "type asc, rarity desc, level desc, name asc"}
+    Invalid entries are skipped with a warning.
+    """
+    path = os.path.join(get_mod_directory(), SORT_METHODS_FILE)
+    if not os.path.exists(path):
+        return
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            custom_methods = json.load(f)
     except Exception as e:
-        debug_log(f"Error extracting item info: {e}", "DEBUG")
+        debug_log(f"Error loading {SORT_METHODS_FILE}: {e}", "WARNING")
+        return
+    if not isinstance(custom_methods, dict):
+        debug_log(f"Skipping {SORT_METHODS_FILE}: expected an object of name -> definition, "
+                  f"got {type(custom_methods).__name__}", "WARNING")
+        return
     
-    return info
+    for name, spec in custom_methods.items():
+        try:
+            parse_sort_spec(spec)
+        except ValueError as ve:
+            debug_log(f"Skipping sort method '{name}': {ve}", "WARNING")
+            continue
+        SORT_METHODS[name] = spec
+        COMPILED_SORTS.pop(name, None)
+        debug_log(f"Loaded custom sort method '{name}': {spec}", "INFO")
 
 def sort_items_by_method(items_info: list, method: str) -> list:
     """
     Sort items based on the selected method.
     
     Args:
-        items_info: List of item info dictionaries
-        method: Sort method name
+        items_info: List of ItemRecords
+        method: Sort method name (a key of SORT_METHODS)
         
     Returns:
-        Sorted list of item info dictionaries
+        Sorted list of ItemRecords
     """
-    debug_log(f"Sorting {len(items_info)} items using method: {method}", "DEBUG")
+    debug_log("Sorting %s items using method: %s", "DEBUG", len(items_info), method)
+    
+    if method not in SORT_METHODS:
+        # Default to Boividevngu method
+        debug_log("Using default sort (Boividevngu)", "DEBUG")
+        method = "Boividevngu"
     
     try:
-        # "Boividevngu" is Vietnamese for "legendary/rare item" sorting
-        # It prioritizes high-rarity items first, similar to "By Rarity"
-        # but could be extended with additional criteria in the future
-        if method == "Boividevngu":
-            # Primary: Sort by rarity (descending - legendary first)
-            # Secondary: Sort by level (descending - highest first)
-            sorted_items = sorted(items_info, key=lambda x: (x["rarity"], x["level"]), reverse=True)
-            debug_log(f"Sorted by Boividevngu: rarities/levels = {[(x['rarity'], x['level']) for x in sorted_items[:5]]}", "DEBUG")
-        elif method == "By Rarity":
-            # Sort by rarity only (descending - legendary first)
-            sorted_items = sorted(items_info, key=lambda x: x["rarity"], reverse=True)
-            debug_log(f"Sorted by rarity: rarities = {[x['rarity'] for x in sorted_items[:5]]}", "DEBUG")
-        elif method == "By Type":
-            # Sort by type alphabetically
-            sorted_items = sorted(items_info, key=lambda x: x["type"])
-            debug_log(f"Sorted by type: types = {[x['type'] for x in sorted_items[:5]]}", "DEBUG")
-        elif method == "By Name":
-            # Sort by name alphabetically
-            sorted_items = sorted(items_info, key=lambda x: x["name"])
-            debug_log(f"Sorted by name: names = {[x['name'] for x in sorted_items[:5]]}", "DEBUG")
-        elif method == "By Level":
-            # Sort by level (descending - highest first)
-            sorted_items = sorted(items_info, key=lambda x: x["level"], reverse=True)
-            debug_log(f"Sorted by level: levels = {[x['level'] for x in sorted_items[:5]]}", "DEBUG")
-        else:
-            # Default to Boividevngu method
-            sorted_items = sorted(items_info, key=lambda x: (x["rarity"], x["level"]), reverse=True)
-            debug_log(f"Using default sort (Boividevngu)", "DEBUG")
-        
+        compiled = get_compiled_sort(method)
+        sorted_items = compiled.sort(items_info)
+        if DEBUG_ENABLED:
+            fields = [k.field for k in compiled.keys]
+            preview = [tuple(getattr(x, f) for f in fields) for x in sorted_items[:5]]
+            debug_log(f"Sorted by {method}: {'/'.join(fields)} = {preview}", "DEBUG")
         return sorted_items
     except Exception as e:
         debug_log(f"Error sorting items: {e}", "ERROR")
         return items_info
 
-def sort_bank_items(method: str = "Boividevngu") -> None:
+# ==================== REORDER PLANNER ====================
+
+class ReorderPlan:
     """
-    Sort items in the bank based on the selected method.
+    The slot writes needed to turn the current bank order into the target order.
+
+    Built from the cycle decomposition of the permutation between the two
+    orders: items already in place are untouched, and each cycle of k
+    misplaced items costs exactly k slot writes. That is the minimum for an
+    array we write slot by slot, and an already-sorted bank costs zero.
+
+    Attributes:
+        writes: List of (index, object) slot assignments
+        cycles: Number of cycles among misplaced items
+        swaps: Equivalent pairwise swap count (misplaced items - cycles)
+    """
+
+    def __init__(self, writes: list, cycles: int) -> None:
+        self.writes = writes
+        self.cycles = cycles
+        self.swaps = len(writes) - cycles
+
+    def __len__(self) -> int:
+        return len(self.writes)
+
+    def __repr__(self) -> str:
+        return f"ReorderPlan({len(self.writes)} writes, {self.cycles} cycles, {self.swaps} swaps)"
+
+def plan_reorder(current: list, target: list) -> ReorderPlan:
+    """
+    Diff the current item order against the target order.
+
+    Items are matched by identity, since the target is built from the same
+    objects that were read out of the bank.
+
+    Args:
+        current: Items in their current bank order
+        target: The same items in the desired order
+
+    Returns:
+        ReorderPlan listing only the slots whose item changes
+
+    Raises:
+        ValueError: If target is not a permutation of current
+    """
+    if len(current) != len(target):
+        raise ValueError(f"Target has {len(target)} items, bank has {len(current)}")
+    
+    # Where each object currently sits (lists, in case the same object appears twice)
+    positions = {}
+    for idx, obj in enumerate(current):
+        positions.setdefault(id(obj), []).append(idx)
+    
+    # source[i] = current index of the item that belongs in slot i
+    source = [0] * len(target)
+    for idx, obj in enumerate(target):
+        slots = positions.get(id(obj))
+        if not slots:
+            raise ValueError(f"Target item at {idx} is not in the bank")
+        # Prefer leaving a duplicate where it already is
+        source[idx] = slots.pop(slots.index(idx) if idx in slots else 0)
+    
+    writes = []
+    cycles = 0
+    visited = [False] * len(target)
+    for start in range(len(target)):
+        if visited[start] or source[start] == start:
+            continue
+        cycles += 1
+        idx = start
+        while not visited[idx]:
+            visited[idx] = True
+            writes.append((idx, target[idx]))
+            idx = source[idx]
+    
+    return ReorderPlan(writes, cycles)
+
+def detach_entry(obj: Any) -> Any:
+    """
+    Copy a struct entry out of its array.
+    Structs read from a WrappedArray are views into the array's memory, so a
+    view of a slot that gets written changes with it. UObjects are references
+    and are returned as is.
+    """
+    if isinstance(obj, WrappedStruct):
+        return copy.copy(obj)
+    return obj
+
+def apply_reorder(owner: Any, items_attr: str, items_list: Any, plan: ReorderPlan, target: list) -> None:
+    """
+    Apply a reorder plan to the bank's item array.
+
+    Writes only the planned slots. Struct entries are views into the array,
+    and within a cycle the last write reads a slot that was already
+    overwritten, so every planned entry is copied out (see detach_entry)
+    before the first write. If the array can't be written per slot, falls
+    back to assigning a whole new list built from copies.
+
+    Args:
+        owner: Object that owns the items array
+        items_attr: Attribute name (or dotted path) the array was found under
+        items_list: The live items array
+        plan: Plan from plan_reorder
+        target: The full target order, read before any write
+    """
+    writes = [(idx, detach_entry(obj)) for idx, obj in plan.writes]
+    try:
+        for idx, obj in writes:
+            items_list[idx] = obj
+    except Exception as e:
+        debug_log(f"Per-slot writes failed on {items_attr} ({e}), assigning the whole list", "WARNING")
+        # Slots written before the failure already hold their target, so copies are taken from the plan
+        written = dict(writes)
+        set_attr_path(owner, items_attr,
+                      [written[idx] if idx in written else detach_entry(obj) for idx, obj in enumerate(target)])
+
+# ==================== INCREMENTAL AUTO-SORT ====================
+
+AUTO_SORT_ENABLED = False  # Keep the bank sorted as items are deposited and withdrawn
+
+def get_item_identity(item_obj: Any) -> Any:
+    """
+    Get a value that identifies the same bank entry across reads.
+    Struct entries are re-wrapped on every read, so they are identified by their Handle.
+    """
+    if isinstance(item_obj, UObject):
+        return item_obj
+    handle = getattr(item_obj, "Handle", None)
+    if handle is None:
+        return id(item_obj)
+    return getattr(handle, "Handle", handle)
+
+class SortedBankIndex:
+    """
+    A live mirror of a sorted bank, kept in sync one change at a time.
+
+    Holds the ItemRecord and identity of every slot. After a deposit or
+    withdrawal the changed slot is found by binary search over the mirror
+    (the entries before it are unchanged, the ones after it shifted by one),
+    and a deposited item is moved to its sorted position with one pop and
+    one insert on the array. Each change costs O(log n) engine reads
+    instead of a full re-read, re-sort and rewrite.
+
+    Args:
+        bank: The bank component
+        items_attr: Attribute name (or dotted path) of its items array
+        method: Sort method the bank is sorted by
+        records: ItemRecords in the order the bank was just written in
+    """
+
+    def __init__(self, bank: Any, items_attr: str, method: str, records: list) -> None:
+        self.bank = bank
+        self.items_attr = items_attr
+        self.items_list = get_attr_path(bank, items_attr)
+        self.method = method
+        self.compiled = get_compiled_sort(method)
+        # The records were read before the bank was rewritten, and struct entries are
+        # views of their old slots: point each one at the entry now in its slot
+        items_list = self.items_list
+        self.records = [record.rebind(items_list[idx], record.layout) for idx, record in enumerate(records)]
+        self.identities = [self.identity_at(idx) for idx in range(len(self.records))]
+        self.inserts = 0
+        self.removals = 0
+
+    def identity_at(self, idx: int) -> Any:
+        """Read the identity of the entry currently in a slot"""
+        return get_item_identity(self.items_list[idx])
+
+    def first_changed_slot(self, length: int) -> int:
+        """Binary search for the first slot whose entry differs from the mirror"""
+        lo, hi = 0, min(length, len(self.identities))
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.identity_at(mid) == self.identities[mid]:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def position_for(self, record: ItemRecord) -> int:
+        """Binary search for where a record belongs - after any equal keys, like a stable sort"""
+        compiled = self.compiled
+        compiled.load([record])
+        compiled.refresh()
+        key_func = compiled.key_func
+        key = key_func(record)
+        lo, hi = 0, len(self.records)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            other = key_func(self.records[mid])
+            if (other < key) if compiled.reverse else (other > key):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
+
+    def sync(self, verify: bool = False) -> bool:
+        """
+        Bring the mirror (and the bank order) up to date after one change.
+
+        Args:
+            verify: If the bank's length didn't change, compare every slot
+                    against the mirror to catch a reshuffle (one read per
+                    item). Only worth it for events on the bank itself.
+
+        Returns:
+            True if the bank is sorted and mirrored again, False if it changed
+            in some other way (several items at once, a reshuffle) and needs a full sort
+        """
+        length = len(self.items_list)
+        delta = length - len(self.records)
+        if delta == 0:
+            if not verify:
+                return True
+            return all(self.identity_at(idx) == identity for idx, identity in enumerate(self.identities))
+        if delta not in (1, -1):
+            return False
+        
+        slot = self.first_changed_slot(length)
+        if delta == -1:
+            # Withdrawal: everything after the removed slot shifted down by one
+            if slot < length and self.identity_at(slot) != self.identities[slot + 1]:
+                return False
+            del self.records[slot]
+            del self.identities[slot]
+            self.removals += 1
+            debug_log("Auto-sort: removed slot %s (%s items)", "DEBUG", slot, length)
+            return True
+        
+        # Deposit: everything after the new slot shifted up by one
+        if slot < len(self.records) and self.identity_at(slot + 1) != self.identities[slot]:
+            return False
+        item_obj = self.items_list[slot]
+        record = get_item_info(item_obj, storage="Bank")
+        identity = get_item_identity(item_obj)
+        target = self.position_for(record)
+        if target != slot:
+            # Struct entries are views into the array: move the entry pop() hands back,
+            # and point the record at its new slot
+            moved = self.items_list.pop(slot)
+            self.items_list.insert(target, moved)
+            record = record.rebind(self.items_list[target], record.layout)
+        self.records.insert(target, record)
+        self.identities.insert(target, identity)
+        self.inserts += 1
+        debug_log("Auto-sort: placed %s at slot %s (deposited at %s)", "DEBUG", record.name, target, slot)
+        return True
+
+BANK_INDEX = None  # SortedBankIndex of the local bank while auto-sort is on
+BANK_INDEX_FAILED = False  # A full sort couldn't mirror the bank; not retried until the map or settings change
+
+def build_bank_index(bank: Any, items_attr: str, method: str, sorted_items: list, unreadable: list) -> None:
+    """Start mirroring a freshly sorted bank, unless some of its items couldn't be read"""
+    global BANK_INDEX, BANK_INDEX_FAILED
+    if unreadable:
+        BANK_INDEX = None
+        BANK_INDEX_FAILED = True
+        debug_log(f"Auto-sort: {len(unreadable)} items couldn't be read, the bank won't be kept sorted", "WARNING")
+        return
+    BANK_INDEX = SortedBankIndex(bank, items_attr, method, sorted_items)
+    BANK_INDEX_FAILED = False
+    debug_log("Auto-sort: mirroring %s items of %s", "DEBUG", len(sorted_items), items_attr)
+
+def reset_bank_index() -> None:
+    """Forget the mirror and allow a new rebuild - after a map or settings change"""
+    global BANK_INDEX, BANK_INDEX_FAILED
+    BANK_INDEX = None
+    BANK_INDEX_FAILED = False
+
+def is_local_bank(obj: Any) -> bool:
+    """Check whether a hooked inventory list is the local player's bank"""
+    index = BANK_INDEX
+    if index is not None:
+        return obj == index.bank
+    pc = get_pc()
+    if not pc:
+        return False
+    bank, _ = OBJECT_INDEX.local_bank(pc)
+    return bank is not None and obj == bank
+
+def resync_bank_index(obj: Any = None) -> None:
+    """
+    Keep the bank sorted after an inventory change.
+
+    Changes on other inventory lists (e.g. the backpack) are ignored. Without
+    a mirror, only a change on the bank itself rebuilds it with a full sort,
+    and a rebuild that fails isn't retried until the map or settings change.
+
+    Args:
+        obj: The inventory list that changed, or None if the event doesn't
+             say (e.g. a PlayerController event)
+    """
+    global BANK_INDEX, BANK_INDEX_FAILED
+    if not AUTO_SORT_ENABLED:
+        return
+    index = BANK_INDEX
+    bank_event = obj is not None and is_local_bank(obj)
+    if index is not None:
+        if obj is not None and not bank_event:
+            return
+        try:
+            if index.method == CURRENT_SORT_METHOD and index.sync(verify=bank_event):
+                return
+        except Exception as e:
+            debug_log(f"Auto-sort sync failed: {e}", "WARNING")
+        BANK_INDEX = None
+    elif not bank_event or BANK_INDEX_FAILED:
+        return
+    debug_log("Auto-sort: rebuilding the bank index with a full sort", "DEBUG")
+    sort_bank_items(CURRENT_SORT_METHOD)
+    if BANK_INDEX is None:
+        BANK_INDEX_FAILED = True
+        debug_log("Auto-sort: couldn't mirror the bank, not retrying until the map or settings change", "WARNING")
+
+# Functions that add items to or take items from an inventory list, taken from the
+# research dump (OakInventoryListComponent and the PlayerController). Each hook only
+# triggers a resync; list events on other inventories (e.g. the backpack) are ignored.
+
+@hook("/Script/OakGame.OakInventoryListComponent:AddExternalItem", Type.POST)
+def on_inventory_add_external(obj: UObject, args: WrappedStruct, ret: Any, func: BoundFunction) -> None:
+    """An item was deposited into an inventory list"""
+    resync_bank_index(obj)
+
+@hook("/Script/OakGame.OakInventoryListComponent:AddItemFromPickup", Type.POST)
+def on_inventory_add_pickup(obj: UObject, args: WrappedStruct, ret: Any, func: BoundFunction) -> None:
+    """An item was added to an inventory list from a pickup"""
+    resync_bank_index(obj)
+
+@hook("/Script/OakGame.OakInventoryListComponent:GetAndConsumeItem", Type.POST)
+def on_inventory_consume(obj: UObject, args: WrappedStruct, ret: Any, func: BoundFunction) -> None:
+    """An item was taken out of an inventory list"""
+    resync_bank_index(obj)
+
+@hook("/Script/OakGame.OakPlayerController:ServerAddGearToInventory", Type.POST)
+def on_gear_added(obj: UObject, args: WrappedStruct, ret: Any, func: BoundFunction) -> None:
+    """Gear was moved into the player's inventory (e.g. withdrawn from the bank)"""
+    resync_bank_index()
+
+# ==================== STORAGE SORT ====================
+
+# Attribute names (or dotted paths) that may hold a storage's items, in priority order
+# OakInventoryListComponent (the pawn's BankInventoryList) keeps them in InventoryList.Items
+ITEMS_ATTR_NAMES = ["Items", "InventoryList.Items", "InventoryItems", "ItemList", "BankItems", "StorageItems"]
+
+# Storage sets the sort can cover, by option name (see STORAGE_SPECS)
+SORT_SCOPES = {
+    "Bank": ["Bank"],
+    "Bank + Backpack": ["Bank", "Backpack"],
+    "All Storage": ["Bank", "Backpack", "Lost Loot"],
+}
+
+CURRENT_SORT_SCOPE = "Bank"
+
+class SortContainer:
+    """
+    One storage taking part in a sort, and everything read from it.
+
+    Args:
+        name: Storage name (a key of STORAGE_SPECS)
+        owner: The storage object
+        class_name: Its class name
+        items_attr: Attribute name (or dotted path) of its items array
+        items_list: The live items array
+    """
+
+    __slots__ = ("name", "owner", "class_name", "items_attr", "items_list", "items",
+                 "items_info", "unreadable", "sorted_items", "sorted_objects", "plan")
+
+    def __init__(self, name: str, owner: Any, class_name: str, items_attr: str, items_list: Any) -> None:
+        self.name = name
+        self.owner = owner
+        self.class_name = class_name
+        self.items_attr = items_attr
+        self.items_list = items_list
+        self.items = list(items_list)
+        self.items_info = []
+        self.unreadable = []    # Items we couldn't read keep their relative order, after the sorted ones
+        self.sorted_items = []
+        self.sorted_objects = []
+        self.plan = None
+
+def resolve_sort_containers(pc: Any, storage_names: list) -> list:
+    """
+    Find the items array of each requested storage, in one pass.
+
+    Args:
+        pc: The local PlayerController
+        storage_names: Keys of STORAGE_SPECS, in the order to sort them
+
+    Returns:
+        A SortContainer for every storage that was found and holds an items list
+    """
+    specs = [STORAGE_SPECS[name] for name in storage_names if name in STORAGE_SPECS]
+    with perf_stage("storage lookup"):
+        storages = OBJECT_INDEX.local_storages(pc, specs)
+    
+    containers = []
+    for spec, owner, class_name in storages:
+        debug_log(f"Found {spec.name} component: {class_name}", "INFO")
+        logging.info(f"[{MOD_NAME}] ✅ Found {spec.name.lower()} component: {class_name}")
+        with perf_stage("items list"):
+            items_attr, items_list = resolve_items_attr(owner, class_name, ITEMS_ATTR_NAMES)
+        if not items_list:
+            debug_log(f"No items list found in {spec.name} component {class_name}", "WARNING")
+            logging.warning(f"[{MOD_NAME}] ⚠️ No items list found in {spec.name.lower()} component!")
+            continue
+        debug_log(f"Found items list in {class_name}.{items_attr}", "INFO")
+        logging.info(f"[{MOD_NAME}] ✅ Found items list: {items_attr}")
+        containers.append(SortContainer(spec.name, owner, class_name, items_attr, items_list))
+    return containers
+
+def extract_sort_containers(containers: list) -> int:
+    """
+    Read the item records of every container in one batched pass.
+
+    The item layouts are synced once against the class set of all the
+    containers together, so a backpack and a bank holding different item
+    classes share the learned layouts instead of dropping them for each other.
+
+    Args:
+        containers: SortContainers from resolve_sort_containers
+
+    Returns:
+        Number of items read
+    """
+    # Resolve each item's class once, and drop learned layouts if the class set changed
+    class_keys = []
+    for container in containers:
+        items = container.items
+        if items and isinstance(items[0], WrappedStruct):
+            # A struct array holds a single struct type, so one item gives every item's key
+            class_keys.append([get_item_class_key(items[0])] * len(items))
+        else:
+            class_keys.append([get_item_class_key(item_obj) for item_obj in items])
+    ITEM_FIELD_RESOLVER.sync_classes(key for keys in class_keys for key in keys)
     
+    total = 0
+    for container, keys in zip(containers, class_keys):
+        items_info = container.items_info
+        for idx, item_obj in enumerate(container.items):
+            try:
+                info = get_item_info(item_obj, keys[idx], container.name)
+                items_info.append(info)
+                if idx < 3 and DEBUG_ENABLED:  # Log first 3 items for debugging (reads every field)
+                    debug_log("%s item %s: %s (Rarity: %s)", "DEBUG", container.name, idx, info.name, info.rarity)
+            except Exception as e:
+                debug_log("Error getting info for %s item %s: %s", "DEBUG", container.name, idx, e)
+                container.unreadable.append(item_obj)
+        total += len(items_info)
+    return total
+
+def sort_storages(method: str = "Boividevngu", storage_names: list = None, dry_run: bool = None) -> None:
+    """
+    Sort several of the local player's storages as one batch.
+
+    Every storage is found in one lookup pass and read in one extraction
+    pass, then each is sorted with the same compiled method. All reorders
+    are planned before any slot is written, so a storage that can't be
+    planned leaves every storage untouched.
+
     Args:
-        method: Sort method name (Boividevngu, By Rarity, By Type, By Name, By Level)
+        method: Sort method name (a key of SORT_METHODS)
+        storage_names: Keys of STORAGE_SPECS (defaults to the current sort scope)
+        dry_run: Only report the planned moves (defaults to SORT_DRY_RUN)
     """
-    debug_log(f"sort_bank_items called with method: {method}", "INFO")
+    if dry_run is None:
+        dry_run = SORT_DRY_RUN
+    if storage_names is None:
+        storage_names = SORT_SCOPES.get(CURRENT_SORT_SCOPE, ["Bank"])
+    scope = " + ".join(storage_names)
+    debug_log(f"sort_storages called with method: {method}, storages: {scope}", "INFO")
     
+    run = start_perf_run(f"sort '{method}' ({scope})")
     try:
         pc = get_pc()
         if not pc:
@@ -835,95 +4044,75 @@ def sort_bank_items(method: str = "Boividevngu") -> None:
             logging.warning(f"[{MOD_NAME}] ⚠️ Please load into game first!")
             return
         
-        debug_log(f"PlayerController found, attempting to sort bank using '{method}' method", "DEBUG")
-        logging.info(f"[{MOD_NAME}] 🔄 Sorting bank items using '{method}' method...")
-        
-        # Find the bank component first (based on CopyLibrary save structures)
-        bank_component = None
-        found_bank_class = None
-        
-        # Priority: Look for bank container classes first
-        bank_container_names = ["OakBank", "BankInventory", "OakStorageComponent"]
-        
-        for class_name in bank_container_names:
-            try:
-                debug_log(f"Trying to find bank container: {class_name}", "DEBUG")
-                objects = unrealsdk.find_all(class_name)
-                if objects:
-                    bank_component = objects[0]  # Assume first one is the player's bank
-                    found_bank_class = class_name
-                    debug_log(f"Found bank component: {class_name}", "INFO")
-                    logging.info(f"[{MOD_NAME}] ✅ Found bank component: {class_name}")
-                    break
-            except ValueError as ve:
-                debug_log(f"Bank class {class_name} not found: {ve}", "DEBUG")
-                continue
-            except Exception as e:
-                debug_log(f"Error searching for bank {class_name}: {e}", "DEBUG")
-                continue
+        debug_log("PlayerController found, attempting to sort %s using '%s' method", "DEBUG", scope, method)
+        logging.info(f"[{MOD_NAME}] 🔄 Sorting {scope.lower()} items using '{method}' method...")
         
-        if not bank_component:
-            debug_log("No bank component found", "WARNING")
-            logging.warning(f"[{MOD_NAME}] ⚠️ No bank component found!")
+        # Find every storage's items list (object index rebuilt for this sort, schema cache)
+        OBJECT_INDEX.invalidate()
+        containers = resolve_sort_containers(pc, storage_names)
+        if not containers:
+            debug_log(f"No storage found for {scope}", "WARNING")
+            logging.warning(f"[{MOD_NAME}] ⚠️ No {scope.lower()} component found!")
             logging.warning(f"[{MOD_NAME}] Try pressing NumPad8 to dump structure and identify the correct class")
             return
         
-        # Try to get the inventory items list from the bank component
-        items_list = None
-        items_attr_names = ["Items", "InventoryItems", "ItemList", "BankItems", "StorageItems"]
-        
-        for attr_name in items_attr_names:
-            if hasattr(bank_component, attr_name):
-                try:
-                    items_list = getattr(bank_component, attr_name, None)
-                    if items_list is not None:
-                        debug_log(f"Found items list in {found_bank_class}.{attr_name}", "INFO")
-                        logging.info(f"[{MOD_NAME}] ✅ Found items list: {attr_name}")
-                        break
-                except Exception as e:
-                    debug_log(f"Error accessing {attr_name}: {e}", "DEBUG")
-                    continue
-        
-        if not items_list:
-            debug_log("No items list found in bank component", "WARNING")
-            logging.warning(f"[{MOD_NAME}] ⚠️ No items list found in bank component!")
-            logging.warning(f"[{MOD_NAME}] Check dump files for correct attribute name")
-            return
-        
-        # Extract item information from the list
-        items_info = []
-        for idx, item_obj in enumerate(items_list):
-            try:
-                info = get_item_info(item_obj)
-                items_info.append(info)
-                if idx < 3:  # Log first 3 items for debugging
-                    debug_log(f"Item {idx}: {info['name']} (Rarity: {info['rarity']})", "DEBUG")
-            except Exception as e:
-                debug_log(f"Error getting info for item {idx}: {e}", "DEBUG")
-                continue
+        # Extract item information from every list in one pass
+        with perf_stage("item extraction"):
+            total = extract_sort_containers(containers)
+        containers = [container for container in containers if container.items_info]
         
-        if not items_info:
+        if not containers:
             logging.warning(f"[{MOD_NAME}] ⚠️ Could not extract item information")
             logging.warning(f"[{MOD_NAME}] The items might use a different data structure")
             debug_log("No item information could be extracted", "WARNING")
             return
         
-        logging.info(f"[{MOD_NAME}] ✅ Extracted information from {len(items_info)} items")
+        logging.info(f"[{MOD_NAME}] ✅ Extracted information from {total} items")
+        if DEBUG_ENABLED and ITEM_INDEX:
+            duplicates = ItemIndex.find_duplicates([info for c in containers for info in c.items_info])
+            debug_log("Item index: %s items, %s reused, %s duplicated in %s", "INFO",
+                      len(ITEM_INDEX), ITEM_INDEX.hits, len(duplicates), scope)
+        SCHEMA_CACHE.save()
         
-        # Sort the items based on the selected method
-        sorted_items = sort_items_by_method(items_info, method)
+        # Sort the items of each storage based on the selected method
+        with perf_stage("sort"):
+            for container in containers:
+                container.sorted_items = sort_items_by_method(container.items_info, method)
+        perf_count("items", total)
         
-        # PHYSICALLY REORDER THE ITEMS IN THE BANK (new functionality)
-        debug_log("Attempting to reorder items in bank", "INFO")
+        # PHYSICALLY REORDER THE ITEMS IN EVERY STORAGE
+        # Every plan is made before the first write; only the slots whose item changes are written
+        debug_log("Attempting to reorder items in %s", "INFO", scope)
         try:
-            # Create new ordered list from sorted items
-            sorted_objects = [item['object'] for item in sorted_items]
+            with perf_stage("reorder plan"):
+                for container in containers:
+                    container.sorted_objects = [item.object for item in container.sorted_items] + container.unreadable
+                    container.plan = plan_reorder(container.items, container.sorted_objects)
+                    debug_log(f"Reorder plan for {container.name} ({len(container.items)} items): {container.plan}", "INFO")
+            writes = sum(len(container.plan) for container in containers)
+            perf_count("slot writes", 0 if dry_run else writes)
             
-            # Assign the sorted list back to the bank component
-            setattr(bank_component, items_attr_names[0], sorted_objects)  # Use first successful attr name
+            if not dry_run:
+                with perf_stage("reorder apply"):
+                    for container in containers:
+                        if container.plan:
+                            apply_reorder(container.owner, container.items_attr, container.items_list,
+                                          container.plan, container.sorted_objects)
             
-            logging.info(f"[{MOD_NAME}] ✅ Items reordered in bank!")
-            debug_log(f"Successfully reordered {len(sorted_objects)} items in bank", "INFO")
+            for container in containers:
+                name = container.name.lower()
+                moved, size = len(container.plan), len(container.items)
+                if not moved:
+                    logging.info(f"[{MOD_NAME}] ✅ {container.name} is already sorted, nothing to move")
+                elif dry_run:
+                    logging.info(f"[{MOD_NAME}] 🧪 Dry run: would move {moved} of {size} {name} items ({container.plan.swaps} swaps)")
+                else:
+                    logging.info(f"[{MOD_NAME}] ✅ Items reordered in {name}! ({moved} of {size} slots moved)")
+                    debug_log(f"Successfully reordered {moved} slots in {container.class_name}.{container.items_attr}", "INFO")
+                
+                if container.name == "Bank" and AUTO_SORT_ENABLED and not dry_run:
+                    build_bank_index(container.owner, container.items_attr, method,
+                                     container.sorted_items, container.unreadable)
             
         except Exception as e:
             logging.warning(f"[{MOD_NAME}] ⚠️ Could not reorder items automatically: {e}")
@@ -932,45 +4121,71 @@ def sort_bank_items(method: str = "Boividevngu") -> None:
         
         # Log the sorting result
         logging.info(f"[{MOD_NAME}] ✅ Items sorted using '{method}' method!")
-        logging.info(f"[{MOD_NAME}] 📋 Sort order summary (first 5):")
-        for idx, item in enumerate(sorted_items[:5]):
-            logging.info(f"[{MOD_NAME}]   {idx+1}. {item['name']} (Rarity: {item['rarity']}, Type: {item['type']}, Level: {item['level']})")
-        
-        debug_log(f"Bank sort '{method}' completed successfully", "INFO")
+        for container in containers:
+            logging.info(f"[{MOD_NAME}] 📋 {container.name} sort order summary (first 5):")
+            for idx, item in enumerate(container.sorted_items[:5]):
+                logging.info(f"[{MOD_NAME}]   {idx+1}. {item.name} (Rarity: {item.rarity}, Type: {item.type}, Level: {item.level})")
+
+        # Remember the fields this sort read for later sorts and sessions (no extra reads)
+        try:
+            with perf_stage("item cache"):
+                new_items = ITEM_CACHE.store([item for c in containers for item in c.sorted_items])
+            debug_log("Item cache: %s new or updated items queued, %s hits", "DEBUG", new_items, ITEM_CACHE.hits)
+        except Exception as e:
+            debug_log(f"Error updating item cache: {e}", "WARNING")
+
+        debug_log(f"Sort '{method}' of {scope} completed successfully", "INFO")
         
     except Exception as e:
         import traceback
-        error_msg = f"Error sorting bank: {e}"
+        error_msg = f"Error sorting {scope.lower()}: {e}"
         debug_log(error_msg, "ERROR")
         debug_log(f"Traceback: {traceback.format_exc()}", "ERROR")
         logging.error(f"[{MOD_NAME}] ❌ {error_msg}")
+    finally:
+        finish_perf_run(run)
+
+def sort_bank_items(method: str = "Boividevngu", dry_run: bool = None) -> None:
+    """
+    Sort items in the bank based on the selected method.
+    
+    Args:
+        method: Sort method name (a key of SORT_METHODS)
+        dry_run: Only report the planned moves (defaults to SORT_DRY_RUN)
+    """
+    sort_storages(method, ["Bank"], dry_run)
 
 @keybind("NumPadEight")
 def do_research() -> None:
-    """Keybind: NumPad8 to dump Bank structure"""
+    """Keybind: NumPad8 to start (or cancel) a Bank structure dump"""
+    global ACTIVE_RESEARCH_JOB
+    
+    # Pressing again while a dump is running cancels it
+    if cancel_research():
+        return
+    
     debug_log("NumPad8 pressed - starting Bank structure research", "INFO")
     logging.info(f"[{MOD_NAME}] 🔍 Starting Bank structure research...")
     logging.info(f"[{MOD_NAME}] ℹ    This will help identify which game classes exist for bank sorting")
-    logging.info(f"[{MOD_NAME}] Please wait...")
+    logging.info(f"[{MOD_NAME}] The dump runs in the background - keep playing, press NumPad8 again to cancel")
     
-    result = dump_player_controller()
-    save_dump_to_file(result)
+    job = ResearchJob()
+    try:
+        job.start()
+    except Exception as e:
+        report_research_result({"success": False, "error": str(e)})
+        return
     
-    if result["success"]:
-        logging.info(f"[{MOD_NAME}] ✅ Research complete!")
-        logging.info(f"[{MOD_NAME}] 📄 Check files in: {get_mod_directory()}")
-        logging.info(f"[{MOD_NAME}] Files: {OUTPUT_FILE}, {JSON_FILE}, {SUMMARY_FILE}")
-        debug_log("Research completed successfully", "INFO")
-    else:
-        logging.error(f"[{MOD_NAME}] ❌ Research failed: {result.get('error', 'Unknown error')}")
-        debug_log(f"Research failed: {result.get('error', 'Unknown error')}", "ERROR")
+    # The first slice runs right away so "not in game" errors are reported immediately
+    if job.step():
+        ACTIVE_RESEARCH_JOB = job
 
 @keybind("NumPadSeven")
 def do_bank_sort() -> None:
-    """Keybind: NumPad7 to sort Bank"""
-    debug_log(f"NumPad7 pressed - triggering bank sort with method: {CURRENT_SORT_METHOD}", "INFO")
-    logging.info(f"[{MOD_NAME}] 🔄 Attempting to sort bank with method: {CURRENT_SORT_METHOD}")
-    sort_bank_items(CURRENT_SORT_METHOD)
+    """Keybind: NumPad7 to sort Bank (and the other storages in the sort scope)"""
+    debug_log(f"NumPad7 pressed - triggering sort of {CURRENT_SORT_SCOPE} with method: {CURRENT_SORT_METHOD}", "INFO")
+    logging.info(f"[{MOD_NAME}] 🔄 Attempting to sort {CURRENT_SORT_SCOPE.lower()} with method: {CURRENT_SORT_METHOD}")
+    sort_storages(CURRENT_SORT_METHOD)
 
 def on_research_button(_: ButtonOption) -> None:
     """Button callback for manual research"""
@@ -992,18 +4207,73 @@ def on_debug_toggle(option: BoolOption, new_value: bool) -> None:
     else:
         debug_log("Debug mode disabled by user", "INFO")
         logging.info(f"[{MOD_NAME}] 🐛 Debug mode DISABLED")
+        if DEBUG_LOG_WRITER is not None:
+            DEBUG_LOG_WRITER.flush()
+
+def on_perf_toggle(option: BoolOption, new_value: bool) -> None:
+    """Toggle per-stage timers and counters on/off"""
+    global PERF_ENABLED
+    PERF_ENABLED = new_value
+    debug_log(f"Instrumentation set to: {new_value}", "INFO")
+    logging.info(f"[{MOD_NAME}] ⏱ Instrumentation {'ENABLED' if new_value else 'DISABLED'} (report: {PERF_REPORT_FILE})")
+
+def on_auto_sort_toggle(option: BoolOption, new_value: bool) -> None:
+    """Toggle incremental auto-sort on/off"""
+    global AUTO_SORT_ENABLED
+    AUTO_SORT_ENABLED = new_value
+    reset_bank_index()
+    debug_log(f"Auto-sort set to: {new_value}", "INFO")
+    logging.info(f"[{MOD_NAME}] 🔁 Auto-sort {'ENABLED' if new_value else 'DISABLED'}")
+    if new_value and get_pc():
+        sort_bank_items(CURRENT_SORT_METHOD)
 
 def on_sort_method_change(option: SpinnerOption, new_value: str) -> None:
     """Handle sort method change"""
-    global CURRENT_SORT_METHOD
+    global CURRENT_SORT_METHOD, BANK_INDEX_FAILED
     CURRENT_SORT_METHOD = new_value
+    BANK_INDEX_FAILED = False  # The new method gets a fresh rebuild attempt
     debug_log(f"Sort method changed to: {new_value}", "INFO")
     logging.info(f"[{MOD_NAME}] 🔄 Sort method set to: {new_value}")
 
+def on_sort_scope_change(option: SpinnerOption, new_value: str) -> None:
+    """Handle sort scope change"""
+    global CURRENT_SORT_SCOPE
+    CURRENT_SORT_SCOPE = new_value
+    debug_log(f"Sort scope changed to: {new_value}", "INFO")
+    logging.info(f"[{MOD_NAME}] 🗃 Sort scope set to: {new_value}")
+
+def on_dry_run_toggle(option: BoolOption, new_value: bool) -> None:
+    """Toggle sort dry-run mode"""
+    global SORT_DRY_RUN
+    SORT_DRY_RUN = new_value
+    debug_log(f"Sort dry run set to: {new_value}", "INFO")
+    logging.info(f"[{MOD_NAME}] 🧪 Sort dry run {'ENABLED' if new_value else 'DISABLED'}")
+
+def on_diff_dump_toggle(option: BoolOption, new_value: bool) -> None:
+    """Toggle differential research dumps"""
+    global DIFF_DUMP_ENABLED
+    DIFF_DUMP_ENABLED = new_value
+    debug_log(f"Differential dump set to: {new_value}", "INFO")
+    logging.info(f"[{MOD_NAME}] 🧮 Differential dump {'ENABLED' if new_value else 'DISABLED'}")
+
+def on_scan_profile_change(option: SpinnerOption, new_value: str) -> None:
+    """Handle scan profile change"""
+    global CURRENT_SCAN_PROFILE
+    CURRENT_SCAN_PROFILE = new_value
+    debug_log(f"Scan profile set to: {new_value}", "INFO")
+    logging.info(f"[{MOD_NAME}] 🧭 Scan profile set to: {new_value}")
+
+def on_dump_format_change(option: SpinnerOption, new_value: str) -> None:
+    """Handle research output format change"""
+    global DUMP_FORMAT
+    DUMP_FORMAT = new_value
+    debug_log(f"Research output format set to: {new_value}", "INFO")
+    logging.info(f"[{MOD_NAME}] 📄 Research output set to: {new_value}")
+
 def on_sort_button(_: ButtonOption) -> None:
     """Button callback for sorting bank"""
-    debug_log(f"Sort button pressed, using method: {CURRENT_SORT_METHOD}", "INFO")
-    sort_bank_items(CURRENT_SORT_METHOD)
+    debug_log(f"Sort button pressed, using method: {CURRENT_SORT_METHOD}, scope: {CURRENT_SORT_SCOPE}", "INFO")
+    sort_storages(CURRENT_SORT_METHOD)
 
 # ==================== OPTIONS ====================
 
@@ -1015,6 +4285,17 @@ debug_option = BoolOption(
     on_change=on_debug_toggle
 )
 
+perf_option = BoolOption(
+    "⏱ Record Timings",
+    value=False,
+    description=f"Time each stage of sorts and research dumps and count engine lookups. "
+                f"Each run is appended to {PERF_REPORT_FILE} next to debug.log.",
+    on_change=on_perf_toggle
+)
+
+# User-defined sort methods must be registered before the spinner lists its choices
+load_custom_sort_methods()
+
 sort_method_option = SpinnerOption(
     "🔄 Sort Method",
     value="Boividevngu",
@@ -1023,15 +4304,68 @@ sort_method_option = SpinnerOption(
     on_change=on_sort_method_change
 )
 
+sort_scope_option = SpinnerOption(
+    "🗃 Sort Scope",
+    value=CURRENT_SORT_SCOPE,
+    choices=list(SORT_SCOPES.keys()),
+    description="Storages sorted by NumPad7 and the sort button. They are found, read and "
+                "reordered together in one pass.",
+    on_change=on_sort_scope_change
+)
+
+dry_run_option = BoolOption(
+    "🧪 Sort Dry Run",
+    value=False,
+    description="Plan the sort and report how many items would move, without moving anything.",
+    on_change=on_dry_run_toggle
+)
+
+auto_sort_option = BoolOption(
+    "🔁 Auto-Sort Bank",
+    value=False,
+    description="Keep the bank sorted with the selected method: each deposit is moved "
+                "straight to its sorted slot instead of re-sorting the whole bank.",
+    on_change=on_auto_sort_toggle
+)
+
 sort_button = ButtonOption(
     "🔄 Sort Bank Now",
-    description="Sort bank items using the selected method (or press NumPad7)",
+    description="Sort the storages in the sort scope using the selected method (or press NumPad7)",
     on_press=on_sort_button
 )
 
+# User-defined scan profiles must be registered before the spinner lists its choices
+load_custom_scan_profiles()
+
+scan_profile_option = SpinnerOption(
+    "🧭 Scan Profile",
+    value=CURRENT_SCAN_PROFILE,
+    choices=list(SCAN_PROFILES.keys()),
+    description=f"Scope of the structure dump: which sections and classes are scanned, and how deep. "
+                f"Add your own profiles in {SCAN_PROFILES_FILE}.",
+    on_change=on_scan_profile_change
+)
+
+dump_format_option = SpinnerOption(
+    "📄 Research Output",
+    value=DUMP_FORMAT,
+    choices=list(DUMP_FORMATS.keys()),
+    description="File format of the structure dump. NDJSON and Binary write one record per "
+                "object/attribute, for streaming with tools/dump_reader.py.",
+    on_change=on_dump_format_change
+)
+
+diff_dump_option = BoolOption(
+    "🧮 Differential Dump",
+    value=False,
+    description=f"Only write the objects and attributes that were added, changed or removed "
+                f"since the last dump (compared against {DIFF_INDEX_FILE}).",
+    on_change=on_diff_dump_toggle
+)
+
 research_button = ButtonOption(
     "🔍 Dump Bank Structure",
-    description="Press to dump Bank/Inventory structure to files (or press NumPad8)",
+    description="Press to dump Bank/Inventory structure to files in the background (or press NumPad8). Press again to cancel.",
     on_press=on_research_button
 )
 
@@ -1039,23 +4373,39 @@ main_group = GroupedOption(
     "Bank Research",
     children=[
         debug_option,
+        perf_option,
         sort_method_option,
+        sort_scope_option,
+        dry_run_option,
+        auto_sort_option,
         sort_button,
+        scan_profile_option,
+        dump_format_option,
+        diff_dump_option,
         research_button,
     ]
 )
 
 # ==================== INITIALIZATION ====================
 
+def on_mod_disable() -> None:
+    """Stop background work when the mod is disabled"""
+    cancel_research()
+    SCHEMA_CACHE.save()
+    ITEM_CACHE.close()
+    if DEBUG_LOG_WRITER is not None:
+        DEBUG_LOG_WRITER.close()
+
 build_mod(
     options=[main_group],
+    on_disable=on_mod_disable,
 )
 
 logging.info("="*80)
 logging.info(f"[{MOD_NAME}] v{__version__} Loaded!")
 logging.info(f"[{MOD_NAME}] ℹ️ Press tilde (~) key twice to open console and see messages")
 logging.info(f"[{MOD_NAME}] Keybinds:")
-logging.info(f"[{MOD_NAME}]   NumPad7 - Sort Bank (current method: {CURRENT_SORT_METHOD})")
+logging.info(f"[{MOD_NAME}]   NumPad7 - Sort Bank (current method: {CURRENT_SORT_METHOD}, scope: {CURRENT_SORT_SCOPE})")
 logging.info(f"[{MOD_NAME}]   NumPad8 - Dump Bank Structure")
 logging.info(f"[{MOD_NAME}] 🐛 Debug mode: {'ENABLED' if DEBUG_ENABLED else 'DISABLED'} (toggle in options)")
 logging.info(f"[{MOD_NAME}] 📁 Available sort methods: {', '.join(SORT_METHODS.keys())}")
@@ -0,0 +1,87 @@
+"""
+Crossover benchmark for the columnar sort path.
+
+Times CompiledSort's key-function sort against its columnar sort (NumPy
+lexsort) on already-read item records, for every sort method and list
+size. For each method it reports the crossover: the smallest size from
+which the columnar path wins at every larger size. This sets
+COLUMNAR_SORT_MIN_ITEMS. Needs NumPy.
+
+Usage:
+    python bench/bench_sort_keys.py
+    python bench/bench_sort_keys.py --sizes 200,1000,5000 --repeat 7
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+from run_bench import load_mod
+from fake_world import World
+
+DEFAULT_SIZES = [100, 250, 500, 1000, 2000, 5000, 10000, 50000]
+
+# Benchmarked on top of the built-in methods: a custom method with mixed
+# directions and string keys, which uses the slowest (tuple) key function
+EXTRA_METHODS = {"Weapons First": "type asc, rarity desc, level desc, name asc"}
+
+def best_time(run: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of run over repeat calls, in milliseconds"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated list sizes (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per cell (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: %(default)s)")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    with tempfile.TemporaryDirectory(prefix="bankresearch-bench-") as work_dir:
+        mod = load_mod(work_dir)
+        if mod.numpy is None:
+            sys.exit("NumPy is not installed; without it every sort uses the key function")
+        world = World(items=max(sizes), fixture="", cycles=0, item_attrs=0, seed=args.seed)
+        records = [mod.get_item_info(item) for item in world.bank.Items]
+
+        crossovers = []
+
+        print(f"{'method':<14}{'items':>8}{'key function (ms)':>22}{'numpy columns (ms)':>22}")
+        mod.SORT_METHODS.update(EXTRA_METHODS)
+        for method in mod.SORT_METHODS:
+            compiled = mod.get_compiled_sort(method)
+            compiled.load(records)
+            compiled.refresh()
+            won = []
+            for size in sizes:
+                sample = records[:size]
+                def key_function() -> list:
+                    compiled.refresh()
+                    return sorted(sample, key=compiled.key_func, reverse=compiled.reverse)
+                key_time = best_time(key_function, args.repeat)
+                columns_time = best_time(lambda: compiled.sort_columnar(sample), args.repeat)
+                won.append(columns_time < key_time)
+                print(f"{method:<14}{size:>8}{key_time:>22.3f}{columns_time:>22.3f}")
+            # The crossover is the first size after the last one where the key function won
+            losses = [idx for idx, win in enumerate(won) if not win]
+            first_win = losses[-1] + 1 if losses else 0
+            crossovers.append((method, sizes[first_win] if first_win < len(sizes) else None))
+
+        print()
+        print(f"Threshold: COLUMNAR_SORT_MIN_ITEMS = {mod.COLUMNAR_SORT_MIN_ITEMS}")
+        for method, size in crossovers:
+            print(f"Crossover {method:<14} {f'{size} items' if size else 'never'}")
+        mod.on_mod_disable()
+
+if __name__ == "__main__":
+    main()
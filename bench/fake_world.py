@@ -0,0 +1,325 @@
+"""
+Synthetic Borderlands 3 object graph for the offline benchmark.
+
+Builds fake UObjects, structs and WrappedArrays on top of the stand-in
+unrealsdk in bench/fakes, and registers them so find_all() and get_pc()
+return them. Every attribute read on a fake object is counted in
+unrealsdk.COUNTERS["getattr"].
+
+The PlayerController, pawn and the scanned classes take their attribute
+names from bank_structure_dump.json (a real research dump), so dir() and
+the keyword filters see the same shape the mod sees in game.
+"""
+
+import copy
+import json
+import os
+import random
+from typing import Any
+
+import unrealsdk
+import mods_base
+from unrealsdk.unreal import UObject, UClass, WrappedStruct, WrappedArray, BoundFunction
+
+unrealsdk.COUNTERS.setdefault("getattr", 0)
+
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "bank_structure_dump.json")
+
+# Minimum attribute count for the PlayerController and pawn
+MIN_BIG_OBJECT_ATTRS = 600
+
+ITEM_TYPES = ["Pistol", "SMG", "Shotgun", "AssaultRifle", "SniperRifle", "Heavy", "Shield", "GrenadeMod", "ClassMod", "Artifact"]
+MANUFACTURERS = ["Atlas", "COV", "Dahl", "Hyperion", "Jakobs", "Maliwan", "Tediore", "Torgue", "Vladof", "Anshin", "Pangolin"]
+RARITIES = ["RarityData_01_Common", "RarityData_02_Uncommon", "RarityData_03_Rare", "RarityData_04_VeryRare",
+            "RarityData_05_Legendary"]
+
+class FakeClass(UClass):
+    """A UClass; only its Name is ever read"""
+
+    def __init__(self, name: str) -> None:
+        self.Name = name
+
+    def __repr__(self) -> str:
+        return f"Class'/Script/OakGame.{self.Name}'"
+
+class FieldsMixin:
+    """Attribute storage that counts every read and lists fields in dir()"""
+
+    def __getattr__(self, name: str) -> Any:
+        unrealsdk.COUNTERS["getattr"] += 1
+        fields = self.__dict__["_fields"]
+        if name in fields:
+            return fields[name]
+        raise AttributeError(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            self._fields[name] = value
+
+    def __dir__(self) -> list:
+        return list(self._fields)
+
+class FakeObject(FieldsMixin, UObject):
+    """A UObject with named fields"""
+
+    def __init__(self, cls: FakeClass, name: str, outer: "FakeObject" = None, fields: dict = None) -> None:
+        self._fields = {"Class": cls, "Name": name, "Outer": outer}
+        if fields:
+            self._fields.update(fields)
+
+    def __repr__(self) -> str:
+        return f"{self._fields['Class'].Name}'/Game/Maps/Fake.Fake:PersistentLevel.{self._fields['Name']}'"
+
+class FakeStructType:
+    """The struct type a WrappedStruct reports as _type"""
+
+    def __init__(self, name: str) -> None:
+        self.Name = name
+
+    def __repr__(self) -> str:
+        return f"ScriptStruct'/Script/OakGame.{self.Name}'"
+
+class FakeStruct(FieldsMixin, WrappedStruct):
+    """A WrappedStruct with named fields"""
+
+    def __init__(self, struct_type: FakeStructType, fields: dict = None) -> None:
+        self._fields = {"_type": struct_type}
+        if fields:
+            self._fields.update(fields)
+
+    def __dir__(self) -> list:
+        return [name for name in self._fields if name != "_type"]
+
+    def __repr__(self) -> str:
+        return "{" + ", ".join(f"{k}: {v!r}" for k, v in list(self._fields.items())[1:5]) + "}"
+
+    def __copy__(self) -> "FakeStruct":
+        return FakeStruct(self._fields["_type"], {k: v for k, v in self._fields.items() if k != "_type"})
+
+class FakeStructArray(WrappedArray):
+    """
+    A WrappedArray of structs with the game's semantics: reading a slot gives
+    a view of the struct in the array, and assigning a slot copies the
+    fields into it. Writing a view of one slot into another is only safe if
+    the source slot isn't overwritten first.
+    """
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            # The new entries are copied in; nothing else keeps them alive
+            list.__setitem__(self, index, [copy.copy(struct) for struct in value])
+            return
+        slot = list.__getitem__(self, index)
+        if slot is not value:
+            slot._fields.clear()
+            slot._fields.update(value._fields)
+
+    def pop(self, index: int = -1) -> FakeStruct:
+        # The removed entry is handed back as a copy; its memory is reused by the array
+        return copy.copy(list.pop(self, index))
+
+    def insert(self, index: int, value: Any) -> None:
+        list.insert(self, index, copy.copy(value))
+
+def load_fixture(path: str = DEFAULT_FIXTURE) -> dict:
+    """
+    Read attribute layouts from a research dump.
+
+    Returns:
+        class name -> {"methods": [...], "properties": {name: type string}},
+        plus "pc_attributes" -> the full PlayerController attribute list
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        dump = json.load(f)
+
+    layouts = {}
+    for class_name, findings in dump.get("mod_scan_findings", {}).items():
+        # Categorized entries carry the real type of the attribute
+        known_types = {}
+        for category in ("inventory_related", "bank_related", "item_related", "balance_related", "serial_related"):
+            for entry in findings.get(category, []):
+                known_types[entry["name"]] = entry["type"]
+        layouts[class_name] = {
+            "methods": list(findings.get("methods", [])),
+            "properties": {name: known_types.get(name, "") for name in findings.get("properties", [])},
+        }
+    layouts["pc_attributes"] = list(dump.get("pc_attributes", []))
+    return layouts
+
+class World:
+    """
+    A fake game world: a PlayerController, its pawn, a bank of N items, an
+    optional backpack and one object per scanned class.
+
+    Args:
+        items: Number of items in the bank
+        backpack: Number of items in the pawn's backpack (0 for no backpack)
+        definitions: Items point at rarity/category/manufacturer definition
+                     objects, like in game, instead of holding ints and strings
+        serials: Items carry a SerialNumber; without one they are identified by
+                 their Handle only, like the game's inventory list entries
+        fixture: Path to a research dump JSON, or None for purely synthetic layouts
+        cycles: Extra random references between sub-objects (on top of the
+                pc <-> pawn <-> bank back-references that always exist)
+        item_attrs: Padding attributes per item, besides the sortable fields
+        seed: Random seed, so runs are reproducible
+    """
+
+    def __init__(self, items: int = 500, fixture: str = DEFAULT_FIXTURE, cycles: int = 64,
+                 item_attrs: int = 24, seed: int = 0, backpack: int = 0, definitions: bool = False,
+                 serials: bool = True) -> None:
+        self.rnd = random.Random(seed)
+        self.serials = serials
+        self.layouts = load_fixture(fixture) if fixture else {}
+        self.classes = {}
+        self.sub_objects = []
+        self.bound_function = BoundFunction()
+
+        unrealsdk.OBJECTS.clear()
+        self.definitions = self.make_definitions() if definitions else None
+        self.pc = self.make_big_object("OakPlayerController", "BPCont_Player_C_0", None)
+        self.pawn = self.make_big_object("OakCharacter_Player", "BPChar_Player_C_0", self.pc)
+        self.bank = self.make_bank(items, item_attrs)
+        self.backpack = self.make_backpack(backpack, item_attrs) if backpack else None
+        self.link_cycles(cycles)
+        for class_name in self.layouts:
+            if class_name not in ("pc_attributes", "OakPlayerController", "OakCharacter_Player"):
+                self.make_big_object(class_name, f"{class_name}_0", self.pc, min_attrs=0)
+
+        mods_base.PC = self.pc
+
+    def get_class(self, name: str) -> FakeClass:
+        """Get the shared FakeClass for a class name"""
+        if name not in self.classes:
+            self.classes[name] = FakeClass(name)
+        return self.classes[name]
+
+    def register(self, obj: FakeObject) -> FakeObject:
+        """Make an object visible to find_all(), after its class default object"""
+        class_name = obj._fields["Class"].Name
+        objects = unrealsdk.OBJECTS.setdefault(class_name, [])
+        if not objects:
+            objects.append(FakeObject(obj._fields["Class"], f"Default__{class_name}"))
+        objects.append(obj)
+        return obj
+
+    def make_value(self, name: str, type_name: str, owner: FakeObject) -> Any:
+        """Make a plausible value for a property, from its dumped type if known"""
+        if not type_name:
+            if name.startswith("b") and name[1:2].isupper():
+                type_name = "bool"
+            else:
+                type_name = self.rnd.choice(["float", "int", "WrappedStruct", "WrappedArray", "UObject", "NoneType"])
+        if "bool" in type_name:
+            return self.rnd.random() < 0.5
+        if "float" in type_name:
+            return self.rnd.random() * 100
+        if "int" in type_name and "Point" not in type_name:
+            return self.rnd.randint(0, 1000)
+        if "str" in type_name:
+            return f"{name}_Value"
+        if "NoneType" in type_name:
+            return None
+        if "WrappedArray" in type_name:
+            struct_type = FakeStructType(f"{name}Entry")
+            return WrappedArray(FakeStruct(struct_type, {"Value": i, "Owner": owner}) for i in range(self.rnd.randint(0, 4)))
+        if "WrappedStruct" in type_name:
+            return FakeStruct(FakeStructType(name), {"X": 0.0, "Y": 0.0, "Z": 0.0, "Owner": owner})
+        if "UObject" in type_name or "UClass" in type_name:
+            sub = FakeObject(self.get_class(f"{name}Class"), f"{name}_0", owner,
+                             {f"Prop{i}": i for i in range(8)})
+            self.sub_objects.append(sub)
+            return sub
+        return None
+
+    def make_big_object(self, class_name: str, name: str, outer: Any, min_attrs: int = MIN_BIG_OBJECT_ATTRS) -> FakeObject:
+        """Make an object with the dumped layout of a class, padded to min_attrs attributes"""
+        obj = self.register(FakeObject(self.get_class(class_name), name, outer))
+        layout = self.layouts.get(class_name, {"methods": [], "properties": {}})
+        for method in layout["methods"]:
+            obj._fields[method] = self.bound_function
+        for prop, type_name in layout["properties"].items():
+            # Class, Name and Outer are dumped too; keep the real ones
+            if prop not in obj._fields:
+                obj._fields[prop] = self.make_value(prop, type_name, obj)
+        if class_name == "OakPlayerController":
+            for attr in self.layouts.get("pc_attributes", []):
+                if attr not in obj._fields:
+                    obj._fields[attr] = self.make_value(attr, "", obj)
+        for i in range(len(obj._fields), min_attrs):
+            obj._fields[f"SyntheticProperty{i}"] = self.make_value(f"SyntheticProperty{i}", "", obj)
+        return obj
+
+    def make_definitions(self) -> dict:
+        """Make the rarity, item type and manufacturer definition objects, reachable through find_all()"""
+        definitions = {}
+        # Class names as in the research dump
+        for field, class_name, names in (("Rarity", "OakInventoryRarityData", RARITIES),
+                                         ("ItemType", "InventoryCategoryData", ITEM_TYPES),
+                                         ("Manufacturer", "OakManufacturerData", MANUFACTURERS)):
+            cls = self.get_class(class_name)
+            definitions[field] = [self.register(FakeObject(cls, name, None, {"DisplayName": name.rpartition("_")[2]}))
+                                  for name in names]
+        return definitions
+
+    def make_item(self, struct_type: FakeStructType, index: int, item_attrs: int) -> FakeStruct:
+        """Make one bank entry with the fields the sort reads"""
+        rnd = self.rnd
+        fields = {
+            "ItemName": f"Item {index:05d}",
+            "Rarity": rnd.randint(1, 5),
+            "ItemType": rnd.choice(ITEM_TYPES),
+            "Level": rnd.randint(1, 72),
+            "Manufacturer": rnd.choice(MANUFACTURERS),
+            "BalanceState": FakeStruct(FakeStructType("InventoryBalanceStateInitializationData"), {"InventoryBalanceData": None}),
+            "Handle": index,
+            "SerialNumber": f"BL3({rnd.getrandbits(64):016X})",
+        }
+        if not self.serials:
+            del fields["SerialNumber"]
+        if self.definitions:
+            fields["Rarity"] = self.definitions["Rarity"][fields["Rarity"] - 1]
+            fields["ItemType"] = self.definitions["ItemType"][ITEM_TYPES.index(fields["ItemType"])]
+            fields["Manufacturer"] = self.definitions["Manufacturer"][MANUFACTURERS.index(fields["Manufacturer"])]
+        for i in range(item_attrs):
+            fields[f"Extra{i}"] = i
+        return FakeStruct(struct_type, fields)
+
+    def make_bank(self, items: int, item_attrs: int) -> FakeObject:
+        """Make the local player's bank, reachable from the pawn and through find_all()"""
+        struct_type = FakeStructType("InventoryListEntry")
+        bank = self.register(FakeObject(self.get_class("OakBank"), "OakBank_0", self.pc))
+        bank.Items = FakeStructArray(self.make_item(struct_type, i, item_attrs) for i in range(items))
+        bank.InventoryOwner = self.pawn
+        self.pawn.BankInventoryList = bank
+        self.pawn.Controller = self.pc
+        self.pc.Pawn = self.pawn
+        self.pc.BankInventory = bank
+        return bank
+
+    def make_backpack(self, items: int, item_attrs: int) -> FakeObject:
+        """Make the pawn's backpack, holding a different item struct type than the bank"""
+        struct_type = FakeStructType("OakInventoryItemEntry")
+        backpack = self.register(FakeObject(self.get_class("OakInventoryComponent"), "OakInventoryComponent_0", self.pawn))
+        backpack.Items = FakeStructArray(self.make_item(struct_type, i, item_attrs) for i in range(items))
+        self.pawn.OakCharacterInventory = backpack
+        return backpack
+
+    def link_cycles(self, cycles: int) -> None:
+        """Add random references between sub-objects, and back to the pc and pawn"""
+        targets = self.sub_objects + [self.pc, self.pawn, self.bank]
+        if not self.sub_objects:
+            return
+        for i in range(cycles):
+            source = self.rnd.choice(self.sub_objects)
+            source._fields[f"InventoryLink{i}"] = self.rnd.choice(targets)
+
+    def shuffle_bank(self) -> None:
+        """Put the bank (and the backpack, if any) back into a random order"""
+        for storage in (self.bank, self.backpack):
+            if storage is not None:
+                items = list(storage.Items)
+                self.rnd.shuffle(items)
+                storage.Items[:] = items
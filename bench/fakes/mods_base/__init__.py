@@ -0,0 +1,27 @@
+"""
+Offline stand-in for mods_base, used only by the benchmark harness.
+
+hook() and keybind() return the decorated function unchanged and
+build_mod() just records its arguments.
+"""
+
+__version_info__ = (1, 5)
+
+# The PlayerController returned by get_pc(), set by fake_world.World
+PC = None
+
+# Keyword arguments of the last build_mod() call
+BUILT: dict = {}
+
+def get_pc():
+    """Get the fake local PlayerController"""
+    return PC
+
+def hook(path: str, hook_type=None, *args, **kwargs):
+    def decorator(func):
+        func.hook_path = path
+        return func
+    return decorator
+
+def build_mod(**kwargs) -> None:
+    BUILT.update(kwargs)
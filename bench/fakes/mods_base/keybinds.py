@@ -0,0 +1,7 @@
+"""Offline stand-in for mods_base.keybinds"""
+
+def keybind(key: str, *args, **kwargs):
+    def decorator(func):
+        func.key = key
+        return func
+    return decorator
@@ -0,0 +1,24 @@
+"""Offline stand-in for mods_base.options"""
+
+class BaseOption:
+    def __init__(self, identifier: str, *args, **kwargs) -> None:
+        self.identifier = identifier
+        self.__dict__.update(kwargs)
+
+class ButtonOption(BaseOption):
+    pass
+
+class GroupedOption(BaseOption):
+    pass
+
+class BoolOption(BaseOption):
+    pass
+
+class SpinnerOption(BaseOption):
+    pass
+
+class SliderOption(BaseOption):
+    pass
+
+class DropdownOption(BaseOption):
+    pass
@@ -0,0 +1,31 @@
+"""
+Offline stand-in for pyunrealsdk, used only by the benchmark harness.
+
+Objects are registered per class name by bench/fake_world.py; find_all()
+returns them the way the real SDK does, and raises ValueError for classes
+that don't exist.
+"""
+
+from . import hooks, logging, unreal
+
+# class name -> list of objects, filled in by fake_world.World
+OBJECTS: dict = {}
+
+# Call counters, read by the benchmark between stages
+COUNTERS: dict = {"find_all": 0, "find_object": 0}
+
+def find_all(cls: str, exact: bool = True) -> list:
+    """Get every registered object of a class"""
+    COUNTERS["find_all"] += 1
+    if cls not in OBJECTS:
+        raise ValueError(f"Couldn't find class '{cls}'")
+    return list(OBJECTS[cls])
+
+def find_class(name: str) -> "unreal.UClass":
+    """Classes are never resolvable by name offline"""
+    raise ValueError(f"Couldn't find class '{name}'")
+
+def find_object(cls: str, name: str) -> "unreal.UObject":
+    """Named object lookup is never resolvable offline"""
+    COUNTERS["find_object"] += 1
+    raise ValueError(f"Couldn't find object '{name}'")
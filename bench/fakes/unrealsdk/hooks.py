@@ -0,0 +1,17 @@
+"""Offline stand-in for unrealsdk.hooks"""
+
+import enum
+
+class Type(enum.Enum):
+    PRE = enum.auto()
+    POST = enum.auto()
+    POST_UNCONDITIONAL = enum.auto()
+
+class Block:
+    pass
+
+def add_hook(*args, **kwargs) -> None:
+    pass
+
+def remove_hook(*args, **kwargs) -> None:
+    pass
@@ -0,0 +1,16 @@
+"""
+Offline stand-in for unrealsdk.logging.
+
+Console output is dropped by default so it doesn't skew timings; set
+VERBOSE to True to print it to stderr.
+"""
+
+import sys
+
+VERBOSE = False
+
+def _log(msg: str) -> None:
+    if VERBOSE:
+        print(msg, file=sys.stderr)
+
+info = warning = error = dev_warning = misc = _log
@@ -0,0 +1,32 @@
+"""
+Offline stand-in for unrealsdk.unreal.
+
+Only the types the mod checks with isinstance() are provided. The
+benchmark's fake objects (bench/fake_world.py) subclass these.
+"""
+
+class UObject:
+    pass
+
+class UClass(UObject):
+    pass
+
+class UFunction(UObject):
+    pass
+
+class WrappedStruct:
+    pass
+
+class WrappedArray(list):
+    pass
+
+class WrappedMulticastDelegate:
+    pass
+
+class BoundFunction:
+    def __init__(self, func: UFunction = None, obj: UObject = None) -> None:
+        self.func = func
+        self.obj = obj
+
+    def __call__(self, *args, **kwargs) -> None:
+        return None
@@ -0,0 +1,174 @@
+"""
+Offline benchmark for BankResearch.
+
+Loads the mod against the stand-in unrealsdk/mods_base in bench/fakes and
+times its hot paths on a synthetic world (see fake_world.py), without the game.
+
+Usage:
+    python bench/run_bench.py
+    python bench/run_bench.py --sizes 50,1000,10000 --repeat 5 --json results.json
+
+For every bank size, each stage reports its best wall time over --repeat
+runs, the peak memory it allocated (tracemalloc, measured in a separate run
+so tracing doesn't skew the timings) and how many attribute reads and
+find_all() calls it made.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(BENCH_DIR, "fakes"))
+sys.path.insert(0, BENCH_DIR)
+
+import unrealsdk
+from fake_world import World, DEFAULT_FIXTURE
+
+DEFAULT_SIZES = [50, 500, 2000, 10000]
+
+def load_mod(work_dir: str) -> Any:
+    """
+    Import a copy of the mod from work_dir, so schema_cache.json, debug.log
+    and the dump files are written there instead of into the repo.
+    """
+    package_dir = os.path.join(work_dir, "BankResearch")
+    os.makedirs(package_dir, exist_ok=True)
+    shutil.copy(os.path.join(REPO_DIR, "__init__.py"), os.path.join(package_dir, "__init__.py"))
+    spec = importlib.util.spec_from_file_location("BankResearch", os.path.join(package_dir, "__init__.py"),
+                                                  submodule_search_locations=[package_dir])
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["BankResearch"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+def measure(run: Callable[[], Any], setup: Callable[[], Any] = None, repeat: int = 3) -> dict:
+    """
+    Time a stage and record its peak memory and call counts.
+
+    Args:
+        run: The stage; its argument is whatever setup returned
+        setup: Called before every run, outside the timed region
+        repeat: Timed runs; the best one is reported
+
+    Returns:
+        {"seconds", "peak_kib", "getattr", "find_all"}
+    """
+    setup = setup or (lambda: None)
+    best = None
+    counts = None
+    for _ in range(repeat):
+        arg = setup()
+        before = dict(unrealsdk.COUNTERS)
+        start = time.perf_counter()
+        run(arg)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+            counts = {key: unrealsdk.COUNTERS[key] - before.get(key, 0) for key in ("getattr", "find_all")}
+
+    arg = setup()
+    tracemalloc.start()
+    try:
+        run(arg)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": best, "peak_kib": peak / 1024, **counts}
+
+def bench_size(mod: Any, items: int, args: argparse.Namespace, work_dir: str) -> dict:
+    """Run every stage against a fresh world with the given bank size"""
+    world = World(items=items, fixture=args.fixture, cycles=args.cycles,
+                  item_attrs=args.item_attrs, seed=args.seed, backpack=args.backpack,
+                  definitions=args.definitions)
+    mod.OBJECT_INDEX.invalidate()
+    mod.ITEM_FIELD_RESOLVER.clear()
+    stages = {}
+
+    stages["scan_for_mod_data"] = measure(lambda _: mod.scan_for_mod_data(world.pc, "PlayerController"),
+                                          repeat=args.repeat)
+
+    def dump(_: Any) -> None:
+        with mod.DumpSink(work_dir) as sink:
+            sink.finish(mod.dump_player_controller(sink))
+    stages["dump_player_controller"] = measure(dump, setup=mod.OBJECT_INDEX.invalidate, repeat=args.repeat)
+
+    bank_items = list(world.bank.Items)
+    def extract(_: Any) -> list:
+        return [mod.get_item_info(item, mod.get_item_class_key(item)) for item in bank_items]
+    stages["get_item_info"] = measure(extract, repeat=args.repeat)
+
+    records = extract(None)
+    stages["sort_items_by_method"] = measure(lambda _: mod.sort_items_by_method(records, args.method),
+                                             repeat=args.repeat)
+
+    stages["sort_bank_items"] = measure(lambda _: mod.sort_bank_items(args.method), setup=world.shuffle_bank,
+                                        repeat=args.repeat)
+
+    # Sorting an already-sorted bank: lookup and extraction only, no writes
+    stages["sort_bank_items (sorted)"] = measure(lambda _: mod.sort_bank_items(args.method), repeat=args.repeat)
+
+    if world.backpack is not None:
+        # One batched pass over both storages, against one sort per storage
+        storages = ["Bank", "Backpack"]
+        mod.sort_storages(args.method, storages)  # Read the backpack once, so neither stage pays for it
+        stages["sort_storages (batch)"] = measure(lambda _: mod.sort_storages(args.method, storages),
+                                                  setup=world.shuffle_bank, repeat=args.repeat)
+        def separately(_: Any) -> None:
+            for storage in storages:
+                mod.sort_storages(args.method, [storage])
+        stages["sort_storages (one by one)"] = measure(separately, setup=world.shuffle_bank, repeat=args.repeat)
+
+    return stages
+
+def print_table(results: dict) -> None:
+    """Print one block per bank size"""
+    for items, stages in results.items():
+        print(f"\n== {items} items ==")
+        print(f"{'stage':<28}{'time (ms)':>12}{'peak (KiB)':>14}{'getattr':>12}{'find_all':>10}")
+        for stage, stats in stages.items():
+            print(f"{stage:<28}{stats['seconds'] * 1000:>12.2f}{stats['peak_kib']:>14.1f}"
+                  f"{stats['getattr']:>12}{stats['find_all']:>10}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated bank sizes (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (default: %(default)s)")
+    parser.add_argument("--method", default="Boividevngu", help="Sort method (default: %(default)s)")
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE,
+                        help="Research dump used for object layouts; pass '' for synthetic only")
+    parser.add_argument("--cycles", type=int, default=64, help="Extra reference cycles (default: %(default)s)")
+    parser.add_argument("--item-attrs", type=int, default=24,
+                        help="Padding attributes per item (default: %(default)s)")
+    parser.add_argument("--backpack", type=int, default=0,
+                        help="Backpack items; also benchmarks sorting bank + backpack (default: %(default)s)")
+    parser.add_argument("--definitions", action="store_true",
+                        help="Items point at rarity/type/manufacturer definition objects, like in game")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: %(default)s)")
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="bankresearch-bench-") as work_dir:
+        mod = load_mod(work_dir)
+        results = {}
+        for items in (int(size) for size in args.sizes.split(",")):
+            results[items] = bench_size(mod, items, args, work_dir)
+        mod.on_mod_disable()
+
+    print_table(results)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+if __name__ == "__main__":
+    main()
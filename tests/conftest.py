@@ -0,0 +1,23 @@
+"""
+Shared fixtures: load the mod against the stand-in unrealsdk/mods_base in
+bench/fakes, in a temporary mod folder, like bench/run_bench.py does.
+"""
+
+import os
+import sys
+
+import pytest
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+BENCH_DIR = os.path.join(os.path.dirname(TESTS_DIR), "bench")
+sys.path.insert(0, os.path.join(BENCH_DIR, "fakes"))
+sys.path.insert(0, BENCH_DIR)
+
+from run_bench import load_mod
+
+@pytest.fixture
+def mod(tmp_path):
+    """A freshly imported copy of the mod, writing its files under tmp_path"""
+    module = load_mod(str(tmp_path))
+    yield module
+    module.on_mod_disable()
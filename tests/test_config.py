@@ -0,0 +1,43 @@
+"""User config files in the mod folder must never stop the mod from loading"""
+
+import json
+import os
+
+import pytest
+
+from run_bench import load_mod
+
+def load_with_file(tmp_path, file_name: str, data) -> object:
+    """Import the mod with a config file already in its folder"""
+    mod_dir = tmp_path / "BankResearch"
+    mod_dir.mkdir()
+    (mod_dir / file_name).write_text(json.dumps(data), encoding="utf-8")
+    return load_mod(str(tmp_path))
+
+@pytest.mark.parametrize("data", [
+    ["rarity desc"],
+    {"Bad Direction": [{"field": "rarity", "direction": None}], "Good": "level asc"},
+    {"Bad Field": [{"field": 5}], "Good": "level asc"},
+    {"Bad Order": [{"field": "type", "order": "Pistol"}], "Good": "level asc"},
+])
+def test_malformed_sort_methods_are_skipped(tmp_path, data):
+    mod = load_with_file(tmp_path, "sort_methods.json", data)
+    try:
+        assert not any(name.startswith("Bad") for name in mod.SORT_METHODS)
+        if isinstance(data, dict):
+            assert "Good" in mod.SORT_METHODS
+    finally:
+        mod.on_mod_disable()
+
+@pytest.mark.parametrize("data", [
+    [{"sections": ["bank"]}],
+    {"Bad Entry": ["bank"], "Bad Section": {"sections": ["nope"]}, "Good": {"sections": ["bank"]}},
+])
+def test_malformed_scan_profiles_are_skipped(tmp_path, data):
+    mod = load_with_file(tmp_path, "scan_profiles.json", data)
+    try:
+        assert not any(name.startswith("Bad") for name in mod.SCAN_PROFILES)
+        if isinstance(data, dict):
+            assert mod.SCAN_PROFILES["Good"].has("bank")
+    finally:
+        mod.on_mod_disable()
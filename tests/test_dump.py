@@ -0,0 +1,54 @@
+"""Research dump regressions"""
+
+import os
+
+from fake_world import World
+
+def diff_run(mod, work_dir, previous):
+    """Dump the PlayerController against a previous index and return the run's DumpDiff"""
+    diff = mod.DumpDiff(os.path.join(work_dir, mod.DIFF_INDEX_FILE))
+    diff.previous = previous
+    walker = mod.SCAN_PROFILES["Full"].make_walker(diff)
+    with mod.DumpSink(str(work_dir)) as sink:
+        sink.finish(mod.dump_player_controller(sink, walker))
+    return diff
+
+def test_diff_fingerprints_arrays_without_stringifying(mod, tmp_path, monkeypatch):
+    """Array and struct values are hashed element by element, never through safe_str()"""
+    world = World(items=200, seed=0)
+    previous = diff_run(mod, tmp_path, {}).current
+    safe_str = mod.safe_str
+    def no_containers(value):
+        assert not isinstance(value, (mod.WrappedArray, mod.WrappedStruct))
+        return safe_str(value)
+    monkeypatch.setattr(mod, "safe_str", no_containers)
+
+    stats = diff_run(mod, tmp_path, previous).stats()
+    assert stats["added"] == stats["changed"] == stats["removed"] == 0
+
+    world.bank.Items.append(mod.detach_entry(world.bank.Items[0]))
+    assert diff_run(mod, tmp_path, previous).stats()["changed"] == 1
+
+def test_cancel_while_writing_completes_the_job(mod, monkeypatch):
+    """Cancelling after the walk waits for the writer and reports the dump"""
+    World(items=50, seed=0)
+    reported = []
+    monkeypatch.setattr(mod, "report_research_result", reported.append)
+    job = mod.ResearchJob(budget_ms=1000)
+    job.start()
+    mod.ACTIVE_RESEARCH_JOB = job
+    while not job.writing:
+        assert job.step()
+    assert mod.cancel_research()
+    assert mod.ACTIVE_RESEARCH_JOB is None
+    assert job.sink.done.is_set() and not job.writing
+    assert reported and reported[0]["success"]
+
+def test_map_change_cancels_research(mod):
+    """A research job doesn't outlive the map its objects belong to"""
+    World(items=50, seed=0)
+    job = mod.ResearchJob(budget_ms=0)
+    job.start()
+    mod.ACTIVE_RESEARCH_JOB = job
+    mod.on_map_change(None, None, None, None)
+    assert mod.ACTIVE_RESEARCH_JOB is None and job.done
@@ -0,0 +1,25 @@
+"""Object lookup regressions"""
+
+import pytest
+
+from fake_world import FakeObject, World
+
+def test_objects_spawned_later_are_found_by_the_next_action(mod):
+    """A class missing during one action is looked up again by the next, and never persisted"""
+    world = World(items=10, fixture="")
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            mod.OBJECT_INDEX.find("OakLostLootMachine")
+    assert mod.OBJECT_INDEX.queries == 1
+    machine = world.register(FakeObject(world.get_class("OakLostLootMachine"), "OakLostLootMachine_0", world.pc))
+    mod.sort_storages("Boividevngu", ["Lost Loot"], dry_run=True)
+    assert machine in mod.OBJECT_INDEX.find("OakLostLootMachine")
+    assert "OakLostLootMachine" not in mod.SCHEMA_CACHE.classes()
+
+def test_map_change_drops_found_objects(mod):
+    """The map change hook still invalidates the index between actions"""
+    World(items=10, fixture="")
+    with pytest.raises(ValueError):
+        mod.OBJECT_INDEX.find("LateLoadedBank")
+    mod.on_map_change(None, None, None, None)
+    assert not mod.OBJECT_INDEX.missing
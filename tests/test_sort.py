@@ -0,0 +1,169 @@
+"""Sort engine regressions"""
+
+import pytest
+
+from fake_world import FakeStruct, FakeStructType, World
+
+def test_string_keys_of_unseen_items_are_ranked(mod):
+    """Type/name strings first interned during the sort still get a rank"""
+    world = World(items=200, fixture="")
+    for method, field in (("By Type", "type"), ("By Name", "name")):
+        records = [mod.get_item_info(item) for item in world.bank.Items]
+        sorted_records = mod.sort_items_by_method(records, method)
+        values = [getattr(record, field) for record in sorted_records]
+        assert values == sorted(values)
+        world.shuffle_bank()
+
+def test_definition_fields_rank_by_game_data(mod):
+    """Rarity definitions sort by their grade whatever order they are first seen in"""
+    world = World(items=300, fixture="", definitions=True)
+    items = list(world.bank.Items)
+    for order in (items, items[::-1]):
+        mod.on_map_change(None, None, None, None)
+        records = [mod.get_item_info(item) for item in order]
+        for record, item in zip(records, order):
+            assert record.rarity == int(item.Rarity.Name.split("_")[1])
+            assert record.type == item.ItemType.DisplayName
+            assert record.manufacturer == item.Manufacturer.DisplayName
+    sorted_records = mod.sort_items_by_method(records, "By Rarity")
+    rarities = [record.rarity for record in sorted_records]
+    assert rarities == sorted(rarities, reverse=True)
+
+def test_reorder_keeps_every_struct_entry(mod):
+    """Slot writes from struct views must not duplicate or lose items"""
+    world = World(items=300, fixture="")
+    world.shuffle_bank()
+    handles = sorted(item.Handle for item in world.bank.Items)
+    mod.sort_bank_items("Boividevngu", dry_run=False)
+    items = list(world.bank.Items)
+    assert sorted(item.Handle for item in items) == handles
+    keys = [(item.Rarity, item.Level) for item in items]
+    assert keys == sorted(keys, reverse=True)
+
+def test_auto_sort_deposit_keeps_bank_sorted(mod):
+    """A deposit is moved into place and mirrored by the entry now in that slot"""
+    world = World(items=100, fixture="")
+    mod.AUTO_SORT_ENABLED = True
+    mod.sort_bank_items("Boividevngu", dry_run=False)
+    index = mod.BANK_INDEX
+    assert index is not None
+    items = world.bank.Items
+    deposit = world.make_item(FakeStructType("InventoryListEntry"), 1000, 0)
+    deposit.Rarity, deposit.Level = 3, 36
+    items.append(deposit)
+    mod.resync_bank_index(world.bank)
+    assert mod.BANK_INDEX is index
+    keys = [(item.Rarity, item.Level) for item in items]
+    assert keys == sorted(keys, reverse=True)
+    assert index.identities == [item.Handle for item in items]
+    target = index.identities.index(1000)
+    assert index.records[target].object is items[target]
+
+def test_auto_sort_detects_reshuffle(mod):
+    """A bank event that leaves the length unchanged still catches a reshuffle"""
+    world = World(items=100, fixture="")
+    mod.AUTO_SORT_ENABLED = True
+    mod.sort_bank_items("Boividevngu", dry_run=False)
+    index = mod.BANK_INDEX
+    assert index.sync(verify=True)
+    items = world.bank.Items
+    items[0], items[-1] = mod.detach_entry(items[-1]), mod.detach_entry(items[0])
+    assert not index.sync(verify=True)
+
+def test_auto_sort_ignores_other_inventories(mod, monkeypatch):
+    """Backpack events never trigger a full sort, and a failed rebuild isn't retried"""
+    world = World(items=50, fixture="", backpack=20)
+    mod.AUTO_SORT_ENABLED = True
+    calls = []
+    monkeypatch.setattr(mod, "sort_bank_items", lambda method: calls.append(method))
+    mod.resync_bank_index(world.backpack)
+    mod.resync_bank_index(None)
+    assert calls == []
+    mod.resync_bank_index(world.bank)
+    mod.resync_bank_index(world.bank)
+    assert len(calls) == 1
+    mod.on_map_change(None, None, None, None)
+    mod.resync_bank_index(world.bank)
+    assert len(calls) == 2
+
+def test_items_without_serials_are_indexed_by_handle(mod):
+    """Entries with only a Handle are indexed per storage, and forgotten on map change"""
+    world = World(items=50, fixture="", backpack=50, serials=False)
+    storages = ["Bank", "Backpack"]
+    mod.sort_storages("Boividevngu", storages, dry_run=False)
+    assert len(mod.ITEM_INDEX) == 100
+    world.shuffle_bank()
+    mod.sort_storages("Boividevngu", storages, dry_run=False)
+    assert mod.ITEM_INDEX.hits == 100
+    for storage in (world.bank, world.backpack):
+        keys = [(item.Rarity, item.Level) for item in storage.Items]
+        assert keys == sorted(keys, reverse=True)
+    mod.on_map_change(None, None, None, None)
+    assert len(mod.ITEM_INDEX) == 0
+
+def test_item_cache_stores_only_fields_already_read(mod):
+    """Storing a sort's items reads nothing more from the game, and later sorts fill the cache in"""
+    world = World(items=50, fixture="")
+    cache = mod.ITEM_CACHE
+    cache.warm()
+    assert cache.ready.wait(5)
+    mod.sort_bank_items("By Level", dry_run=True)
+    # Only the five items in the logged summary have their names read
+    named = [record for record in mod.ITEM_INDEX.records.values() if record._name_id is not mod.UNREAD]
+    assert len(named) <= 5
+    rows = [cache.entries[item.SerialNumber] for item in world.bank.Items]
+    assert all(row[3] is not None for row in rows)
+    assert sum(row[0] is None for row in rows) == len(rows) - len(named)
+
+    mod.sort_bank_items("By Name", dry_run=True)
+    for item in world.bank.Items:
+        name, _, _, level, _ = cache.entries[item.SerialNumber]
+        assert (name, level) == (item.ItemName, item.Level)
+
+    cache.close()
+    reopened = mod.ItemMetadataCache(mod.ITEM_CACHE_FILE)
+    reopened.warm()
+    assert reopened.ready.wait(5)
+    item = world.bank.Items[0]
+    assert reopened.entries[item.SerialNumber][0] == item.ItemName
+    assert reopened.entries[item.SerialNumber][3] == item.Level
+    reopened.close()
+
+def test_columnar_sort_matches_key_function(mod, monkeypatch):
+    """Long multi-key sorts give the key function's order, and only go columnar with NumPy"""
+    world = World(items=3000, fixture="")
+    records = [mod.get_item_info(item) for item in world.bank.Items]
+    compiled = mod.get_compiled_sort("Boividevngu")
+    compiled.load(records)
+    compiled.refresh()
+    expected = sorted(records, key=compiled.key_func, reverse=compiled.reverse)
+    if mod.numpy is not None:
+        assert compiled.columnar_min_items() == mod.COLUMNAR_SORT_MIN_ITEMS
+        assert compiled.sort_columnar(records) == expected
+    monkeypatch.setattr(mod, "numpy", None)
+    assert compiled.columnar_min_items() is None
+    assert compiled.sort(records) == expected
+
+class StaleEntry(FakeStruct):
+    """A bank entry the game can no longer read"""
+
+    def __getattr__(self, name):
+        if name == "SerialNumber":
+            raise RuntimeError("Tried to access an invalid entry")
+        return super().__getattr__(name)
+
+def test_unreadable_items_stay_after_the_sorted_ones(mod):
+    """An entry that can't be read is kept, in place after the sorted items, and stops auto-sort"""
+    world = World(items=30, fixture="")
+    items = world.bank.Items
+    stale = StaleEntry(FakeStructType("InventoryListEntry"), dict(items[5]._fields))
+    list.__setitem__(items, 5, stale)
+    with pytest.raises(RuntimeError):
+        mod.get_item_info(stale)
+    mod.AUTO_SORT_ENABLED = True
+    mod.sort_bank_items("Boividevngu", dry_run=False)
+    # Slot writes copy the entry, so the stale item is found by its Handle
+    assert items[-1].Handle == 5
+    keys = [(item.Rarity, item.Level) for item in items[:-1]]
+    assert keys == sorted(keys, reverse=True)
+    assert mod.BANK_INDEX is None and mod.BANK_INDEX_FAILED
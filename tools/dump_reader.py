@@ -0,0 +1,125 @@
+"""
+Streaming reader for BankResearch record dumps.
+
+Reads the NDJSON, gzip NDJSON and binary dumps written with the
+"Research Output" option one record at a time, so a filter over a large
+dump never loads the whole file. Needs only the standard library - run it
+outside the game.
+
+Usage:
+    python tools/dump_reader.py bank_structure_dump.ndjson --class OakPlayerController --name serial
+    python tools/dump_reader.py bank_structure_dump.bin --kind attr --type WrappedArray --count
+    python tools/dump_reader.py bank_structure_dump.ndjson.gz --key walker_stats
+
+Every record has a "kind": "object" (a dumped object), "attr" (one of its
+attributes), "link" (a back-link to an object dumped earlier), "member" (the
+PlayerController attribute listing) or "record" (a top-level result, with
+"key" and "value").
+"""
+
+import argparse
+import gzip
+import json
+import struct
+import sys
+from typing import Any, Iterator
+
+# Must match BINARY_DUMP_MAGIC in the mod
+BINARY_DUMP_MAGIC = b"BRDUMP1\n"
+
+def iter_records(path: str) -> Iterator[dict]:
+    """
+    Stream the records of a dump file, in the order they were written.
+
+    The format is taken from the file itself: the binary magic, the gzip
+    header, or else plain NDJSON.
+
+    Args:
+        path: Path to a .ndjson, .ndjson.gz or .bin dump
+
+    Yields:
+        One dict per record
+    """
+    with open(path, 'rb') as f:
+        head = f.read(len(BINARY_DUMP_MAGIC))
+
+    if head == BINARY_DUMP_MAGIC:
+        with open(path, 'rb') as f:
+            f.read(len(BINARY_DUMP_MAGIC))
+            while True:
+                prefix = f.read(4)
+                if len(prefix) < 4:
+                    return
+                (length,) = struct.unpack('<I', prefix)
+                data = f.read(length)
+                if len(data) < length:
+                    # The dump was cut off mid-record (e.g. the game closed)
+                    return
+                yield json.loads(data.decode('utf-8'))
+
+    opener = gzip.open if head[:2] == b"\x1f\x8b" else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+def matches(record: dict, kind: str = None, cls: str = None, name: str = None,
+            type_name: str = None, key: str = None) -> bool:
+    """
+    Check a record against a filter. Unset criteria match everything.
+
+    Args:
+        record: A record from iter_records()
+        kind: Exact record kind
+        cls: Exact class name of the object the record belongs to
+        name: Case-insensitive substring of the object/attribute name
+        type_name: Case-insensitive substring of the value type
+        key: Exact key of a top-level "record"
+
+    Returns:
+        Whether the record matches every given criterion
+    """
+    if kind is not None and record.get("kind") != kind:
+        return False
+    if cls is not None and record.get("class") != cls:
+        return False
+    if name is not None and name.lower() not in str(record.get("name", "")).lower():
+        return False
+    if type_name is not None and type_name.lower() not in str(record.get("type", "")).lower():
+        return False
+    if key is not None and record.get("key") != key:
+        return False
+    return True
+
+def filter_records(path: str, **criteria: Any) -> Iterator[dict]:
+    """
+    Stream only the records matching a filter (see matches() for the criteria).
+
+    Example - all attributes of a class whose name contains "serial":
+        filter_records(path, kind="attr", cls="OakPlayerController", name="serial")
+    """
+    for record in iter_records(path):
+        if matches(record, **criteria):
+            yield record
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="Dump file (.ndjson, .ndjson.gz or .bin)")
+    parser.add_argument("--kind", choices=["object", "attr", "link", "member", "record"], help="Record kind")
+    parser.add_argument("--class", dest="cls", help="Exact class name of the owning object")
+    parser.add_argument("--name", help="Substring of the object/attribute name (case-insensitive)")
+    parser.add_argument("--type", dest="type_name", help="Substring of the value type (case-insensitive)")
+    parser.add_argument("--key", help="Key of a top-level result record")
+    parser.add_argument("--count", action="store_true", help="Only print the number of matches")
+    args = parser.parse_args()
+
+    records = filter_records(args.path, kind=args.kind, cls=args.cls, name=args.name,
+                             type_name=args.type_name, key=args.key)
+    if args.count:
+        print(sum(1 for _ in records))
+        return
+    for record in records:
+        sys.stdout.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+if __name__ == "__main__":
+    main()